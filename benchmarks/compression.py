@@ -0,0 +1,82 @@
+"""Size and read/write throughput of each codec for the raw and cleaned files.
+
+``synth.generate`` writes both raw files of ``--rows`` rows into a temporary
+directory. For every codec (``plain`` and each of ``compression.CODECS``) the
+raw files are compressed, then read back with ``cleaning.read_booking_raw``
+and ``cleaning.read_tripadvisor_raw``, once with decompression in the parsing
+thread and once in a background thread (``--threaded``). Finally the cleaned
+Booking.com frame is written with that codec. MB/s counts uncompressed bytes.
+
+    python benchmarks/compression.py [--rows 1000000] [--codecs gzip xz]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import cleaning, compression, synth  # noqa: E402
+
+FILES = {"booking": "booking_hotel.csv", "tripadvisor": "tripadvisor_room.csv"}
+
+
+def compress(path, codec):
+    out = compression.output_path(path, None if codec == "plain" else codec)
+    if out == path:
+        return path
+    with open(path, "rb") as src, compression._open(out, "wb") as dst:
+        shutil.copyfileobj(src, dst, compression.CHUNK)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--codecs", nargs="+", default=["plain"] + compression.CODECS)
+    args = parser.parse_args()
+
+    readers = {"booking": cleaning.read_booking_raw,
+               "tripadvisor": lambda path, threaded: cleaning.read_tripadvisor_raw(path, threaded=threaded)}
+    with tempfile.TemporaryDirectory() as workdir:
+        raw_dir = os.path.join(workdir, "raw")
+        synth.generate(raw_dir, rows=args.rows)
+        print(f"{'codec':<6} {'file':<12} {'MB':>7} {'ratio':>6} {'compress':>9} "
+              f"{'read':>7} {'MB/s':>6} {'threaded':>9} {'MB/s':>6}")
+        for codec in args.codecs:
+            frame = None
+            for name, filename in FILES.items():
+                plain = os.path.join(raw_dir, filename)
+                size = os.path.getsize(plain) / 1e6
+                start = time.perf_counter()
+                path = compress(plain, codec)
+                packing = time.perf_counter() - start
+                times = []
+                for threaded in (False, True):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        frame_read = readers[name](path, threaded)
+                    times.append(time.perf_counter() - start)
+                if name == "booking":
+                    frame = frame_read
+                print(f"{codec:<6} {name:<12} {os.path.getsize(path) / 1e6:>7.1f} "
+                      f"{size / (os.path.getsize(path) / 1e6):>5.1f}x {packing:>8.2f}s "
+                      f"{times[0]:>6.2f}s {size / times[0]:>6.0f} {times[1]:>8.2f}s {size / times[1]:>6.0f}")
+                if path != plain:
+                    os.remove(path)
+            out = compression.output_path(os.path.join(workdir, "booking_cleaned.csv"),
+                                          None if codec == "plain" else codec)
+            cleaned = cleaning.clean_booking(frame)
+            start = time.perf_counter()
+            cleaned.to_csv(out, index=False)
+            print(f"{codec:<6} {'cleaned':<12} {os.path.getsize(out) / 1e6:>7.1f} "
+                  f"{'':>6} {time.perf_counter() - start:>8.2f}s  (write)")
+            os.remove(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Correlation matrices vs one ``stats.pearson``/``stats.spearman`` call per pair.
+
+The baseline drops the missing rows of each pair and correlates it, as the
+report does for each of its correlations. The cleaned Booking.com frame is
+resampled to ``--rows`` rows; the per-group runs use its locations.
+
+    python benchmarks/correlation.py [--rows 1000000]
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import correlation, data, stats  # noqa: E402
+
+
+def per_pair(frame):
+    out = {}
+    for x, y in itertools.combinations(frame.columns, 2):
+        pair = frame[[x, y]].dropna()
+        out[x, y] = stats.pearson(pair[x], pair[y]), stats.spearman(pair[x], pair[y])
+    return out
+
+
+def per_pair_by_group(frame, keys, min_count):
+    out = {}
+    for group, rows in frame.groupby(keys, sort=True).indices.items():
+        if len(rows) >= min_count:
+            out[group] = per_pair(frame.iloc[rows])
+    return out
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    warnings.simplefilter("ignore", RuntimeWarning)  # the per-pair baseline on empty or constant pairs
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    booking = data.load_booking().sample(args.rows, replace=True, random_state=0, ignore_index=True)
+    frame = correlation.booking_features(booking)
+    print(f"{len(frame):,} rows, {frame.shape[1]} columns, "
+          f"{frame.isna().any(axis=1).mean():.0%} of rows with a missing value")
+
+    engine, result = timed(correlation.matrices, frame)
+    baseline, pairs = timed(per_pair, frame)
+    worst = max(abs(result[m].r.loc[x, y] - pairs[x, y][i][0])
+                for (x, y) in pairs for i, m in enumerate(correlation.METHODS))
+    print(f"whole frame: matrices {engine:.2f} s, per pair {baseline:.2f} s, max |r| difference {worst:.1e}")
+
+    engine, table = timed(correlation.by_group, frame, booking["location"])
+    baseline, groups = timed(per_pair_by_group, frame, booking["location"], correlation.MIN_GROUP_ROWS)
+    got = table.set_index(["location", "x", "y"])
+    # Constant columns (one hotel resampled) give NaN here, a rounding-error r per pair
+    worst = np.nanmax([abs(got.loc[(g, x, y), m] - per[x, y][i][0])
+                       for g, per in groups.items() for (x, y) in per
+                       for i, m in enumerate(correlation.METHODS)])
+    print(f"{len(groups)} locations: by_group {engine:.2f} s, per pair {baseline:.2f} s, "
+          f"max |r| difference {worst:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Tolerant CSV reader vs pandas' C parser on synthetic TripAdvisor files.
+
+``synth.generate`` writes a raw TripAdvisor file of each ``--rows`` size into
+a temporary directory. A ``--malformed`` share of its records is then broken
+in one of three ways, in equal parts:
+
+    quote   the closing quote of the comment is dropped
+    commas  the comment loses its quotes, so its commas split it
+    short   the review count and comment are cut off
+
+Both readers run on the clean and the broken file. The C parser is
+``pd.read_csv(on_bad_lines="skip")``, the current behaviour before this
+reader; "rows" is what each one returned.
+
+    python benchmarks/csv_reader.py [--rows 100000 1000000] [--malformed 0.001]
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import synth, tolerant  # noqa: E402
+
+
+def _quoted(fields):
+    return ",".join('"' + field.replace('"', '""') + '"' for field in fields)
+
+
+def break_records(path, out, share, seed=0):
+    """Copy ``path`` to ``out`` with ``share`` of its records broken; returns the count.
+
+    Only single-line records with a quoted comment that contains a comma are
+    picked, so that every kind of damage shows.
+    """
+    with open(path, encoding="latin1", newline="") as f:
+        header, *records = f.read().split("\r\n")
+    rng = np.random.default_rng(seed)
+    broken = 0
+    for i in rng.permutation(len(records)):
+        if broken >= share * len(records):
+            break
+        record = records[i]
+        if not record.endswith('"') or "\n" in record:
+            continue
+        fields = next(csv.reader([record]))
+        if len(fields) != 4 or "," not in fields[3]:
+            continue
+        kind = broken % 3
+        if kind == 0:
+            records[i] = record[:-1]
+        elif kind == 1:
+            records[i] = f"{_quoted(fields[:3])},{fields[3]}"
+        else:
+            records[i] = _quoted(fields[:2])
+        broken += 1
+    with open(out, "w", encoding="latin1", newline="") as f:
+        f.write("\r\n".join([header, *records]))
+    return broken
+
+
+def c_parser(path):
+    try:
+        return len(pd.read_csv(path, encoding="latin1", on_bad_lines="skip")), ""
+    except pd.errors.ParserError as error:
+        return 0, str(error).splitlines()[-1]
+
+
+def tolerant_reader(path):
+    frame, counts = tolerant.read_csv(path)
+    return len(frame), (f"{counts['quote_repairs']} quotes, {counts['merged_fields']} merged, "
+                        f"{counts['quarantined']} quarantined")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--malformed", type=float, default=0.001, help="share of records to break")
+    args = parser.parse_args()
+
+    print(f"{'rows':>11} {'file':<7} {'reader':<9} {'seconds':>8} {'rows/s':>11} {'rows read':>10}  notes")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as workdir:
+            synth.generate(workdir, rows=1, tripadvisor_rows=rows)
+            clean = os.path.join(workdir, "tripadvisor_room.csv")
+            broken_path = os.path.join(workdir, "broken.csv")
+            broken = break_records(clean, broken_path, args.malformed)
+            for label, path in [("clean", clean), ("broken", broken_path)]:
+                for name, read in [("C", c_parser), ("tolerant", tolerant_reader)]:
+                    start = time.perf_counter()
+                    n, notes = read(path)
+                    seconds = time.perf_counter() - start
+                    if label == "broken" and name == "C":
+                        notes = f"{broken} broken; {notes}" if notes else f"{broken} broken"
+                    print(f"{rows:>11,} {label:<7} {name:<9} {seconds:>8.2f} {rows / seconds:>11,.0f} {n:>10,}  "
+                          f"{notes}")
+
+
+if __name__ == "__main__":
+    main()
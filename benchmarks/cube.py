@@ -0,0 +1,80 @@
+"""Cube roll-up/drill-down queries vs rescanning the rows with pandas.
+
+The cleaned Booking.com frame is tiled ``--scale`` times (prices jittered so
+the copies don't tie). Each query groups by some dimensions, optionally
+filtered on others, and returns count, mean, std and median price and rating.
+
+    python benchmarks/cube.py [--scale 100] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import cube, data  # noqa: E402
+
+# (group-by dimensions, filter)
+QUERIES = [
+    ([], {}),
+    (["location"], {}),
+    (["price_bracket"], {"room_category": ["Suite"]}),
+    (["price_bracket", "room_category"], {}),
+    (["room_category", "bed_type", "review_score"], {}),
+    (["location", "price_bracket"], {"review_bracket": ["500-1k", "1k-5k"]}),
+]
+
+
+def tiled(booking, scale, seed=0):
+    big = pd.concat([booking] * scale, ignore_index=True)
+    rng = np.random.default_rng(seed)
+    big["price_eur"] = (big["price_eur"] * rng.uniform(0.9, 1.1, len(big))).round(2)
+    return big
+
+
+def pandas_query(frame, by, where):
+    for dim, values in where.items():
+        frame = frame[frame[dim].astype(str).isin(values)]
+    measures = {f"{m}_{f}": (m, f) for m in ("price_eur", "rating") for f in ("mean", "std", "median")}
+    if not by:
+        return frame.agg({m: ["size", "mean", "std", "median"] for m in ("price_eur", "rating")})
+    return frame.groupby(by, observed=True).agg(count=("price_eur", "size"), **measures)
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    booking = tiled(data.load_booking(), args.scale)
+    start = time.perf_counter()
+    built = cube.build(booking)
+    build_time = time.perf_counter() - start
+    frame = cube.cube_frame(booking)
+
+    print(f"rows {len(booking):,}, {len(built.cuboids)} cuboids, "
+          f"{len(built.cuboids[tuple(cube.DIMENSIONS)].codes):,} base cells, build {build_time:.2f} s")
+    print(f"{'query':<60} {'cube':>9} {'pandas':>9}")
+    for by, where in QUERIES:
+        cube_time = best_of(lambda: built.query(by=by, where=where), args.repeat)
+        pandas_time = best_of(lambda: pandas_query(frame, by, where), args.repeat)
+        label = f"by {'+'.join(by) or '-'}" + (f" where {where}" if where else "")
+        print(f"{label:<60} {cube_time * 1000:7.1f}ms {pandas_time * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""The gap module vs the ``dropna().copy()`` + pandas groupby way of the charts.
+
+The baseline copies the hotels with a room score, adds the gap column, then
+aggregates it per cohort with ``groupby`` (count, mean, std, quantiles, room
+higher/equal/lower shares) and takes the worst rooms of each location with a
+full sort. The cleaned Booking.com frame is resampled to ``--rows`` rows.
+
+    python benchmarks/gaps.py [--rows 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, features, gaps  # noqa: E402
+
+
+def baseline_cohorts(booking, min_count=features.MIN_LOCATION_HOTELS):
+    has_both = booking.dropna(subset=["room_score"]).copy()
+    has_both["gap"] = has_both["room_score"] - has_both["rating"]
+    labels = {"location": has_both["location"], "room_category": features.room_category(has_both),
+              "price_bracket": features.price_bracket(has_both)}
+    tables = []
+    for dimension in gaps.DIMENSIONS:
+        grouped = has_both["gap"].groupby(labels[dimension], observed=True)
+        table = pd.DataFrame({"hotels": grouped.size(), "mean_gap": grouped.mean(), "std_gap": grouped.std()})
+        for column, q in gaps.QUANTILES.items():
+            table[column] = grouped.quantile(q)
+        for column, sign in (("room_higher_pct", 1), ("room_equal_pct", 0), ("room_lower_pct", -1)):
+            table[column] = (np.sign(has_both["gap"]) == sign).groupby(labels[dimension], observed=True).mean() * 100
+        tables.append(table[table["hotels"] >= min_count].rename_axis("cohort").reset_index().assign(
+            dimension=dimension))
+    return pd.concat(tables, ignore_index=True)
+
+
+def baseline_worst(booking, n):
+    has_both = booking.dropna(subset=["room_score"]).copy()
+    has_both["gap"] = has_both["room_score"] - has_both["rating"]
+    return has_both.sort_values("gap", kind="stable").groupby("location").head(n)
+
+
+def measured(fn, *args, **kwargs):
+    """Seconds of one run, peak traced MB of a second (tracing slows it down) and the result."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--worst", type=int, default=3)
+    args = parser.parse_args()
+
+    booking = data.load_booking().sample(args.rows, replace=True, random_state=0, ignore_index=True)
+    print(f"{len(booking):,} rows, {booking['room_score'].notna().mean():.0%} with a room score")
+
+    engine, engine_peak, table = measured(gaps.cohorts, booking)
+    baseline, baseline_peak, expected = measured(baseline_cohorts, booking)
+    key = ["dimension", "cohort"]
+    got = table.astype({"cohort": str}).set_index(key).sort_index()
+    expected = expected.astype({"cohort": str}).set_index(key).sort_index()[got.columns]
+    print(f"cohorts: gaps {engine:.2f} s ({engine_peak / 1e6:.0f} MB peak), "
+          f"groupby {baseline:.2f} s ({baseline_peak / 1e6:.0f} MB peak), "
+          f"{len(got)} cohorts, max difference {np.nanmax(np.abs(got.to_numpy() - expected.to_numpy())):.1e}")
+
+    engine, engine_peak, worst = measured(gaps.worst, booking, by="location", n=args.worst)
+    baseline, baseline_peak, expected = measured(baseline_worst, booking, args.worst)
+    same = sorted(worst.index) == sorted(expected.index)
+    print(f"worst {args.worst} per location: gaps {engine:.2f} s ({engine_peak / 1e6:.0f} MB peak), "
+          f"sort + head {baseline:.2f} s ({baseline_peak / 1e6:.0f} MB peak), same rows: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Price-history store vs one CSV per scrape.
+
+Simulates ``--days`` daily scrapes of the cleaned Booking.com frame (each day
+95% of the hotels are listed and 10% of prices move by a few percent), writes
+them both to a ``PriceHistory`` and to one CSV per day, then times the two
+report queries on each.
+
+    python benchmarks/history.py [--days 120] [--window 30]
+"""
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, history  # noqa: E402
+
+START = datetime.date(2026, 1, 1)
+
+
+def scrapes(booking, days, seed=0):
+    rng = np.random.default_rng(seed)
+    current = booking.drop_duplicates(history.KEY_COLUMNS).reset_index(drop=True)
+    for i in range(days):
+        moved = rng.random(len(current)) < 0.1
+        current.loc[moved, "price_eur"] = (current.loc[moved, "price_eur"]
+                                           * rng.normal(1, 0.08, moved.sum())).round(2).clip(5, 10000)
+        yield START + datetime.timedelta(days=i), current[rng.random(len(current)) < 0.95]
+
+
+def csv_window(csv_dir, dates):
+    return pd.concat([pd.read_csv(os.path.join(csv_dir, f"{d}.csv")) for d in dates], ignore_index=True)
+
+
+def dir_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--window", type=int, default=30)
+    args = parser.parse_args()
+
+    booking = data.load_booking()
+    with tempfile.TemporaryDirectory() as tmp:
+        store_dir, csv_dir = os.path.join(tmp, "store"), os.path.join(tmp, "csv")
+        os.makedirs(csv_dir)
+        store = history.PriceHistory(store_dir)
+        append_time = 0.0
+        for date, scrape in scrapes(booking, args.days):
+            start = time.perf_counter()
+            store.append(scrape, date)
+            append_time += time.perf_counter() - start
+            scrape.to_csv(os.path.join(csv_dir, f"{date}.csv"), index=False)
+
+        print(f"{args.days} scrapes of ~{len(booking) * 0.95:,.0f} hotels, {args.window}-day window")
+        print(f"on disk      store {dir_size(store_dir) / 1e6:6.2f} MB   one CSV per day "
+              f"{dir_size(csv_dir) / 1e6:6.2f} MB")
+        print(f"append       {append_time / args.days * 1000:.1f} ms per scrape")
+
+        dates = store.dates()
+        window = [d for d in dates if d > dates[-1] - datetime.timedelta(days=args.window)]
+
+        store = history.PriceHistory(store_dir)
+        start = time.perf_counter()
+        store.median_price_by_location(args.window)
+        store_median = time.perf_counter() - start
+        median_reads = len(store.partitions_read)
+        start = time.perf_counter()
+        csv_window(csv_dir, window).groupby("location")["price_eur"].median()
+        csv_median = time.perf_counter() - start
+        print(f"median/location  store {store_median:.3f} s ({median_reads} partitions)   "
+              f"CSV {csv_median:.3f} s ({len(window)} files)")
+
+        store = history.PriceHistory(store_dir)
+        start = time.perf_counter()
+        store.price_movers(args.window)
+        store_movers = time.perf_counter() - start
+        movers_reads = len(store.partitions_read)
+        start = time.perf_counter()
+        first, last = (pd.read_csv(os.path.join(csv_dir, f"{d}.csv")) for d in (window[0], window[-1]))
+        both = first.merge(last, on=history.KEY_COLUMNS)
+        both[(both["price_eur_y"] / both["price_eur_x"] > 1.2) & (both["rating_x"] == both["rating_y"])]
+        csv_movers = time.perf_counter() - start
+        print(f"price movers     store {store_movers:.3f} s ({movers_reads} partitions)   "
+              f"CSV {csv_movers:.3f} s (2 files)")
+
+
+if __name__ == "__main__":
+    main()
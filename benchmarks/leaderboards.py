@@ -0,0 +1,62 @@
+"""One-pass leaderboards vs repeated groupby + nlargest/nsmallest.
+
+The cleaned Booking.com frame is tiled ``--scale`` times (prices jittered so
+the copies don't tie) to get a larger input.
+
+    python benchmarks/leaderboards.py [--scale 100] [--k 10]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, leaderboards  # noqa: E402
+
+
+def tiled(booking, scale, seed=0):
+    big = pd.concat([booking] * scale, ignore_index=True)
+    rng = np.random.default_rng(seed)
+    big["price_eur"] = (big["price_eur"] * rng.uniform(0.9, 1.1, len(big))).round(2)
+    return big
+
+
+def groupby_boards(hotels, k):
+    out = []
+    for columns in leaderboards.GROUPINGS.values():
+        for column, descending in leaderboards.BOARDS.values():
+            scored = hotels.dropna(subset=[column])
+            groups = scored.groupby(columns, observed=True)[column] if columns else scored[column]
+            out.append(groups.nlargest(k) if descending else groups.nsmallest(k))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    booking = tiled(data.load_booking(), args.scale)
+    hotels = leaderboards.cohorts(booking)
+
+    start = time.perf_counter()
+    table = leaderboards.build(booking, k=args.k)
+    one_pass = time.perf_counter() - start
+
+    start = time.perf_counter()
+    groupby_boards(hotels, args.k)
+    groupby = time.perf_counter() - start
+
+    print(f"rows {len(booking):,}, {len(leaderboards.GROUPINGS)} groupings x "
+          f"{len(leaderboards.BOARDS)} boards, {len(table):,} leaderboard rows")
+    print(f"one-pass build (incl. scoring)  {one_pass:.2f} s")
+    print(f"groupby + nlargest/nsmallest    {groupby:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
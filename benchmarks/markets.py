@@ -0,0 +1,52 @@
+"""Wall time of the per-market fan-out/fan-in for a range of worker counts.
+
+Runs ``markets.run`` on the cleaned CSVs (the repository's, or those in
+``--cleaned-dir``) once per ``--workers`` value, writing into a temporary
+directory, and prints the speedup over the first value. The markets are the
+same in every run, so the comparison tables must match; the benchmark checks
+that they do.
+
+    python benchmarks/markets.py [--workers 1 2 4 8] [--cleaned-dir DIR] [--no-charts]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, markets, paths  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--cleaned-dir", default=paths.CLEANED_DIR)
+    parser.add_argument("--min-hotels", type=int, default=markets.MIN_HOTELS)
+    parser.add_argument("--no-charts", action="store_true")
+    args = parser.parse_args()
+
+    booking = data.load_booking(os.path.join(args.cleaned_dir, "booking_cleaned.csv"))
+    tripadvisor = data.load_tripadvisor(os.path.join(args.cleaned_dir, "tripadvisor_cleaned.csv"))
+    print(f"{len(booking):,} Booking.com and {len(tripadvisor):,} TripAdvisor rows, {os.cpu_count()} cores")
+    print(f"{'workers':>7} {'markets':>7} {'seconds':>8} {'speedup':>8}")
+    first = reference = None
+    for workers in sorted(set(args.workers)):
+        with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            comparison, _ = markets.run(booking, tripadvisor, out_dir, min_hotels=args.min_hotels,
+                                        workers=workers, charts=not args.no_charts)
+            seconds = time.perf_counter() - start
+        tables = comparison.drop(columns="seconds")
+        if reference is None:
+            first, reference = seconds, tables
+        elif not tables.equals(reference):
+            raise SystemExit(f"comparison with {workers} workers differs from the first run")
+        print(f"{workers:>7} {len(comparison):>7} {seconds:>8.2f} {first / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
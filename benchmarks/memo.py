@@ -0,0 +1,63 @@
+"""Report statistics with a cold, a warm and no statistics cache.
+
+Runs the report's correlations (price-rating Pearson and Spearman, reviews-
+rating and price-words Spearman) and the price-rating fit on the cleaned data
+resampled to ``--rows`` rows: once with the cache disabled, once into an empty
+cache file and once more reading it back. Also times the fingerprint alone.
+
+    python benchmarks/memo.py [--rows 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, features, memo, stats  # noqa: E402
+
+
+def report_stats(booking, comments):
+    return (stats.price_rating_correlation(booking), stats.reviews_rating_correlation(booking),
+            stats.price_words_correlation(comments), features.fit_price_rating(booking)[0])
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    booking = data.load_booking().sample(args.rows, replace=True, random_state=0, ignore_index=True)
+    comments = features.comments(data.load_tripadvisor().sample(args.rows, replace=True, random_state=0,
+                                                                ignore_index=True))
+    print(f"{len(booking):,} Booking.com rows, {len(comments):,} TripAdvisor comments")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memo.disable()
+        off, expected = timed(report_stats, booking, comments)
+        memo.enable(os.path.join(tmp, "stats.sqlite"))
+        cold, _ = timed(report_stats, booking, comments)
+        warm, result = timed(report_stats, booking, comments)
+        same = all(np.allclose(a, b, rtol=0, atol=0) for a, b in zip(result, expected)
+                   if isinstance(a, np.ndarray)) and result[:3] == expected[:3]
+        rates = memo.hit_rates()
+        memo.clear()
+
+    price = booking["price_eur"].to_numpy(dtype=float)
+    hashing, _ = timed(memo.fingerprint, price)
+    print(f"no cache {off:.3f} s, cold cache {cold:.3f} s, warm cache {warm:.3f} s, identical results: {same}")
+    print(f"fingerprint of one {price.nbytes / 1e6:.0f} MB column: {hashing * 1000:.1f} ms")
+    print(rates.to_string(float_format="{:.0%}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Wall time, peak RSS and rows/s of every pipeline stage on synthetic data.
+
+For each ``--rows`` size, ``synth.generate`` writes both raw files (that many
+rows each) into a temporary directory. Each stage then runs in its own process
+so that its peak RSS can be reported:
+
+    clean      scripts/data_cleaning.py   raw CSVs -> cleaned CSVs
+    analysis   scripts/analysis.py        overview charts 01-06
+    deep       scripts/deep_analysis.py   the text report
+    findings   scripts/findings_charts.py the six finding charts
+
+rows/s counts the raw rows for ``clean`` and the cleaned rows otherwise. With
+``--record FILE`` each result is appended to a CSV, and the time is compared
+with the last recorded run of the same stage and size.
+
+    python benchmarks/pipeline.py [--rows 10000 100000 1000000] [--stages clean deep]
+                                  [--record benchmarks/pipeline.csv]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+STAGES = ["clean", "analysis", "deep", "findings"]
+
+
+def child(stage, workdir):
+    from hotel_analysis import charts, cleaning, data, findings, report
+
+    raw_dir = os.path.join(workdir, "raw")
+    cleaned_dir = os.path.join(workdir, "cleaned")
+    charts_dir = os.path.join(workdir, "charts")
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if stage == "clean":
+            cleaning.run(raw_dir=raw_dir, cleaned_dir=cleaned_dir)
+            rows = 0
+        else:
+            booking = data.load_booking(os.path.join(cleaned_dir, "booking_cleaned.csv"))
+            tripadvisor = data.load_tripadvisor(os.path.join(cleaned_dir, "tripadvisor_cleaned.csv"))
+            rows = len(booking) + len(tripadvisor)
+            if stage == "analysis":
+                charts.render_all(booking, tripadvisor, charts_dir)
+                charts.print_summary(booking, tripadvisor)
+            elif stage == "deep":
+                report.print_report(booking, tripadvisor)
+            else:
+                findings.render_all(booking, tripadvisor, out_dir=charts_dir)
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.3f} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} {rows}")
+
+
+def run(stage, workdir):
+    out = subprocess.run([sys.executable, __file__, "--child", stage, workdir],
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), float(out[1]), int(out[2])
+
+
+def previous(record, rows, stage):
+    if not record or not os.path.exists(record):
+        return None
+    history = pd.read_csv(record)
+    match = history[(history["rows"] == rows) & (history["stage"] == stage)]
+    return match["seconds"].iloc[-1] if len(match) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--record", help="CSV to append the results to")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    from hotel_analysis import synth
+
+    results = []
+    print(f"{'rows':>11} {'stage':<9} {'seconds':>9} {'peak RSS':>10} {'rows/s':>11} {'vs last':>8}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as workdir:
+            synth.generate(os.path.join(workdir, "raw"), rows=rows)
+            if "clean" not in args.stages:
+                run("clean", workdir)
+            for stage in [s for s in STAGES if s in args.stages]:
+                seconds, rss, stage_rows = run(stage, workdir)
+                stage_rows = stage_rows or 2 * rows
+                last = previous(args.record, rows, stage)
+                change = f"{seconds / last - 1:+.0%}" if last else ""
+                print(f"{rows:>11,} {stage:<9} {seconds:>9.2f} {rss:>7.0f} MB {stage_rows / seconds:>11,.0f} "
+                      f"{change:>8}")
+                results.append({"date": datetime.datetime.now().isoformat(timespec="seconds"), "rows": rows,
+                                "stage": stage, "seconds": round(seconds, 3), "peak_rss_mb": rss,
+                                "rows_per_s": round(stage_rows / seconds)})
+
+    if args.record:
+        pd.DataFrame(results).to_csv(args.record, mode="a", header=not os.path.exists(args.record), index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Load test for the query service: p50/p99 latency and throughput.
+
+By default an in-process server is started on a free port; pass ``--url`` to
+hit an already running ``python -m hotel_analysis query-server`` instead.
+Each client thread keeps one HTTP/1.1 connection open and draws queries from a
+fixed pool, so ``--distinct`` controls how often the LRU cache can answer.
+
+    python benchmarks/query_load.py [--requests 20000] [--concurrency 8] [--distinct 500]
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, query  # noqa: E402
+
+
+def query_pool(locations, size, seed=0):
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(size):
+        if rng.random() < 0.1:
+            pool.append("/locations?" + urlencode({"order": rng.choice(["best", "worst"]),
+                                                   "k": rng.choice([5, 10, 20])}))
+            continue
+        params = {"sort": rng.choice(list(query.SORTS)), "k": rng.choice([5, 10, 20])}
+        if rng.random() < 0.8:
+            params["location"] = rng.choice(locations)
+        if rng.random() < 0.6:
+            params["max_price"] = rng.choice([100, 200, 500, 1000, 3000])
+        if rng.random() < 0.6:
+            params["min_reviews"] = rng.choice([10, 50, 200])
+        pool.append("/hotels?" + urlencode(params))
+    return pool
+
+
+def client(host, port, paths, latencies, errors):
+    conn = http.client.HTTPConnection(host, port)
+    for path in paths:
+        start = time.perf_counter()
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            errors.append(path)
+    conn.close()
+
+
+def percentile(sorted_values, pct):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="base URL of a running service")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--distinct", type=int, default=500, help="size of the query pool")
+    args = parser.parse_args()
+
+    booking = data.load_booking()
+    server = None
+    if args.url:
+        url = urlparse(args.url)
+        host, port = url.hostname, url.port
+    else:
+        server = query.make_server(booking, port=0)
+        host, port = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    locations = sorted(booking["location"].dropna().str.split(",").str[-1].str.strip().unique())
+    pool = query_pool(locations, args.distinct)
+    rng = random.Random(1)
+    per_client = args.requests // args.concurrency
+    latencies, errors = [], []
+    threads = [
+        threading.Thread(target=client, args=(host, port, rng.choices(pool, k=per_client), latencies, errors))
+        for _ in range(args.concurrency)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"requests     {len(latencies)}  ({len(errors)} errors), concurrency {args.concurrency}, "
+          f"{args.distinct} distinct queries")
+    print(f"throughput   {len(latencies) / elapsed:,.0f} req/s")
+    print(f"latency p50  {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"latency p99  {percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"latency mean {statistics.mean(latencies) * 1000:.2f} ms")
+
+    conn = http.client.HTTPConnection(host, port)
+    conn.request("GET", "/stats")
+    print("cache        " + json.dumps(json.loads(conn.getresponse().read())["cache"]))
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Pickled frame vs shared-memory frame for process-pool tasks.
+
+The cleaned Booking.com frame is resampled to ``--rows`` rows. Each of
+``--tasks`` tasks draws a bootstrap sample of ``price_eur`` and ``rating`` and
+returns the median price and mean rating, in a pool of each ``--workers`` size:
+
+    pickle   the whole frame is submitted with every task
+    shared   the frame is put in shared memory once (``shared.SharedFrame``)
+             and every task submits its handle only
+
+"sent" is the pickled size of one task's arguments, "PSS" the proportional
+set size summed over the workers after their tasks (shared pages count once
+in total, not once per worker).
+
+    python benchmarks/shared_frame.py [--rows 1000000] [--workers 1 2 4 8] [--tasks 32]
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import data, shared  # noqa: E402
+
+
+def _pss_mb():
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def _bootstrap(price, rating, seed):
+    rows = np.random.default_rng(seed).integers(0, len(price), len(price))
+    return np.nanmedian(price[rows]), np.nanmean(rating[rows])
+
+
+def pickled_task(frame, seed):
+    result = _bootstrap(frame["price_eur"].to_numpy(), frame["rating"].to_numpy(), seed)
+    return result, os.getpid(), _pss_mb()
+
+
+def shared_task(handle, seed):
+    frame = shared.SharedFrame.attach(handle)
+    result = _bootstrap(frame.column("price_eur"), frame.column("rating"), seed)
+    return result, os.getpid(), _pss_mb()
+
+
+def run(mode, booking, workers, tasks):
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if mode == "pickle":
+            args = [(booking, seed) for seed in range(tasks)]
+            results = list(pool.map(pickled_task, *zip(*args)))
+        else:
+            with shared.SharedFrame.create(booking) as owner:
+                args = [(owner.handle, seed) for seed in range(tasks)]
+                results = list(pool.map(shared_task, *zip(*args)))
+    seconds = time.perf_counter() - start
+    pss = {}
+    for _, pid, mb in results:
+        pss[pid] = max(pss.get(pid, 0), mb)
+    return seconds, len(pickle.dumps(args[0])), sum(pss.values()), [r for r, _, _ in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tasks", type=int, default=32)
+    args = parser.parse_args()
+
+    booking = data.load_booking()
+    booking = booking.sample(args.rows, replace=True, random_state=0, ignore_index=True)
+    print(f"{args.rows:,} rows, {booking.memory_usage(deep=True).sum() / 1e6:,.0f} MB in memory, "
+          f"{args.tasks} tasks, {os.cpu_count()} cores")
+    print(f"{'workers':>7} {'mode':<7} {'seconds':>8} {'sent':>10} {'PSS MB':>8}")
+    for workers in args.workers:
+        reference = None
+        for mode in ("pickle", "shared"):
+            seconds, sent, pss, results = run(mode, booking, workers, args.tasks)
+            if reference is None:
+                reference = results
+            elif results != reference:
+                raise SystemExit(f"{mode} results differ with {workers} workers")
+            print(f"{workers:>7} {mode:<7} {seconds:>8.2f} {sent / 1e3:>8,.1f}kB {pss:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
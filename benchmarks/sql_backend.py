@@ -0,0 +1,88 @@
+"""Deep-analysis report with pandas in memory vs SQL over an on-disk SQLite file.
+
+The cleaned CSVs are tiled ``--scales`` times (prices jittered so copies don't
+tie) into a temporary directory. Each path runs in its own process so that its
+peak RSS can be reported:
+
+    pandas     read both CSVs and print the report
+    sql-load   stream the CSVs into SQLite in chunks and build the indexes
+    sql        print the report from the database
+
+    python benchmarks/sql_backend.py [--scales 1 10 100]
+"""
+import argparse
+import contextlib
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hotel_analysis import paths  # noqa: E402
+
+
+def write_tiled(csv, out, scale, seed=0):
+    frame = pd.read_csv(csv)
+    big = pd.concat([frame] * scale, ignore_index=True)
+    rng = np.random.default_rng(seed)
+    big["price_eur"] = (big["price_eur"] * rng.uniform(0.9, 1.1, len(big))).round(2)
+    big.to_csv(out, index=False)
+    return len(big)
+
+
+def child(mode, workdir):
+    from hotel_analysis import data, report, sqlbackend
+
+    booking_csv = os.path.join(workdir, "booking.csv")
+    tripadvisor_csv = os.path.join(workdir, "tripadvisor.csv")
+    db_path = os.path.join(workdir, "hotels.sqlite")
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == "pandas":
+            report.print_report(data.load_booking(booking_csv), data.load_tripadvisor(tripadvisor_csv))
+        elif mode == "sql-load":
+            sqlbackend.load(db_path, booking_csv, tripadvisor_csv)
+        else:
+            db = sqlbackend.Database(db_path)
+            report.print_sections(db)
+            db.close()
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.3f} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}")
+
+
+def run(mode, workdir):
+    out = subprocess.run([sys.executable, __file__, "--child", mode, workdir],
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), float(out[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    print(f"{'rows':>10} {'pandas':>16} {'sql-load':>16} {'sql report':>16}")
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as workdir:
+            rows = write_tiled(paths.BOOKING_CLEANED, os.path.join(workdir, "booking.csv"), scale)
+            write_tiled(paths.TRIPADVISOR_CLEANED, os.path.join(workdir, "tripadvisor.csv"), scale)
+            cells = []
+            for mode in ("pandas", "sql-load", "sql"):
+                seconds, rss = run(mode, workdir)
+                cells.append(f"{seconds:6.2f} s {rss:5.0f} MB")
+            print(f"{rows:>10,} " + " ".join(f"{c:>16}" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
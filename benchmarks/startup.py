@@ -0,0 +1,66 @@
+"""Startup / import-time benchmark for the CLI.
+
+Runs each command in a fresh interpreter a few times and reports the best and
+median wall time, plus the cumulative import time of the heavy libraries as
+measured by ``python -X importtime``.
+
+    python benchmarks/startup.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = [
+    ("import hotel_analysis", [sys.executable, "-c", "import hotel_analysis"]),
+    ("cli --help", [sys.executable, "-m", "hotel_analysis", "--help"]),
+    ("cli stats --section correlation", [sys.executable, "-m", "hotel_analysis", "stats",
+                                         "--section", "correlation"]),
+    ("cli stats", [sys.executable, "-m", "hotel_analysis", "stats"]),
+]
+HEAVY = ("pandas", "numpy", "scipy", "scipy.stats", "scipy.special", "matplotlib", "matplotlib.pyplot")
+
+
+def wall_times(cmd, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def heavy_imports(cmd):
+    """Cumulative import time (ms) of each heavy top-level module the command loads."""
+    proc = subprocess.run([cmd[0], "-X", "importtime"] + cmd[1:], cwd=ROOT,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    loaded = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name in HEAVY:
+            loaded[name] = int(cumulative) / 1000
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'command':<34} {'best':>8} {'median':>8}  heavy imports (cumulative ms)")
+    for label, cmd in COMMANDS:
+        times = wall_times(cmd, args.repeat)
+        loaded = heavy_imports(cmd)
+        heavy = ", ".join(f"{k} {v:.0f}" for k, v in loaded.items()) or "-"
+        print(f"{label:<34} {min(times):>7.3f}s {statistics.median(times):>7.3f}s  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
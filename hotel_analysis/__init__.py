@@ -0,0 +1,19 @@
+"""Hotel value analysis of the Booking.com and TripAdvisor scrapes.
+
+Importing the package is cheap: pandas, scipy and matplotlib are only loaded
+by the submodules that need them, and the names below resolve on first use.
+"""
+import importlib
+
+_LAZY = {
+    "load_cleaned": "data",
+    "clean_booking": "cleaning",
+    "clean_tripadvisor": "cleaning",
+    "print_report": "report",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
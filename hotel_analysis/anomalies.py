@@ -0,0 +1,214 @@
+"""Streaming anomaly scores for suspicious prices, ratings and review labels.
+
+Three checks, each a z-score against running per-group statistics:
+
+    price    log price within the location x room category (else the
+             location, the room category, all rows): a EUR 9,000 standard room
+    rating   rating within the location, for hotels with fewer than
+             ``features.MIN_REVIEWS`` reviews: a 10.0 from three reviews
+    label    rating within its review_score label: a "Superb" rated 6.1
+
+The groups keep a count, mean and sum of squared deviations (Welford's M2).
+A chunk's statistics are merged into them with Chan's parallel update, so a
+load is one pass over its rows and the state never needs the rows again.
+Every row is scored right after its chunk is merged, against all other rows
+seen so far: its own value is taken back out of its group's statistics, so an
+extreme row cannot hide in a small group it inflates itself. A group is used
+once it has ``MIN_GROUP`` other values and some spread.
+
+``anomaly_score`` is the largest absolute z of the three, and
+``anomaly_reason`` names the check behind it. Scores above ``THRESHOLD``, the
+same cut as the price-outlier flag, are flagged.
+
+The state is saved to ``STATE_CSV``, with the digest of every file loaded so
+far in ``LOADS_CSV``. The next scrape is scored against everything before it
+without rescanning history, and loading the same file twice is refused.
+Input files are cleaned Booking.com CSVs (``cleaning.run`` output); a raw
+scrape is refused, as it has no ``price_eur``:
+
+    top, scored, flagged = run(paths.BOOKING_CLEANED)                # first load
+    top, scored, flagged = run("data/cleaned/next_scrape.csv")       # scored against both
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import compression, features, outliers, paths
+
+STATE_CSV = os.path.join(paths.TABLES_DIR, "anomaly_state.csv")
+LOADS_CSV = os.path.join(paths.TABLES_DIR, "anomaly_loads.csv")
+SCORES_CSV = os.path.join(paths.TABLES_DIR, "anomalies.csv")
+
+# check -> grouping levels, finest first ([] = all rows)
+CHECKS = {
+    "price": [["location", "room_category"], ["location"], ["room_category"], []],
+    "rating": [["location"], []],
+    "label": [["review_score"]],
+}
+MIN_GROUP = outliers.MIN_GROUP
+THRESHOLD = outliers.THRESHOLD
+CHUNKSIZE = 100_000
+TOP = 20
+
+REPORT_COLUMNS = ["hotel_name", "location", "room_type", "price_eur", "rating", "num_reviews", "review_score"]
+SCORE_COLUMNS = ["hotel_name", "location", "price_z", "rating_z", "label_z", "anomaly_score", "anomaly_reason"]
+
+
+def _values(frame, check):
+    if check == "price":
+        return np.log(frame["price_eur"].to_numpy(dtype=float))
+    return frame["rating"].to_numpy(dtype=float)
+
+
+def _keys(frame, level):
+    """Group key of every row at one level: the values joined with " | "."""
+    if not level:
+        return pd.Series("(all)", index=frame.index)
+    keys = frame[level[0]].astype(str)
+    for column in level[1:]:
+        keys = keys + " | " + frame[column].astype(str)
+    return keys
+
+
+class RunningStats:
+    """Count, mean and M2 (sum of squared deviations) per group key."""
+
+    def __init__(self, table=None):
+        self.table = table if table is not None else pd.DataFrame(
+            {"n": pd.Series(dtype=float), "mean": pd.Series(dtype=float), "m2": pd.Series(dtype=float)})
+
+    def update(self, keys, values):
+        ok = ~np.isnan(values)
+        groups = pd.Series(values[ok], index=keys.to_numpy()[ok]).groupby(level=0)
+        b = pd.DataFrame({"n": groups.size().astype(float), "mean": groups.mean()})
+        b["m2"] = groups.var(ddof=0) * b["n"]
+        index = self.table.index.union(b.index)
+        a = self.table.reindex(index, fill_value=0.0)
+        b = b.reindex(index, fill_value=0.0)
+        n = a["n"] + b["n"]
+        delta = b["mean"] - a["mean"]
+        self.table = pd.DataFrame({
+            "n": n,
+            "mean": a["mean"] + delta * b["n"] / n,
+            "m2": a["m2"] + b["m2"] + delta ** 2 * a["n"] * b["n"] / n,
+        })
+
+    def z(self, keys, values):
+        """z-score of every (already merged) value against the rest of its group, and
+        whether that rest is usable."""
+        stats = self.table.reindex(keys.to_numpy())
+        n, mean, m2 = (stats[c].to_numpy() for c in ("n", "mean", "m2"))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Chan's update run backwards: the group without the value itself
+            rest = n - 1
+            rest_mean = mean + (mean - values) / rest
+            rest_m2 = np.maximum(m2 - (values - mean) ** 2 * n / rest, 0)
+            std = np.sqrt(rest_m2 / (rest - 1))
+            z = (values - rest_mean) / std
+        return z, (rest >= MIN_GROUP) & (std > 0)
+
+
+class AnomalyScorer:
+    """Running statistics of every check and level, updated and scored chunk by chunk."""
+
+    def __init__(self, stats=None):
+        self.stats = stats or {(check, i): RunningStats() for check, levels in CHECKS.items()
+                               for i in range(len(levels))}
+
+    def score(self, chunk):
+        """Merge ``chunk`` into the statistics, then score each row against the others."""
+        frame = chunk.assign(room_category=features.room_category(chunk))
+        scores = {}
+        for check, levels in CHECKS.items():
+            values = _values(frame, check)
+            keys = [_keys(frame, level) for level in levels]
+            for i, level_keys in enumerate(keys):
+                self.stats[check, i].update(level_keys, values)
+            z = np.full(len(frame), np.nan)
+            done = np.zeros(len(frame), dtype=bool)
+            for i, level_keys in enumerate(keys):
+                level_z, usable = self.stats[check, i].z(level_keys, values)
+                usable &= ~done
+                z[usable] = level_z[usable]
+                done |= usable
+            scores[f"{check}_z"] = z
+
+        # Only a rating resting on few reviews is suspicious
+        reviews = frame["num_reviews"].to_numpy(dtype=float)
+        scores["rating_z"][reviews >= features.MIN_REVIEWS] = np.nan
+
+        z = np.abs(np.column_stack(list(scores.values())))
+        has_score = ~np.isnan(z).all(axis=1)
+        out = chunk[REPORT_COLUMNS].copy()
+        for name, values in scores.items():
+            out[name] = np.round(values, 3)
+        out["anomaly_score"] = np.where(has_score, np.nanmax(np.where(has_score[:, None], z, 0), axis=1), np.nan)
+        reasons = np.array(list(CHECKS), dtype=object)
+        out["anomaly_reason"] = np.where(has_score, reasons[np.nanargmax(np.nan_to_num(z, nan=-1), axis=1)], None)
+        return out
+
+    def save(self, path=STATE_CSV):
+        tables = [stats.table.assign(check=check, level=i).rename_axis("key").reset_index()
+                  for (check, i), stats in self.stats.items()]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pd.concat(tables, ignore_index=True)[["check", "level", "key", "n", "mean", "m2"]].to_csv(path, index=False)
+
+    @classmethod
+    def load(cls, path=STATE_CSV):
+        """The saved scorer, or a fresh one if nothing is saved."""
+        scorer = cls()
+        if os.path.exists(path):
+            saved = pd.read_csv(path, dtype={"key": str}, keep_default_na=False)
+            for (check, i), table in saved.groupby(["check", "level"]):
+                scorer.stats[check, i] = RunningStats(table.set_index("key")[["n", "mean", "m2"]].astype(float))
+        return scorer
+
+
+def loads(path=LOADS_CSV):
+    """The files loaded so far: path, digest and rows."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["path", "digest", "rows"])
+    return pd.read_csv(path)
+
+
+def run(path, chunksize=CHUNKSIZE, top=TOP, state_path=STATE_CSV, loads_path=LOADS_CSV,
+        scores_path=SCORES_CSV):
+    """Score the rows of the CSV at ``path`` on top of the saved state.
+
+    Writes every row's ``SCORE_COLUMNS`` to ``scores_path`` (in file order)
+    and returns the ``top`` highest scores, the number of rows scored and the
+    number flagged.
+    """
+    path = compression.resolve(path)
+    try:
+        header = pd.read_csv(path, nrows=0).columns
+    except UnicodeDecodeError:
+        header = []
+    missing = [c for c in REPORT_COLUMNS if c not in header]
+    if missing:
+        raise ValueError(f"{path} is not a cleaned Booking.com CSV (no {', '.join(missing)}); "
+                         "clean raw scrapes first")
+    digest = compression.file_digest(path)
+    done = loads(loads_path)
+    if digest in set(done["digest"]):
+        raise ValueError(f"{path} was already scored; its rows are in the running statistics "
+                         "(reset the state to start over)")
+
+    scorer = AnomalyScorer.load(state_path)
+    os.makedirs(os.path.dirname(scores_path), exist_ok=True)
+    best, rows, flagged = None, 0, 0
+    with pd.read_csv(path, chunksize=chunksize) as chunks:
+        for chunk in chunks:
+            scored = scorer.score(chunk)
+            scored[SCORE_COLUMNS].to_csv(scores_path, mode="w" if rows == 0 else "a", header=rows == 0,
+                                         index=False)
+            rows += len(scored)
+            flagged += int((scored["anomaly_score"] > THRESHOLD).sum())
+            best = scored if best is None else pd.concat([best, scored])
+            best = best.nlargest(top, "anomaly_score")
+
+    scorer.save(state_path)
+    done = pd.concat([done, pd.DataFrame({"path": [path], "digest": [digest], "rows": [rows]})], ignore_index=True)
+    done.to_csv(loads_path, index=False)
+    return best.reset_index(drop=True), rows, flagged
@@ -0,0 +1,224 @@
+"""Overview charts 01-07 (01-06 formerly scripts/analysis.py)."""
+import os
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import numpy as np
+import pandas as pd
+
+from . import clusters, features, instrument, paths
+from .style import ACCENT, BLUE, EDGE, RED, SUBTLE, WHITE, YELLOW, apply_theme, save
+
+CLUSTER_COLORS = [ACCENT, BLUE, YELLOW, RED, WHITE, SUBTLE]
+
+
+def price_distribution(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    ax.hist(booking["price_eur"], bins=60, range=(0, 2000), alpha=0.7,
+            color=ACCENT, label=f"Booking.com (n={len(booking)})", edgecolor="none")
+    ax.hist(tripadvisor["price_eur"], bins=60, range=(0, 2000), alpha=0.7,
+            color=RED, label=f"TripAdvisor (n={len(tripadvisor)})", edgecolor="none")
+
+    ax.axvline(booking["price_eur"].median(), color=ACCENT, linestyle="--", linewidth=1.5,
+               label=f"Booking median: EUR {booking['price_eur'].median():.0f}")
+    ax.axvline(tripadvisor["price_eur"].median(), color=RED, linestyle="--", linewidth=1.5,
+               label=f"TripAdvisor median: EUR {tripadvisor['price_eur'].median():.0f}")
+
+    ax.set_title("Price Distribution: Booking.com vs TripAdvisor")
+    ax.set_xlabel("Price per Night (EUR)")
+    ax.set_ylabel("Number of Hotels")
+    ax.legend(facecolor="#132039", edgecolor=EDGE, fontsize=10)
+    ax.set_xlim(0, 2000)
+    return save(fig, out_dir, "01_price_distribution.png")
+
+
+def rating_vs_price(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    scatter = ax.scatter(
+        booking["price_eur"], booking["rating"],
+        c=booking["room_score"], cmap="RdYlGn", alpha=0.5, s=20,
+        edgecolors="none", vmin=5, vmax=10
+    )
+
+    cbar = plt.colorbar(scatter, ax=ax, pad=0.02)
+    cbar.set_label("Room Score", color=SUBTLE)
+    cbar.ax.yaxis.set_tick_params(color=SUBTLE)
+    plt.setp(plt.getp(cbar.ax.axes, "yticklabels"), color=SUBTLE)
+
+    ax.set_title("Does Higher Price Mean Better Rating?")
+    ax.set_xlabel("Price per Night (EUR)")
+    ax.set_ylabel("Overall Rating")
+    ax.set_xlim(0, 3000)
+    ax.set_ylim(1, 10.5)
+    return save(fig, out_dir, "02_rating_vs_price.png")
+
+
+def top_locations_price(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    loc_stats = features.location_stats(booking).sort_values("median_price", ascending=True)
+    top20 = loc_stats.tail(20)
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    bars = ax.barh(top20["location"], top20["median_price"], color=ACCENT, alpha=0.8, height=0.7)
+
+    for bar, rating in zip(bars, top20["mean_rating"]):
+        ax.text(bar.get_width() + 15, bar.get_y() + bar.get_height()/2,
+                f"Rating: {rating:.1f}", va="center", fontsize=9, color=SUBTLE)
+
+    ax.set_title("Top 20 Most Expensive Locations (min. 10 hotels)")
+    ax.set_xlabel("Median Price per Night (EUR)")
+    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"EUR {x:,.0f}"))
+    return save(fig, out_dir, "03_top_locations_price.png")
+
+
+def review_categories(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    score_stats = (
+        booking[booking["review_score"].isin(features.SCORE_ORDER)]
+        .groupby("review_score")
+        .agg(
+            median_price=("price_eur", "median"),
+            mean_rating=("rating", "mean"),
+            count=("hotel_name", "count")
+        )
+        .reindex(features.SCORE_ORDER)
+        .dropna()
+        .reset_index()
+    )
+
+    fig, ax1 = plt.subplots(figsize=(12, 6))
+
+    x = range(len(score_stats))
+    bars = ax1.bar(x, score_stats["median_price"], color=ACCENT, alpha=0.8, width=0.5)
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(score_stats["review_score"], rotation=30, ha="right")
+    ax1.set_ylabel("Median Price (EUR)", color=ACCENT)
+    ax1.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"EUR {v:,.0f}"))
+
+    ax2 = ax1.twinx()
+    ax2.plot(x, score_stats["mean_rating"], color=RED, marker="o", linewidth=2, markersize=8)
+    ax2.set_ylabel("Mean Rating", color=RED)
+    ax2.spines["right"].set_color(RED)
+
+    # Count labels on bars
+    for bar, count in zip(bars, score_stats["count"]):
+        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 10,
+                 f"n={count}", ha="center", fontsize=9, color=SUBTLE)
+
+    ax1.set_title("Price & Rating by Review Category")
+    return save(fig, out_dir, "04_review_categories.png")
+
+
+def room_category_stats(booking, min_count=20):
+    room_stats = (
+        booking.groupby(features.room_category(booking))
+        .agg(
+            median_price=("price_eur", "median"),
+            mean_rating=("rating", "mean"),
+            mean_room_score=("room_score", "mean"),
+            count=("hotel_name", "count")
+        )
+        .reset_index()
+        .sort_values("median_price", ascending=True)
+    )
+    return room_stats[room_stats["count"] >= min_count]
+
+
+def room_type_analysis(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    room_stats = room_category_stats(booking)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(room_stats)))
+    bars = ax.barh(room_stats["room_category"], room_stats["median_price"],
+                   color=colors, alpha=0.85, height=0.6)
+
+    for bar, rs, count in zip(bars, room_stats["mean_room_score"], room_stats["count"]):
+        label = f"Room score: {rs:.1f}  (n={count})" if not pd.isna(rs) else f"(n={count})"
+        ax.text(bar.get_width() + 10, bar.get_y() + bar.get_height()/2,
+                label, va="center", fontsize=9, color=SUBTLE)
+
+    ax.set_title("Median Price by Room Category")
+    ax.set_xlabel("Median Price per Night (EUR)")
+    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"EUR {v:,.0f}"))
+    return save(fig, out_dir, "05_room_type_analysis.png")
+
+
+def best_value_hotels(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    # Value = rating / price_eur * 100, top 15 with min 50 reviews
+    top_value = features.top_value_hotels(booking)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    labels = [f"{name}\n({loc})" for name, loc in zip(top_value["hotel_name"], top_value["location"])]
+    bars = ax.barh(range(len(top_value)), top_value["value_score"], color=ACCENT, alpha=0.8, height=0.6)
+    ax.set_yticks(range(len(top_value)))
+    ax.set_yticklabels(labels, fontsize=9)
+
+    for bar, price, rating in zip(bars, top_value["price_eur"], top_value["rating"]):
+        ax.text(bar.get_width() + 0.3, bar.get_y() + bar.get_height()/2,
+                f"EUR {price:.0f} | Rating {rating}", va="center", fontsize=9, color=SUBTLE)
+
+    ax.set_title("Top 15 Best Value Hotels (Rating / Price, min. 50 reviews)")
+    ax.set_xlabel("Value Score (higher = better deal)")
+    return save(fig, out_dir, "06_best_value_hotels.png")
+
+
+def location_clusters(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    # Saved labels (python -m hotel_analysis clusters) while the cleaned data is unchanged
+    locs = clusters.location_clusters(booking)
+    locs = locs[locs["hotels"] >= features.MIN_LOCATION_HOTELS]
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    for cluster, group in locs.groupby("cluster"):
+        ax.scatter(group["median_price"], group["mean_rating"], s=group["hotels"] * 6,
+                   color=CLUSTER_COLORS[cluster % len(CLUSTER_COLORS)], alpha=0.75, edgecolors="none",
+                   label=f"Cluster {cluster}: EUR {group['median_price'].median():,.0f}, "
+                         f"rating {group['mean_rating'].mean():.1f} (n={len(group)})")
+
+    ax.set_xscale("log")
+    ax.xaxis.set_major_locator(mticker.LogLocator(subs=(1, 2, 5)))
+    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"EUR {v:,.0f}"))
+    ax.xaxis.set_minor_formatter(mticker.NullFormatter())
+    ax.set_title("Destination Clusters by Price/Quality Profile")
+    ax.set_xlabel("Median Price per Night (EUR, log scale)")
+    ax.set_ylabel("Mean Rating")
+    ax.legend(facecolor="#132039", edgecolor=EDGE, fontsize=9, markerscale=0.5)
+    return save(fig, out_dir, "07_location_clusters.png")
+
+
+CHARTS = {
+    "price-distribution": (price_distribution, "Price distribution"),
+    "rating-vs-price": (rating_vs_price, "Rating vs Price"),
+    "top-locations": (top_locations_price, "Top locations"),
+    "review-categories": (review_categories, "Review categories"),
+    "room-types": (room_type_analysis, "Room type analysis"),
+    "best-value": (best_value_hotels, "Best value hotels"),
+    "location-clusters": (location_clusters, "Location clusters"),
+}
+
+
+def print_summary(booking, tripadvisor):
+    print("\n" + "="*50)
+    print("SUMMARY")
+    print("="*50)
+    print(f"Booking hotels analyzed: {len(booking)}")
+    print(f"TripAdvisor hotels analyzed: {len(tripadvisor)}")
+    print(f"\nBooking - Median price: EUR {booking['price_eur'].median():.0f}")
+    print(f"Booking - Mean rating: {booking['rating'].mean():.1f}")
+    print(f"TripAdvisor - Median price: EUR {tripadvisor['price_eur'].median():.0f}")
+    print(f"\nLocations with 10+ hotels: {len(features.location_stats(booking))}")
+    print(f"Room categories (20+ hotels): {len(room_category_stats(booking))}")
+
+
+def render_all(booking, tripadvisor, out_dir=paths.CHARTS_DIR, names=None):
+    apply_theme()
+    os.makedirs(out_dir, exist_ok=True)
+    names = names or list(CHARTS)
+    for i, name in enumerate(names, 1):
+        chart, label = CHARTS[name]
+        with instrument.span(f"chart.{name}"):
+            chart(booking, tripadvisor, out_dir)
+        print(f"{i}/{len(names)} {label} saved")
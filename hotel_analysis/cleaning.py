@@ -0,0 +1,185 @@
+"""Cleaning of the raw Booking.com and TripAdvisor scrapes.
+
+Prices are parsed with ``currency.parse_prices`` and converted with the rates
+in ``data/rates.csv`` in effect on the cleaning date. ``price_bdt`` stays the
+Taka price (converted when a row is quoted in another currency), ``currency``
+records the quoted currency. The cleaned frames count the rows dropped per
+reason in ``.attrs["dropped"]`` (no amount, no rate for the currency, ...).
+
+Raw files may be compressed (``booking_hotel.csv.gz``, ``.xz``, ``.bz2``,
+``.zst``; see ``compression``) and are then streamed without a copy on disk.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import compression, currency, instrument, outliers, paths, tolerant
+
+MIN_PRICE_EUR = 5
+MAX_PRICE_EUR = 10000
+
+BOOKING_COLUMNS = [
+    "hotel_name", "location", "rating", "review_score",
+    "num_reviews", "room_score", "room_type", "bed_type", "price_bdt"
+]
+TRIPADVISOR_COLUMNS = ["hotel_name", "price_bdt", "num_reviews", "comment"]
+
+
+@instrument.timed("clean.read_booking_raw")
+def read_booking_raw(path=paths.BOOKING_RAW, threaded=False):
+    """Raw Booking.com rows; ``threaded`` decompresses in a background thread."""
+    with compression.open_binary(compression.resolve(path), threaded) as f:
+        return pd.read_csv(f, encoding="latin1")
+
+
+@instrument.timed("clean.read_tripadvisor_raw")
+def read_tripadvisor_raw(path=paths.TRIPADVISOR_RAW, quarantine=None, threaded=False):
+    """Raw TripAdvisor rows, malformed comments repaired; the counters are in ``.attrs["read_counts"]``."""
+    return tolerant.read_csv(compression.resolve(path), encoding="latin1", quarantine=quarantine,
+                             threaded=threaded)[0]
+
+
+def _clean_num_reviews(col):
+    col = col.astype(str).str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(col, errors="coerce").astype("Int64")
+
+
+def _convert_prices(df, date=None):
+    """Parse ``price_bdt`` and add ``currency`` and ``price_eur`` (NaN without an amount or a rate).
+
+    Returns the number of rows without an amount and, per currency, without a rate.
+    """
+    parsed = currency.parse_prices(df["price_bdt"])
+    rates = currency.rate_table()
+    per_eur = rates.per_eur(parsed["currency"], date)
+    bdt_per_eur = rates.per_eur(["BDT"], date)[0]
+    df["price_bdt"] = parsed["amount"].where(parsed["currency"] == "BDT", parsed["amount"] / per_eur * bdt_per_eur)
+    df["currency"] = parsed["currency"]
+    df["price_eur"] = (parsed["amount"] / per_eur).round(2)
+    no_rate = parsed.loc[parsed["amount"].notna() & np.isnan(per_eur), "currency"].value_counts()
+    return {"without an amount": int(parsed["amount"].isna().sum()),
+            **{f"without a {code} rate": int(n) for code, n in no_rate.items()}}
+
+
+def _describe_drops(dropped):
+    return ", ".join(f"{n} {reason}" for reason, n in dropped.items() if n) or "none"
+
+
+def _in_price_window(df):
+    return (df["price_eur"] >= MIN_PRICE_EUR) & (df["price_eur"] <= MAX_PRICE_EUR)
+
+
+@instrument.timed("clean.booking")
+def clean_booking(booking_raw, date=None):
+    booking = booking_raw.copy()
+    booking.columns = BOOKING_COLUMNS
+
+    with instrument.span("clean.booking.price"):
+        dropped = _convert_prices(booking, date)
+
+    with instrument.span("clean.booking.numbers"):
+        booking["rating"] = pd.to_numeric(booking["rating"], errors="coerce")
+        booking["num_reviews"] = _clean_num_reviews(booking["num_reviews"])
+
+    with instrument.span("clean.booking.strip"):
+        for col in ["hotel_name", "location", "review_score", "room_type", "bed_type"]:
+            booking[col] = booking[col].str.strip()
+
+    booking["source"] = "Booking.com"
+
+    # Filter outliers and NAs
+    with instrument.span("clean.booking.filter"):
+        priced = booking.dropna(subset=["price_eur"])
+        dropped["without a rating"] = int(priced["rating"].isna().sum())
+        booking = priced.dropna(subset=["rating"])
+        in_window = _in_price_window(booking)
+        dropped[f"outside EUR {MIN_PRICE_EUR}-{MAX_PRICE_EUR}"] = int((~in_window).sum())
+        booking = booking[in_window].copy()
+
+    # Flag (not drop) prices that are extreme for their location and room category
+    with instrument.span("clean.booking.outliers"):
+        booking["price_outlier"] = outliers.price_outliers(booking)
+    booking.attrs["dropped"] = dropped
+    return booking
+
+
+@instrument.timed("clean.tripadvisor")
+def clean_tripadvisor(tripadvisor_raw, date=None):
+    tripadvisor = tripadvisor_raw.copy()
+    tripadvisor.columns = TRIPADVISOR_COLUMNS
+
+    # Remove numbering prefix (e.g. "1. Hotel Name" -> "Hotel Name")
+    with instrument.span("clean.tripadvisor.names"):
+        tripadvisor["hotel_name"] = (
+            tripadvisor["hotel_name"]
+            .str.replace(r"^\d+\.\s*", "", regex=True)
+            .str.strip()
+        )
+
+    # "View all 7 deals from \xa036,215" is 36215 BDT, a bare "View all deals" no price
+    with instrument.span("clean.tripadvisor.price"):
+        dropped = _convert_prices(tripadvisor, date)
+
+    with instrument.span("clean.tripadvisor.numbers"):
+        tripadvisor["num_reviews"] = _clean_num_reviews(tripadvisor["num_reviews"])
+    with instrument.span("clean.tripadvisor.strip"):
+        tripadvisor["comment"] = tripadvisor["comment"].str.strip()
+    tripadvisor["source"] = "TripAdvisor"
+
+    with instrument.span("clean.tripadvisor.filter"):
+        tripadvisor = tripadvisor.dropna(subset=["price_eur"])
+        in_window = _in_price_window(tripadvisor)
+        dropped[f"outside EUR {MIN_PRICE_EUR}-{MAX_PRICE_EUR}"] = int((~in_window).sum())
+        tripadvisor = tripadvisor[in_window]
+    tripadvisor.attrs["dropped"] = dropped
+    return tripadvisor
+
+
+def run(raw_dir=paths.RAW_DIR, cleaned_dir=paths.CLEANED_DIR, date=None, compress=None, threaded=False):
+    """Clean both raw files, print a summary and write the cleaned CSVs.
+
+    ``date`` picks the exchange rates (default: today). ``compress`` names a
+    codec for the cleaned files (``"gzip"``: ``booking_cleaned.csv.gz``);
+    ``threaded`` decompresses the raw files in a background thread.
+    """
+    booking = clean_booking(read_booking_raw(os.path.join(raw_dir, "booking_hotel.csv"), threaded), date)
+
+    print("=== BOOKING CLEANED ===")
+    print(f"Rows: {len(booking)}")
+    print(f"Rating range: {booking['rating'].min()} - {booking['rating'].max()}")
+    print(f"Price EUR range: {booking['price_eur'].min()} - {booking['price_eur'].max()}")
+    print(f"NA room_score: {booking['room_score'].isna().sum()}")
+    print(f"Flagged price outliers: {booking['price_outlier'].sum()}")
+    print(f"Currencies: {booking['currency'].value_counts().to_dict()}; "
+          f"dropped: {_describe_drops(booking.attrs['dropped'])}")
+    print()
+
+    quarantine = os.path.join(cleaned_dir, "tripadvisor_quarantine.csv")
+    tripadvisor_raw = read_tripadvisor_raw(os.path.join(raw_dir, "tripadvisor_room.csv"), quarantine, threaded)
+    counts = tripadvisor_raw.attrs["read_counts"]
+    tripadvisor = clean_tripadvisor(tripadvisor_raw, date)
+
+    print("=== TRIPADVISOR CLEANED ===")
+    print(f"Rows: {len(tripadvisor)}")
+    print(f"Raw rows repaired: {counts['quote_repairs']} unbalanced quotes, "
+          f"{counts['merged_fields']} split comments; quarantined: {counts['quarantined']}"
+          + (f" (see {quarantine})" if counts["quarantined"] else ""))
+    print(f"Price EUR range: {tripadvisor['price_eur'].min()} - {tripadvisor['price_eur'].max()}")
+    print(f"Empty comments: {(tripadvisor['comment'].isna() | (tripadvisor['comment'] == '')).sum()}")
+    print(f"Currencies: {tripadvisor['currency'].value_counts().to_dict()}; "
+          f"dropped: {_describe_drops(tripadvisor.attrs['dropped'])}")
+    print()
+
+    os.makedirs(cleaned_dir, exist_ok=True)
+    outputs = [(frame, compression.output_path(os.path.join(cleaned_dir, name), compress))
+               for frame, name in ((booking, "booking_cleaned.csv"), (tripadvisor, "tripadvisor_cleaned.csv"))]
+    with instrument.span("clean.write"):
+        for frame, path in outputs:
+            frame.to_csv(path, index=False)
+            compression.replace_variants(path)
+
+    print("=== FILES SAVED ===")
+    for frame, path in outputs:
+        print(f"- {os.path.basename(path)} ({len(frame)} rows)")
+    return booking, tripadvisor
@@ -0,0 +1,571 @@
+"""Command line entry point: ``python -m hotel_analysis <command>``.
+
+Only argparse is imported up front; each command imports the modules it needs,
+so ``--help`` starts instantly and ``stats`` never loads matplotlib.
+"""
+import argparse
+import datetime
+import os
+
+# Mirrors report.SECTIONS, listed here so that --help does not import pandas
+REPORT_SECTIONS = ["correlation", "labels", "room-gap", "locations", "residuals",
+                   "bed-types", "popularity", "comments", "findings"]
+
+
+def hierarchy_levels():
+    """Levels of locations.LEVELS offered on the command line; region needs data/regions.csv."""
+    from . import paths
+
+    levels = ["neighbourhood", "town", "region"]
+    return levels if os.path.exists(paths.REGIONS) else levels[:-1]
+
+
+def load_frames(args):
+    """Cleaned (booking, tripadvisor) frames, compacted with ``--compact``; with
+    ``--sample``, the self-weighting part of the saved stratified samples. With
+    ``--exclude-outliers`` the flagged Booking.com prices are left out."""
+    if getattr(args, "sample", False):
+        from . import sampling
+
+        booking, tripadvisor = (sampling.self_weighting(frame) for frame in sampling.load_sample())
+    elif args.compact:
+        from . import compact
+
+        booking, tripadvisor = compact.load_compact()
+    else:
+        from . import data
+
+        booking, tripadvisor = data.load_cleaned()
+    if getattr(args, "exclude_outliers", False):
+        from . import outliers
+
+        booking = outliers.without_outliers(booking)
+    return booking, tripadvisor
+
+
+def cmd_clean(args):
+    from . import cleaning
+
+    cleaning.run(raw_dir=args.raw_dir, cleaned_dir=args.cleaned_dir, compress=args.compress,
+                 threaded=args.read_thread)
+
+
+def cmd_stats(args):
+    from . import report
+
+    if args.backend == "sql":
+        from . import sqlbackend
+
+        if args.exclude_outliers:
+            raise SystemExit("error: --exclude-outliers needs --backend pandas")
+        db = sqlbackend.Database(args.db)
+        report.print_sections(db, sections=args.section)
+        db.close()
+        return
+    if args.sample:
+        from . import sampling
+
+        booking, tripadvisor = sampling.load_sample()
+        if args.exclude_outliers:
+            from . import outliers
+
+            booking = outliers.without_outliers(booking)
+        sampling.print_estimates(booking, tripadvisor)
+        return
+    report.print_report(*load_frames(args), sections=args.section)
+
+
+def cmd_sql_load(args):
+    from . import sqlbackend
+
+    rows = sqlbackend.load(args.db, chunksize=args.chunksize)
+    print(f"{rows['booking']} booking and {rows['tripadvisor']} tripadvisor rows loaded into {args.db}")
+
+
+def cmd_charts(args):
+    from . import charts
+
+    booking, tripadvisor = load_frames(args)
+    charts.render_all(booking, tripadvisor, args.out_dir, names=args.only)
+    charts.print_summary(booking, tripadvisor)
+    print("\nAll charts saved as PNG files.")
+
+
+def cmd_findings(args):
+    from . import findings
+
+    findings.render_all(*load_frames(args), out_dir=args.out_dir, names=args.only)
+    print("\nAll finding charts saved!")
+
+
+def cmd_presentation(args):
+    from . import presentation
+
+    presentation.build(*load_frames(args), path=args.output or presentation.PRESENTATION_PDF)
+
+
+def cmd_markets(args):
+    from . import markets
+
+    try:
+        comparison, brackets = markets.run(*load_frames(args), out_dir=args.out_dir, level=args.level,
+                                           min_hotels=args.min_hotels, workers=args.workers,
+                                           charts=not args.no_charts, only=args.only)
+    except ValueError as exc:
+        raise SystemExit(f"error: {exc}")
+    columns = ["market", "hotels", "tripadvisor_rows", "median_price", "mean_rating", "value_index",
+               "spearman_price_rating", "room_higher_pct"]
+    print("\nMARKETS BY VALUE:")
+    print(comparison[columns].to_string(index=False, float_format="{:.2f}".format))
+    print("\nMean rating by price bracket:")
+    print(brackets.to_string(float_format="{:.2f}".format))
+    print(f"\nPer-market reports and charts saved under {args.out_dir}")
+
+
+def cmd_all(args):
+    from . import charts, cleaning, findings, presentation, report
+
+    booking, tripadvisor = cleaning.run()
+    report.print_report(booking, tripadvisor)
+    charts.render_all(booking, tripadvisor)
+    findings.render_all(booking, tripadvisor)
+    presentation.build(booking, tripadvisor)
+
+
+def cmd_anomalies(args):
+    from . import anomalies, paths
+
+    if args.reset:
+        for path in (anomalies.STATE_CSV, anomalies.LOADS_CSV):
+            if os.path.exists(path):
+                os.remove(path)
+    try:
+        top, rows, flagged = anomalies.run(args.input or paths.BOOKING_CLEANED, chunksize=args.chunksize,
+                                           top=args.top)
+    except ValueError as exc:
+        raise SystemExit(f"error: {exc}")
+    done = anomalies.loads()
+    print(f"{rows:,} rows scored against {int(done['rows'].sum()):,} rows from {len(done)} loads, "
+          f"{flagged:,} above {anomalies.THRESHOLD}; scores saved to {anomalies.SCORES_CSV}")
+    print(f"\nTOP {args.top} ANOMALIES:")
+    columns = ["hotel_name", "location", "price_eur", "rating", "num_reviews", "review_score",
+               "anomaly_score", "anomaly_reason"]
+    print(top[columns].to_string(index=False, float_format="{:.2f}".format))
+
+
+def cmd_clusters(args):
+    from . import clusters, features, paths
+
+    path = args.input or paths.BOOKING_CLEANED
+    locations, location_centers, hotel_centers = clusters.run(
+        clusters.chunked(path, args.chunksize), k=args.k, hotels=args.hotels, source=path,
+        batch_size=args.batch_size, epochs=args.epochs, seed=args.seed)
+    print(f"{len(locations)} locations in {args.k} clusters (centers fitted on locations with "
+          f"{features.MIN_LOCATION_HOTELS}+ hotels), saved to {clusters.LOCATION_CLUSTERS_CSV}")
+    print(location_centers.to_string(index=False, float_format="{:.2f}".format))
+    if hotel_centers is not None:
+        print(f"\n{int(hotel_centers['size'].sum()):,} hotels in {args.k} clusters, "
+              f"saved to {clusters.HOTEL_CLUSTERS_CSV}")
+        print(hotel_centers.to_string(index=False, float_format="{:.2f}".format))
+
+
+def cmd_correlations(args):
+    from . import correlation, features
+
+    booking, tripadvisor = load_frames(args)
+    frame = correlation.booking_features(booking)
+    if args.by:
+        keys = {"price_bracket": features.price_bracket, "room_category": features.room_category}
+        by = keys[args.by](booking) if args.by in keys else booking[args.by]
+        table = correlation.by_group(frame, by, min_count=args.min_count)
+        print(table.to_string(index=False, float_format="{:.4g}".format))
+        return
+    for name, features_frame in (("Booking.com", frame),
+                                 ("TripAdvisor comments", correlation.comment_features(tripadvisor))):
+        for method, matrix in correlation.matrices(features_frame).items():
+            print(f"\n{name}, {method} r (pairwise-complete rows):")
+            print(matrix.r.to_string(float_format="{:.3f}".format))
+            print(f"\n{name}, {method} p-value:")
+            print(matrix.p.to_string(float_format="{:.1e}".format))
+
+
+def cmd_dashboard(args):
+    from . import dashboard
+
+    booking, _ = load_frames(args)
+    path = dashboard.write(dashboard.build(booking, max_locations=args.max_locations), args.output)
+    print(f"dashboard saved to {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+
+def cmd_gaps(args):
+    from . import gaps
+
+    booking, _ = load_frames(args)
+    if args.worst:
+        table = gaps.worst(booking, by=args.by, n=args.worst, min_count=args.min_count)
+        columns = ["hotel_name", "location", "room_type", "rating", "room_score", "gap", "price_eur"]
+        if args.by and args.by not in columns:
+            columns.insert(0, args.by)
+        print(table[columns].to_string(index=False, float_format="{:.2f}".format))
+        return
+    table = gaps.cohorts(booking, dimensions=[args.by] if args.by else gaps.DIMENSIONS, min_count=args.min_count)
+    print(table.to_string(index=False, float_format="{:.2f}".format))
+
+
+def cmd_stats_cache(args):
+    from . import memo
+
+    if args.clear:
+        memo.clear()
+        print(f"removed {memo.CACHE_PATH}")
+        return
+    entries, size, rates = memo.cache_stats()
+    print(f"{entries:,} cached results (at most {memo.MAX_ENTRIES:,}), {size / 1e6:.2f} MB in {memo.CACHE_PATH}")
+    if len(rates):
+        print(rates.to_string(float_format="{:.0%}".format))
+
+
+def cmd_worker(args):
+    from . import worker
+
+    worker.serve(args.socket, interval=args.interval, render_on_change=not args.no_render,
+                 out_dir=args.out_dir)
+
+
+def cmd_ask(args):
+    import json
+
+    from . import worker
+
+    payload = {"cmd": args.kind}
+    if args.name:
+        payload["name"] = args.name
+    response = worker.request(payload, args.socket)
+    if not response.pop("ok"):
+        raise SystemExit(response["error"])
+    if "text" in response:
+        print(response["text"], end="")
+    else:
+        print(json.dumps(response, indent=2))
+
+
+def cmd_query_server(args):
+    from . import query
+
+    query.serve(args.host, args.port)
+
+
+def cmd_leaderboards(args):
+    from . import leaderboards
+
+    if args.show:
+        board, grouping, group = args.show
+        table = leaderboards.load()
+        print(leaderboards.lookup(table, board, grouping, group).to_string(index=False))
+        return
+    from . import data
+
+    table = leaderboards.build(data.load_booking(), k=args.k)
+    path = leaderboards.save(table)
+    print(f"{len(table)} leaderboard rows saved to {path}")
+
+
+def cmd_cube(args):
+    from . import cube
+
+    if args.by is None and not args.where:
+        from . import data
+
+        built = cube.build(data.load_booking(), materialize=args.materialize)
+        path = built.save()
+        print(f"{len(built.cuboids)} cuboids saved to {path}")
+        return
+    where = {}
+    for clause in args.where:
+        dim, _, value = clause.partition("=")
+        where.setdefault(dim, []).append(value)
+    print(cube.load().query(by=args.by or [], where=where).to_string(index=False))
+
+
+def cmd_locations(args):
+    from . import data, locations
+
+    columns = [args.level, "parent", "median_price", "mean_rating", "value_index", "count"]
+    table = locations.location_stats(data.load_booking(), args.level, args.min_count)[columns]
+    print(f"{len(table)} {args.level}s with at least {args.min_count} hotels")
+    print(f"\nBEST VALUE {args.level}s:")
+    print(table.nlargest(args.top, "value_index").to_string(index=False))
+    print(f"\nWORST VALUE {args.level}s:")
+    print(table.nsmallest(args.top, "value_index").to_string(index=False))
+
+
+def cmd_history(args):
+    from . import history
+
+    store = history.PriceHistory(args.root)
+    if args.action == "append":
+        from . import data
+
+        try:
+            path = store.append(data.load_booking(), args.date or datetime.date.today())
+        except ValueError as exc:
+            raise SystemExit(f"error: {exc}")
+        print(f"scrape saved to {path} ({len(store.dates())} dates stored)")
+        return
+    if args.action == "median":
+        table = store.median_price_by_location(args.days, args.date)
+    else:
+        table = store.price_movers(args.days, args.date, min_rise=args.min_rise).head(args.top)
+    print(table.to_string(index=False))
+    print(f"\n{len(set(store.partitions_read))} of {len(store.dates())} partitions read")
+
+
+def cmd_memory(args):
+    from . import compact, data
+
+    for name, before in zip(("booking", "tripadvisor"), data.load_cleaned()):
+        print(f"\n{name}:")
+        print(compact.memory_report(before, compact.compact(before)).to_string(float_format="{:.1f}".format))
+
+
+def cmd_sample(args):
+    from . import sampling
+
+    for name, frame in zip(("booking", "tripadvisor"),
+                           sampling.draw(args.per_stratum, args.chunksize, args.seed)):
+        print(f"{name}: {len(frame)} rows from {frame['stratum'].nunique()} strata "
+              f"(of {frame['weight'].sum():.0f})")
+
+
+def cmd_synth(args):
+    from . import synth
+
+    for path in synth.generate(args.out_dir, rows=args.rows, tripadvisor_rows=args.tripadvisor_rows,
+                               seed=args.seed):
+        print(f"{path} ({os.path.getsize(path) / 1e6:,.1f} MB)")
+
+
+def build_parser():
+    from . import paths
+
+    parser = argparse.ArgumentParser(prog="hotel_analysis", description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", metavar="FILE",
+                        help="time every stage, print a summary and write a Chrome trace to FILE")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="with --trace: also record peak Python memory per stage (slower)")
+    parser.add_argument("--no-stats-cache", action="store_true",
+                        help="recompute correlations and fits instead of reading output/cache/stats.sqlite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("clean", help="clean the raw CSVs into data/cleaned/")
+    p.add_argument("--raw-dir", default=paths.RAW_DIR)
+    p.add_argument("--cleaned-dir", default=paths.CLEANED_DIR)
+    p.add_argument("--compress", choices=["gzip", "zstd", "xz", "bz2"],
+                   help="write the cleaned CSVs compressed (raw .gz/.zst/.xz/.bz2 files are read as they are)")
+    p.add_argument("--read-thread", action="store_true",
+                   help="decompress the raw files in a background thread while parsing")
+    p.set_defaults(func=cmd_clean)
+
+    db_path = os.path.join(paths.ROOT, "output", "hotels.sqlite")
+    compact_help = "load the frames with categorical strings and downcast numbers"
+    sample_help = "run on the saved stratified sample (see the sample command)"
+    outliers_help = "leave out Booking.com prices flagged as outliers for their location and room category"
+
+    p = sub.add_parser("stats", help="print the deep-analysis report (no plotting)")
+    p.add_argument("--section", action="append", choices=REPORT_SECTIONS,
+                   help="only print this section (repeatable)")
+    p.add_argument("--backend", choices=["pandas", "sql"], default="pandas",
+                   help="compute with pandas in memory or with SQL over the sql-load database")
+    p.add_argument("--db", default=db_path)
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--sample", action="store_true",
+                   help="print the bracket and location tables estimated from the saved "
+                        "stratified sample, with standard errors")
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("sql-load", help="load the cleaned CSVs into an on-disk SQLite database")
+    p.add_argument("--db", default=db_path)
+    p.add_argument("--chunksize", type=int, default=100_000, help="CSV rows read per chunk")
+    p.set_defaults(func=cmd_sql_load)
+
+    p = sub.add_parser("charts", help="render the overview charts 01-07")
+    p.add_argument("--only", action="append", help="chart name (repeatable)")
+    p.add_argument("--out-dir", default=paths.CHARTS_DIR)
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--sample", action="store_true", help=sample_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_charts)
+
+    p = sub.add_parser("findings", help="render the six finding charts")
+    p.add_argument("--only", action="append", help="finding chart name (repeatable)")
+    p.add_argument("--out-dir", default=paths.CHARTS_DIR)
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--sample", action="store_true", help=sample_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_findings)
+
+    p = sub.add_parser("presentation", help="build the PDF slide deck")
+    p.add_argument("--output", help="PDF path (default: output/presentation/hotel_presentation.pdf)")
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_presentation)
+
+    p = sub.add_parser("markets", help="run the report and charts per market in parallel, then compare")
+    p.add_argument("--level", choices=hierarchy_levels()[1:], default="town", help="what counts as a market")
+    p.add_argument("--min-hotels", type=int, default=20, help="smallest market, in Booking.com rows")
+    p.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    p.add_argument("--only", action="append", help="market name or directory name (repeatable)")
+    p.add_argument("--no-charts", action="store_true", help="only write the reports and comparison tables")
+    p.add_argument("--out-dir", default=os.path.join(paths.ROOT, "output", "markets"))
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_markets)
+
+    p = sub.add_parser("anomalies", help="score suspicious prices and ratings against running statistics")
+    p.add_argument("--input", help="cleaned Booking.com CSV to score (default: data/cleaned/booking_cleaned.csv); "
+                                   "each new scrape is scored on top of the earlier ones")
+    p.add_argument("--reset", action="store_true", help="forget the running statistics first")
+    p.add_argument("--top", type=int, default=20)
+    p.add_argument("--chunksize", type=int, default=100_000, help="CSV rows read per chunk")
+    p.set_defaults(func=cmd_anomalies)
+
+    p = sub.add_parser("clusters", help="cluster locations (and hotels) by price/quality profile")
+    p.add_argument("--k", type=int, default=6, help="number of clusters")
+    p.add_argument("--hotels", action="store_true", help="also cluster every hotel (streamed)")
+    p.add_argument("--input", help="cleaned Booking.com CSV (default: data/cleaned/booking_cleaned.csv)")
+    p.add_argument("--chunksize", type=int, default=100_000, help="CSV rows read per chunk")
+    p.add_argument("--batch-size", type=int, default=4096, help="mini-batch size")
+    p.add_argument("--epochs", type=int, default=2, help="passes over the hotels")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_clusters)
+
+    p = sub.add_parser("correlations", help="Pearson and Spearman matrices of the numeric features, or per group")
+    p.add_argument("--by", choices=["location", "price_bracket", "room_category", "review_score", "bed_type"],
+                   help="one row per group and pair instead of the matrices")
+    p.add_argument("--min-count", type=int, default=10, help="with --by: smallest group correlated")
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_correlations)
+
+    p = sub.add_parser("dashboard", help="write an offline HTML dashboard with location, price and room filters")
+    p.add_argument("--output", default=os.path.join(paths.ROOT, "output", "dashboard", "index.html"))
+    p.add_argument("--max-locations", type=int, default=300,
+                   help="largest locations listed by name; the rest are merged into one")
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_dashboard)
+
+    p = sub.add_parser("gaps", help="room score minus rating per location, room category and price bracket")
+    p.add_argument("--by", choices=["location", "room_category", "price_bracket"],
+                   help="one dimension only (default: all three)")
+    p.add_argument("--worst", type=int, metavar="N",
+                   help="list the N most negative gaps, overall or per cohort of --by")
+    p.add_argument("--min-count", type=int, default=10, help="smallest cohort reported")
+    p.add_argument("--compact", action="store_true", help=compact_help)
+    p.add_argument("--exclude-outliers", action="store_true", help=outliers_help)
+    p.set_defaults(func=cmd_gaps)
+
+    p = sub.add_parser("stats-cache", help="entries and hit rates of the on-disk statistics cache")
+    p.add_argument("--clear", action="store_true", help="delete the cache")
+    p.set_defaults(func=cmd_stats_cache)
+
+    socket_path = os.path.join(paths.ROOT, "output", ".worker.sock")
+
+    p = sub.add_parser("worker", help="keep the data in memory and re-render on file change")
+    p.add_argument("--socket", default=socket_path)
+    p.add_argument("--interval", type=float, default=1.0, help="polling interval in seconds")
+    p.add_argument("--no-render", action="store_true",
+                   help="only reload data on change, render on request")
+    p.add_argument("--out-dir", default=paths.CHARTS_DIR)
+    p.set_defaults(func=cmd_worker)
+
+    p = sub.add_parser("ask", help="send a request to a running worker")
+    p.add_argument("kind", choices=["chart", "finding", "section", "presentation", "status", "reload"])
+    p.add_argument("name", nargs="?")
+    p.add_argument("--socket", default=socket_path)
+    p.set_defaults(func=cmd_ask)
+
+    p = sub.add_parser("query-server", help="serve value-score/value-index lookups over HTTP")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.set_defaults(func=cmd_query_server)
+
+    p = sub.add_parser("leaderboards", help="build per-cohort top-k boards into output/tables/")
+    p.add_argument("--k", type=int, default=10)
+    p.add_argument("--show", nargs=3, metavar=("BOARD", "GROUPING", "GROUP"),
+                   help="print one saved board, e.g. best_value location 'Ao Nang Beach'")
+    p.set_defaults(func=cmd_leaderboards)
+
+    p = sub.add_parser("cube", help="build the aggregate cube, or query the saved one")
+    p.add_argument("--materialize", type=int, default=2,
+                   help="precompute every cuboid of up to this many dimensions")
+    p.add_argument("--by", action="append", help="dimension to group by (repeatable)")
+    p.add_argument("--where", action="append", default=[], metavar="DIM=VALUE",
+                   help="keep cells with this label (repeatable)")
+    p.set_defaults(func=cmd_cube)
+
+    p = sub.add_parser("locations", help="value table per neighbourhood, town or region")
+    p.add_argument("--level", choices=hierarchy_levels(), default="town",
+                   help="hierarchy level; towns include all of their neighbourhoods")
+    p.add_argument("--min-count", type=int, default=10)
+    p.add_argument("--top", type=int, default=10)
+    p.set_defaults(func=cmd_locations)
+
+    p = sub.add_parser("history", help="append today's scrape to the price history, or query it")
+    p.add_argument("action", choices=["append", "median", "movers"])
+    p.add_argument("--root", default=os.path.join(paths.ROOT, "data", "history"))
+    p.add_argument("--date", help="scrape date (append) or window end (queries), YYYY-MM-DD")
+    p.add_argument("--days", type=int, default=30, help="query window in days")
+    p.add_argument("--min-rise", type=float, default=0.2, help="movers: minimum relative price rise")
+    p.add_argument("--top", type=int, default=20)
+    p.set_defaults(func=cmd_history)
+
+    p = sub.add_parser("memory", help="per-column memory of the cleaned frames, before/after compaction")
+    p.set_defaults(func=cmd_memory)
+
+    p = sub.add_parser("sample", help="draw stratified samples of the cleaned CSVs in one streaming pass")
+    p.add_argument("--per-stratum", type=int, default=50,
+                   help="rows kept per location x price bracket stratum")
+    p.add_argument("--chunksize", type=int, default=100_000, help="CSV rows read per chunk")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_sample)
+
+    p = sub.add_parser("synth", help="write synthetic raw CSVs of any size in the data/raw format")
+    p.add_argument("--rows", type=int, default=100_000, help="rows per file")
+    p.add_argument("--tripadvisor-rows", type=int, help="TripAdvisor rows, if different")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--out-dir", default=os.path.join(paths.ROOT, "data", "synthetic"))
+    p.set_defaults(func=cmd_synth)
+
+    p = sub.add_parser("all", help="clean, report, charts and slides in one process")
+    p.set_defaults(func=cmd_all)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.no_stats_cache:
+        from . import memo
+
+        memo.disable()
+    if not args.trace:
+        args.func(args)
+        return
+
+    import sys
+
+    from . import instrument, memo
+
+    instrument.enable(memory=args.trace_memory)
+    try:
+        with instrument.span(args.command):
+            args.func(args)
+    finally:
+        instrument.write_trace(args.trace)
+        print(instrument.summary().to_string(float_format="{:.1f}".format), file=sys.stderr)
+        print(f"trace written to {args.trace}", file=sys.stderr)
+        rates = memo.hit_rates()
+        if len(rates):
+            print("\nstats cache:", file=sys.stderr)
+            print(rates.to_string(float_format="{:.0%}".format), file=sys.stderr)
@@ -0,0 +1,378 @@
+"""Locations and hotels grouped by price/quality profile with mini-batch k-means.
+
+A location is described by its price distribution (log median price and the
+log of its p75/p25 spread), its mean rating, its mean room gap
+(room_score - rating) and its review volume (log of the mean review count).
+A hotel is described by its log price, rating, room gap and log review count.
+Features are standardized; a missing value becomes 0, the mean.
+
+Everything streams over chunks of rows, so memory is bounded by one chunk
+whatever the number of hotels:
+
+1. one pass accumulates the feature sums for standardization, the
+   per-location sums and price sketches (``cube.SKETCH_EDGES``; medians
+   within a few percent) and a uniform sample of hotels for the k-means++ start;
+2. ``epochs`` passes of mini-batch k-means (Sculley 2010): each batch moves
+   every center towards the mean of its points with a per-center step of
+   ``batch points / all points seen``;
+3. one pass writes every hotel's cluster to ``HOTEL_CLUSTERS_CSV``.
+
+Clusters are numbered by price, cheapest first. Location clusters are saved
+to ``LOCATION_CLUSTERS_CSV``, with the digest of the CSV they were fitted on in
+``LOCATION_CLUSTERS_SOURCE``. The charts read them with
+``location_clusters(booking)``: the saved labels are used while the cleaned
+data is unchanged, the profile columns always come from ``booking``.
+
+    locations, centers, _ = run(chunked(paths.BOOKING_CLEANED), source=paths.BOOKING_CLEANED)
+    run(chunked(paths.BOOKING_CLEANED), hotels=True)                 # and every hotel
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import compression, cube, features, instrument, paths
+
+LOCATION_CLUSTERS_CSV = os.path.join(paths.TABLES_DIR, "location_clusters.csv")
+LOCATION_CLUSTERS_SOURCE = os.path.join(paths.TABLES_DIR, "location_clusters_source.json")
+HOTEL_CLUSTERS_CSV = os.path.join(paths.TABLES_DIR, "hotel_clusters.csv")
+
+LOCATION_FEATURES = ["log_median_price", "log_price_spread", "mean_rating", "mean_room_gap", "log_reviews"]
+HOTEL_FEATURES = ["log_price", "rating", "room_gap", "log_reviews"]
+K = 6
+BATCH_SIZE = 4096
+EPOCHS = 2
+CHUNKSIZE = 100_000
+INIT_SAMPLE = 20_000
+LOCATION_PASSES = 20
+
+PRICE_EDGES = cube.SKETCH_EDGES["price_eur"]
+
+
+def chunked(path, chunksize=CHUNKSIZE):
+    """Zero-argument function reading the CSV at ``path`` in chunks, once per call."""
+    return lambda: pd.read_csv(compression.resolve(path), chunksize=chunksize)
+
+
+def in_chunks(frame, chunksize=CHUNKSIZE):
+    """``chunked`` for a frame already in memory."""
+    return lambda: (frame.iloc[start:start + chunksize] for start in range(0, max(len(frame), 1), chunksize))
+
+
+def hotel_features(frame):
+    """``HOTEL_FEATURES`` of every row, NaN where an input is missing."""
+    return pd.DataFrame({
+        "log_price": np.log(frame["price_eur"].to_numpy(dtype=float)),
+        "rating": frame["rating"].to_numpy(dtype=float),
+        "room_gap": (frame["room_score"] - frame["rating"]).to_numpy(dtype=float),
+        "log_reviews": np.log1p(frame["num_reviews"].to_numpy(dtype=float)),
+    }, index=frame.index)
+
+
+class Scaler:
+    """Mean and standard deviation per column, accumulated over chunks (NaN ignored)."""
+
+    def __init__(self):
+        self.n = self.total = self.sumsq = 0
+
+    def add(self, values):
+        ok = ~np.isnan(values)
+        self.n = self.n + ok.sum(axis=0)
+        self.total = self.total + np.where(ok, values, 0).sum(axis=0)
+        self.sumsq = self.sumsq + np.where(ok, values ** 2, 0).sum(axis=0)
+
+    def fit(self, values):
+        self.add(values)
+        return self
+
+    @property
+    def mean(self):
+        return self.total / np.maximum(self.n, 1)
+
+    @property
+    def std(self):
+        var = self.sumsq / np.maximum(self.n, 1) - self.mean ** 2
+        std = np.sqrt(np.clip(var, 0, None))
+        return np.where(std > 0, std, 1.0)
+
+    def transform(self, values):
+        return np.nan_to_num((values - self.mean) / self.std)
+
+    def inverse(self, z):
+        return z * self.std + self.mean
+
+
+class MiniBatchKMeans:
+    """k-means on batches of points; ``counts`` is the number of points each center has seen."""
+
+    def __init__(self, k=K, seed=0):
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.centers = None
+        self.counts = None
+
+    def init(self, z):
+        """k-means++ start on the points ``z`` (a sample)."""
+        k = min(self.k, len(z))
+        centers = [z[self.rng.integers(len(z))]]
+        closest = ((z - centers[0]) ** 2).sum(axis=1)
+        for _ in range(1, k):
+            total = closest.sum()
+            pick = self.rng.choice(len(z), p=closest / total) if total > 0 else self.rng.integers(len(z))
+            centers.append(z[pick])
+            closest = np.minimum(closest, ((z - z[pick]) ** 2).sum(axis=1))
+        self.centers = np.array(centers)
+        self.counts = np.zeros(len(self.centers))
+        return self
+
+    def predict(self, z):
+        """Index of the nearest center of every point, and its squared distance."""
+        distance = ((z ** 2).sum(axis=1)[:, None] - 2 * z @ self.centers.T
+                    + (self.centers ** 2).sum(axis=1)[None, :])
+        nearest = distance.argmin(axis=1)
+        return nearest, np.maximum(distance[np.arange(len(z)), nearest], 0)
+
+    def partial_fit(self, z):
+        nearest, _ = self.predict(z)
+        k = len(self.centers)
+        sizes = np.bincount(nearest, minlength=k)
+        sums = np.stack([np.bincount(nearest, weights=z[:, j], minlength=k) for j in range(z.shape[1])], axis=1)
+        self.counts += sizes
+        moved = sizes > 0
+        # Same as Sculley's per-point step 1/count, applied to the whole batch at once
+        step = sizes[moved] / self.counts[moved]
+        self.centers[moved] += step[:, None] * (sums[moved] / sizes[moved, None] - self.centers[moved])
+        return self
+
+    def fit_batches(self, z, batch_size=BATCH_SIZE):
+        """``partial_fit`` on ``z`` in shuffled batches."""
+        order = self.rng.permutation(len(z))
+        for start in range(0, len(z), batch_size):
+            self.partial_fit(z[order[start:start + batch_size]])
+        return self
+
+    def sort_by(self, column):
+        """Renumber the centers in increasing order of one feature."""
+        order = np.argsort(self.centers[:, column], kind="stable")
+        self.centers, self.counts = self.centers[order], self.counts[order]
+        return self
+
+
+class LocationProfiles:
+    """Per-location sums and price sketches, added chunk by chunk."""
+
+    def __init__(self):
+        self.sums = None
+
+    def add(self, chunk):
+        price = chunk["price_eur"].to_numpy(dtype=float)
+        bins = np.clip(np.searchsorted(PRICE_EDGES, price, side="right") - 1, 0, len(PRICE_EDGES) - 2)
+        gap = chunk["room_score"] - chunk["rating"]
+        parts = pd.DataFrame({
+            "location": chunk["location"].to_numpy(),
+            "hotels": 1,
+            "rating_sum": chunk["rating"].fillna(0).to_numpy(),
+            "rating_n": chunk["rating"].notna().to_numpy(),
+            "gap_sum": gap.fillna(0).to_numpy(),
+            "gap_n": gap.notna().to_numpy(),
+            "reviews_sum": chunk["num_reviews"].fillna(0).to_numpy(),
+            "reviews_n": chunk["num_reviews"].notna().to_numpy(),
+        })
+        sums = parts.groupby("location").sum()
+        sketch = (pd.crosstab(parts["location"], pd.Series(bins, name="bin"))
+                  .reindex(columns=range(len(PRICE_EDGES) - 1), fill_value=0))
+        sums = pd.concat([sums, sketch], axis=1)
+        self.sums = sums if self.sums is None else self.sums.add(sums, fill_value=0)
+
+    def frame(self):
+        """One row per location: ``hotels`` and the ``LOCATION_FEATURES``."""
+        sums = self.sums.sort_index()
+        sketch = sums[list(range(len(PRICE_EDGES) - 1))].to_numpy()
+        p25, median, p75 = (cube.sketch_quantile(sketch, PRICE_EDGES, q, log=True) for q in (0.25, 0.5, 0.75))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame({
+                "location": sums.index,
+                "hotels": sums["hotels"].to_numpy(dtype=np.int64),
+                "median_price": median,
+                "log_median_price": np.log(median),
+                "log_price_spread": np.log(p75 / p25),
+                "mean_rating": (sums["rating_sum"] / sums["rating_n"]).to_numpy(),
+                "mean_room_gap": (sums["gap_sum"] / sums["gap_n"]).to_numpy(),
+                "log_reviews": np.log1p(sums["reviews_sum"] / sums["reviews_n"]).to_numpy(),
+            })
+
+
+def _sample(pool, values, rng, size):
+    """``(rows, keys)``: a uniform sample of at most ``size`` of all rows passed in so far.
+
+    Every row gets a random key and the rows with the smallest keys are kept.
+    """
+    keys = rng.random(len(values))
+    if pool is not None:
+        values, keys = np.vstack([pool[0], values]), np.concatenate([pool[1], keys])
+    keep = np.argsort(keys, kind="stable")[:size]
+    return values[keep], keys[keep]
+
+
+# Log features are reported back in their own units
+NATURAL = {
+    "log_median_price": ("median_price", np.exp),
+    "log_price_spread": ("p75_p25_ratio", np.exp),
+    "log_price": ("price", np.exp),
+    "log_reviews": ("reviews", np.expm1),
+}
+
+
+def describe(model, scaler, columns):
+    """One row per cluster: its size and center in the original units."""
+    table = pd.DataFrame(scaler.inverse(model.centers), columns=columns)
+    for column, (name, inverse) in NATURAL.items():
+        if column in table:
+            table[column] = inverse(table[column])
+    table = table.rename(columns={column: name for column, (name, _) in NATURAL.items()})
+    table.insert(0, "cluster", range(len(table)))
+    table.insert(1, "size", model.counts.astype(np.int64))
+    return table
+
+
+@instrument.timed("clusters.locations")
+def cluster_locations(profiles, k=K, min_hotels=features.MIN_LOCATION_HOTELS, seed=0):
+    """``profiles`` with a ``cluster`` column, and the cluster centers.
+
+    Centers are fitted on the locations with at least ``min_hotels`` hotels;
+    every location is then given its nearest center.
+    """
+    fitted = profiles[profiles["hotels"] >= min_hotels]
+    if fitted.empty:
+        fitted = profiles
+    values = fitted[LOCATION_FEATURES].to_numpy(dtype=float)
+    scaler = Scaler().fit(values)
+    z = scaler.transform(values)
+    model = MiniBatchKMeans(k, seed).init(z)
+    for _ in range(LOCATION_PASSES):
+        model.fit_batches(z)
+    model.sort_by(LOCATION_FEATURES.index("log_median_price"))
+    profiles = profiles.copy()
+    profiles["cluster"] = model.predict(scaler.transform(profiles[LOCATION_FEATURES].to_numpy(dtype=float)))[0]
+    model.counts = np.bincount(profiles.loc[fitted.index, "cluster"], minlength=len(model.centers)).astype(float)
+    return profiles, describe(model, scaler, LOCATION_FEATURES)
+
+
+@instrument.timed("clusters.hotels")
+def cluster_hotels(chunks, scaler, sample, k=K, batch_size=BATCH_SIZE, epochs=EPOCHS, seed=0,
+                   path=HOTEL_CLUSTERS_CSV):
+    """Fit hotel clusters over ``chunks()`` and write every hotel's cluster to ``path``."""
+    model = MiniBatchKMeans(k, seed).init(scaler.transform(sample))
+    for _ in range(epochs):
+        for chunk in chunks():
+            model.fit_batches(scaler.transform(hotel_features(chunk).to_numpy()), batch_size)
+    model.sort_by(HOTEL_FEATURES.index("log_price"))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    sizes = np.zeros(len(model.centers))
+    first = True
+    for chunk in chunks():
+        nearest, distance = model.predict(scaler.transform(hotel_features(chunk).to_numpy()))
+        sizes += np.bincount(nearest, minlength=len(sizes))
+        out = chunk[["hotel_name", "location"]].assign(cluster=nearest, distance=np.sqrt(distance).round(4))
+        out.to_csv(path, mode="w" if first else "a", header=first, index=False)
+        first = False
+    model.counts = sizes
+    return describe(model, scaler, HOTEL_FEATURES)
+
+
+def run(chunks, k=K, hotels=False, batch_size=BATCH_SIZE, epochs=EPOCHS, seed=0,
+        location_path=LOCATION_CLUSTERS_CSV, hotel_path=HOTEL_CLUSTERS_CSV, source=None,
+        source_path=LOCATION_CLUSTERS_SOURCE):
+    """Cluster the locations (and with ``hotels`` every hotel) of the rows of ``chunks()``.
+
+    Returns ``(locations, location_centers, hotel_centers)``; ``hotel_centers``
+    is None without ``hotels``. Assignments are saved to the two CSV paths and
+    the digest of ``source``, the CSV behind ``chunks``, to ``source_path``.
+    """
+    rng = np.random.default_rng(seed)
+    profiles, scaler, sample = LocationProfiles(), Scaler(), None
+    with instrument.span("clusters.profile"):
+        for chunk in chunks():
+            profiles.add(chunk)
+            if hotels:
+                values = hotel_features(chunk).to_numpy()
+                scaler.add(values)
+                sample = _sample(sample, values, rng, INIT_SAMPLE)
+
+    locations, location_centers = cluster_locations(profiles.frame(), k, seed=seed)
+    os.makedirs(os.path.dirname(location_path), exist_ok=True)
+    locations.to_csv(location_path, index=False)
+    _save_source(source, source_path, k=k, seed=seed)
+    hotel_centers = None
+    if hotels:
+        hotel_centers = cluster_hotels(chunks, scaler, sample[0], k, batch_size, epochs, seed, hotel_path)
+    return locations, location_centers, hotel_centers
+
+
+def _digest(source):
+    source = compression.resolve(source)
+    return {"source": os.path.abspath(source), "digest": compression.file_digest(source)}
+
+
+def _save_source(source, path=LOCATION_CLUSTERS_SOURCE, **params):
+    """Record the digest of ``source`` and the fit parameters; without a source,
+    saved clusters are never reused."""
+    if source is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    with open(path, "w") as f:
+        json.dump({**_digest(source), **params}, f)
+
+
+def _saved_source(source_path):
+    if not os.path.exists(source_path):
+        return None
+    with open(source_path) as f:
+        return json.load(f)
+
+
+def _saved_labels(path, source_path, data):
+    """``location -> cluster`` of the saved clusters if they were fitted on ``data`` as it is now."""
+    saved = _saved_source(source_path)
+    if saved is None or not (os.path.exists(path) and os.path.exists(compression.resolve(data))):
+        return None
+    if {key: saved.get(key) for key in ("source", "digest")} != _digest(data):
+        return None
+    saved = pd.read_csv(path)
+    return dict(zip(saved["location"], saved["cluster"]))
+
+
+def refit_saved(booking, data=paths.BOOKING_CLEANED, path=LOCATION_CLUSTERS_CSV,
+                source_path=LOCATION_CLUSTERS_SOURCE):
+    """Refit the saved location clusters on ``booking`` if they were fitted on an
+    earlier version of ``data``; returns whether they were refitted."""
+    saved = _saved_source(source_path)
+    if saved is None or not os.path.exists(compression.resolve(data)):
+        return False
+    current = _digest(data)
+    if saved.get("source") != current["source"] or saved.get("digest") == current["digest"]:
+        return False
+    run(in_chunks(booking), k=saved.get("k", K), seed=saved.get("seed", 0), location_path=path,
+        source=data, source_path=source_path)
+    return True
+
+
+def location_clusters(booking, path=LOCATION_CLUSTERS_CSV, source_path=LOCATION_CLUSTERS_SOURCE,
+                      data=paths.BOOKING_CLEANED):
+    """Profiles of the locations of ``booking`` with a ``cluster`` column.
+
+    The cluster labels come from the saved clusters while they were fitted on
+    the current ``data`` and cover every location of ``booking``; otherwise the
+    clusters are fitted on ``booking``. The profile columns always describe
+    ``booking`` itself (a sample, a market, the rows without outliers).
+    """
+    profiles = LocationProfiles()
+    profiles.add(booking)
+    frame = profiles.frame()
+    labels = _saved_labels(path, source_path, data)
+    if labels is not None and set(frame["location"]) <= set(labels):
+        return frame.assign(cluster=frame["location"].map(labels).astype(np.int64))
+    return cluster_locations(frame)[0]
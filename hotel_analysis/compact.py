@@ -0,0 +1,77 @@
+"""Memory-compact versions of the cleaned frames.
+
+``compact()`` rewrites a frame column by column without changing any value:
+
+* repetitive strings (fewer distinct values than ``CATEGORY_RATIO`` of the
+  rows) become categoricals, i.e. dictionary-encoded integer codes;
+* the remaining free text (TripAdvisor comments, hotel names) becomes
+  Arrow-backed strings when the optional pyarrow is installed and is left
+  alone otherwise;
+* integer columns, and integer-valued float columns, become the narrowest
+  integer type that holds them (nullable when they contain NaN). Floats with
+  decimals stay float64, since float32 cannot hold 0.1 steps exactly.
+
+    booking, tripadvisor = load_compact()
+    print(memory_report(data.load_booking(), booking))
+"""
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+from . import data
+
+CATEGORY_RATIO = 0.5
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _integer_dtype(values, nullable):
+    lo, hi = values.min(), values.max()
+    for bits in (8, 16, 32, 64):
+        info = np.iinfo(f"int{bits}")
+        if info.min <= lo and hi <= info.max:
+            return f"Int{bits}" if nullable else f"int{bits}"
+
+
+def compact_column(column):
+    """``column`` in its smallest lossless representation (unchanged if none)."""
+    if pd.api.types.is_integer_dtype(column.dtype):
+        values = column.dropna()
+        if len(values):
+            return column.astype(_integer_dtype(values, isinstance(column.dtype, pd.api.extensions.ExtensionDtype)))
+        return column
+    if pd.api.types.is_float_dtype(column.dtype):
+        values = column.dropna()
+        if len(values) and np.array_equal(values, np.round(values)):
+            return column.astype(_integer_dtype(values, column.isna().any()))
+        return column
+    if pd.api.types.is_string_dtype(column.dtype) or column.dtype == object:
+        if column.nunique() < CATEGORY_RATIO * len(column):
+            return column.astype("category")
+        if HAS_PYARROW:
+            # NaN as the missing value keeps the semantics of the default str dtype
+            return column.astype(pd.StringDtype("pyarrow", na_value=np.nan))
+    return column
+
+
+def compact(frame):
+    return pd.DataFrame({name: compact_column(frame[name]) for name in frame.columns})
+
+
+def load_compact():
+    """The cleaned (booking, tripadvisor) frames in compact form."""
+    booking, tripadvisor = data.load_cleaned()
+    return compact(booking), compact(tripadvisor)
+
+
+def memory_report(before, after):
+    """Per-column dtype and deep memory usage before and after compaction."""
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "bytes_before": before.memory_usage(deep=True, index=False),
+        "dtype_after": after.dtypes.astype(str),
+        "bytes_after": after.memory_usage(deep=True, index=False),
+    })
+    report.loc["TOTAL"] = ["", report["bytes_before"].sum(), "", report["bytes_after"].sum()]
+    report["saved_pct"] = (1 - report["bytes_after"] / report["bytes_before"]) * 100
+    return report
@@ -0,0 +1,158 @@
+"""Compressed CSV input and output, picked by file extension.
+
+The raw scrapes can be kept as ``booking_hotel.csv.gz`` (or ``.xz``, ``.bz2``,
+``.zst``) and are read directly, without a decompressed copy on disk:
+
+    path = resolve(os.path.join(raw_dir, "booking_hotel.csv"))   # finds the .gz
+    with open_binary(path, threaded=True) as f:
+        frame = pd.read_csv(f, encoding="latin1")
+
+``open_binary`` streams the decompressed bytes; the parser pulls them in
+chunks. With ``threaded=True`` a background thread decompresses ahead into a
+bounded queue of ``CHUNK`` blocks. zlib, lzma, bz2 and zstandard release the
+GIL while they work, so decompression overlaps with parsing. zstd needs the
+optional ``zstandard`` package. Writing uses the same extensions through
+pandas' ``to_csv(compression="infer")``. ``file_digest`` hashes a file as
+stored, so the notebook cache and the anomaly loads can tell versions apart.
+"""
+import bz2
+import gzip
+import hashlib
+import importlib.util
+import io
+import lzma
+import os
+import queue
+import threading
+
+CHUNK = 1 << 20
+QUEUE_CHUNKS = 8
+HAS_ZSTD = importlib.util.find_spec("zstandard") is not None
+
+# extension -> codec name, in the order ``resolve`` looks for them
+SUFFIXES = {".gz": "gzip", ".zst": "zstd", ".xz": "xz", ".bz2": "bz2"}
+CODECS = [name for name in SUFFIXES.values() if name != "zstd" or HAS_ZSTD]
+
+_digests = {}
+
+
+def codec(path):
+    """Codec name of ``path`` from its extension, None for an uncompressed file."""
+    return SUFFIXES.get(os.path.splitext(path)[1])
+
+
+def variants(path):
+    """``path`` and its compressed variants."""
+    return [path] + [path + suffix for suffix in SUFFIXES]
+
+
+def resolve(path):
+    """``path`` if it exists, else its first existing compressed variant, else ``path``."""
+    return next((p for p in variants(path) if os.path.exists(p)), path)
+
+
+def _open(path, mode):
+    name = codec(path)
+    if name is None:
+        return open(path, mode)
+    if name == "zstd":
+        if not HAS_ZSTD:
+            raise ImportError(f"reading {path} needs the zstandard package")
+        import zstandard
+
+        return zstandard.open(path, mode)
+    return {"gzip": gzip, "xz": lzma, "bz2": bz2}[name].open(path, mode)
+
+
+class _Prefetch(io.RawIOBase):
+    """Raw stream fed by a thread that reads ``source`` ahead in ``CHUNK`` blocks."""
+
+    def __init__(self, source):
+        self.source = source
+        self.queue = queue.Queue(QUEUE_CHUNKS)
+        self.stop = threading.Event()
+        self.pending = b""
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+        self.thread.start()
+
+    def _fill(self):
+        try:
+            while not self.stop.is_set():
+                block = self.source.read(CHUNK)
+                self.queue.put(block)
+                if not block:
+                    return
+        except Exception as exc:  # re-raised in the reading thread
+            self.queue.put(exc)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self.pending:
+            block = self.queue.get()
+            if isinstance(block, Exception):
+                raise block
+            if not block:
+                self.queue.put(block)
+                return 0
+            self.pending = memoryview(block)
+        n = min(len(buffer), len(self.pending))
+        buffer[:n] = self.pending[:n]
+        self.pending = self.pending[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self.stop.set()
+            while self.thread.is_alive():
+                try:
+                    self.queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self.source.close()
+        super().close()
+
+
+def open_binary(path, threaded=False):
+    """Decompressed byte stream of ``path``; ``threaded`` decompresses ahead in a thread."""
+    stream = _open(path, "rb")
+    if not threaded:
+        return stream
+    return io.BufferedReader(_Prefetch(stream), CHUNK)
+
+
+def open_text(path, encoding, threaded=False):
+    """Decompressed text stream of ``path``, line endings untouched (``newline=""``)."""
+    return io.TextIOWrapper(open_binary(path, threaded), encoding=encoding, newline="")
+
+
+def output_path(path, compress=None):
+    """``path`` with the extension of codec ``compress`` (None: uncompressed)."""
+    if compress is None:
+        return path
+    suffix = next((s for s, name in SUFFIXES.items() if name == compress), None)
+    if suffix is None:
+        raise ValueError(f"unknown codec {compress!r} (use one of {', '.join(SUFFIXES.values())})")
+    return path + suffix
+
+
+def replace_variants(path):
+    """Remove the other variants of ``path``'s file, so ``resolve`` finds ``path``."""
+    base = path[:-len(os.path.splitext(path)[1])] if codec(path) else path
+    for other in variants(base):
+        if other != path and os.path.exists(other):
+            os.remove(other)
+
+
+def file_digest(path, chunk=CHUNK):
+    """SHA-256 digest (32 hex digits) of a file's bytes, remembered per (path, size, mtime)."""
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _digests:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while block := f.read(chunk):
+                digest.update(block)
+        _digests[key] = digest.hexdigest()[:32]
+    return _digests[key]
@@ -0,0 +1,182 @@
+"""Pearson and Spearman correlation matrices over pairwise-complete rows.
+
+``matrices(frame)`` correlates every pair of numeric columns at once. Each
+pair uses the rows where both of its values are present, exactly as
+``stats.pearson``/``stats.spearman`` on the ``dropna``'d pair would. Columns
+that are missing in the same rows share those row sets, so a frame has only a
+few distinct sets. For each set the columns are ranked (Spearman) and centered
+once, and all of its pairs come out of one masked matrix product ``Z.T @ Z``.
+Each column is sorted once; a row set's ranks come from filtering that order.
+p-values use the t-test of ``stats._pvalue``.
+
+    result = matrices(booking_features(booking))
+    result["spearman"].r.loc["num_reviews", "rating"]
+    by_group(booking_features(booking), booking["location"])   # one row per group and pair
+"""
+import numpy as np
+import pandas as pd
+
+from . import features, instrument, stats
+
+METHODS = ["pearson", "spearman"]
+MIN_GROUP_ROWS = 10
+
+
+def booking_features(booking):
+    """Numeric Booking.com columns plus the room gap (room_score - rating)."""
+    return pd.DataFrame({
+        "price_eur": booking["price_eur"],
+        "rating": booking["rating"],
+        "room_score": booking["room_score"],
+        "num_reviews": booking["num_reviews"],
+        # Scores have one decimal; rounding keeps equal gaps equal, not 1 ulp apart
+        "room_gap": (booking["room_score"] - booking["rating"]).round(1),
+    }).astype(float)
+
+
+def comment_features(tripadvisor):
+    """Price, review count and comment length of the TripAdvisor rows with a comment."""
+    ta = features.comments(tripadvisor)
+    return ta[["price_eur", "num_reviews", "comment_words", "comment_len"]].astype(float)
+
+
+class Matrix:
+    """Correlations ``r``, two-sided p-values ``p`` and row counts ``n``, column x column."""
+
+    def __init__(self, r, p, n):
+        self.r = r
+        self.p = p
+        self.n = n
+
+    def pairs(self):
+        """One row per pair of distinct columns: x, y, r, p, n."""
+        columns = list(self.r.columns)
+        i, j = np.triu_indices(len(columns), k=1)
+        return pd.DataFrame({
+            "x": [columns[a] for a in i],
+            "y": [columns[b] for b in j],
+            "r": self.r.to_numpy()[i, j],
+            "p": self.p.to_numpy()[i, j],
+            "n": self.n.to_numpy()[i, j],
+        })
+
+
+def _row_sets(present):
+    """``[(rows, [(i, j), ...])]``: the pairs of columns (i <= j) sharing each complete-row mask."""
+    patterns = {}
+    for c in range(present.shape[1]):
+        patterns.setdefault(np.packbits(present[:, c]).tobytes(), (present[:, c], []))[1].append(c)
+    patterns = list(patterns.values())
+    sets = {}
+    for a, (rows_a, cols_a) in enumerate(patterns):
+        for rows_b, cols_b in patterns[a:]:
+            rows = rows_a & rows_b
+            sets.setdefault(np.packbits(rows).tobytes(), (rows, []))[1].extend(
+                (i, j) for i in cols_a for j in cols_b)
+    return list(sets.values())
+
+
+def _rank(values, order, rows, c):
+    """Average ranks (ties share their mean) of column ``c`` over ``rows``.
+
+    ``order`` is the column's argsort over all rows: the rows of any subset
+    are already sorted once it is filtered, so no subset is sorted again.
+    """
+    order = order[rows[order]]
+    sorted_values = values[order, c]
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    ranks = np.empty(len(order))
+    position = np.cumsum(rows) - 1
+    ranks[position[order]] = np.repeat((starts + ends + 1) / 2, ends - starts)
+    return ranks
+
+
+def _correlate(z):
+    constant = np.ptp(z, axis=0) == 0
+    z = z - z.mean(axis=0)
+    gram = z.T @ z
+    # Constant columns have no correlation, not one made of rounding errors
+    scale = np.where(constant, np.nan, np.sqrt(np.diag(gram)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.clip(gram / np.outer(scale, scale), -1, 1)
+
+
+def _matrices(values, methods):
+    """``({method: (r, p)}, n)`` as k x k arrays for the columns of ``values``."""
+    k = values.shape[1]
+    present = ~np.isnan(values)
+    r = {method: np.full((k, k), np.nan) for method in methods}
+    n = np.zeros((k, k), dtype=np.int64)
+    orders = [np.argsort(values[:, c], kind="stable") for c in range(k)] if "spearman" in methods else None
+    for rows, pairs in _row_sets(present):
+        cols = sorted({c for pair in pairs for c in pair})
+        where = {c: pos for pos, c in enumerate(cols)}
+        ii, jj = np.array(pairs).T
+        pi, pj = [where[c] for c in ii], [where[c] for c in jj]
+        n[ii, jj] = n[jj, ii] = rows.sum()
+        if n[ii[0], jj[0]] < 2:
+            continue
+        for method in methods:
+            if method == "spearman":
+                z = np.column_stack([_rank(values, orders[c], rows, c) for c in cols])
+            else:
+                z = values[np.ix_(rows, cols)]
+            r[method][ii, jj] = r[method][jj, ii] = _correlate(z)[pi, pj]
+
+    result = {}
+    for method in methods:
+        p = np.full((k, k), np.nan)
+        for i, j in zip(*np.triu_indices(k)):
+            if np.isfinite(r[method][i, j]):
+                p[i, j] = p[j, i] = stats._pvalue(r[method][i, j], n[i, j])
+        result[method] = r[method], p
+    return result, n
+
+
+def _square(values, columns):
+    return pd.DataFrame(values, index=columns, columns=columns)
+
+
+@instrument.timed("correlation.matrices")
+def matrices(frame, columns=None, methods=METHODS):
+    """``{method: Matrix}`` over ``columns`` (default: every numeric column of ``frame``)."""
+    columns = list(columns or frame.select_dtypes("number").columns)
+    result, n = _matrices(frame[columns].to_numpy(dtype=float), methods)
+    n = _square(n, columns)
+    return {method: Matrix(_square(r, columns), _square(p, columns), n) for method, (r, p) in result.items()}
+
+
+@instrument.timed("correlation.by_group")
+def by_group(frame, by, columns=None, methods=METHODS, min_count=MIN_GROUP_ROWS):
+    """Pairwise correlations within each group of ``by`` with at least ``min_count`` rows.
+
+    ``by`` is a column name or a Series aligned with ``frame``. Returns one row
+    per group and pair: the group, x, y, n, then ``<method>`` and ``<method>_p``.
+    """
+    keys = frame[by] if isinstance(by, str) else by
+    name = keys.name or "group"
+    columns = list(columns or frame.select_dtypes("number").columns)
+    values = frame[columns].to_numpy(dtype=float)
+    i, j = np.triu_indices(len(columns), k=1)
+    groups, counts, out = [], [], {method: ([], []) for method in methods}
+    for group, positions in keys.groupby(keys, observed=True, sort=True).indices.items():
+        if len(positions) < min_count:
+            continue
+        result, n = _matrices(values[positions], methods)
+        groups.append(group)
+        counts.append(n[i, j])
+        for method, (r, p) in result.items():
+            out[method][0].append(r[i, j])
+            out[method][1].append(p[i, j])
+
+    table = pd.DataFrame({
+        name: np.repeat(np.array(groups, dtype=object), len(i)),
+        "x": np.tile(np.array(columns, dtype=object)[i], len(groups)),
+        "y": np.tile(np.array(columns, dtype=object)[j], len(groups)),
+        "n": np.concatenate(counts) if counts else np.zeros(0, dtype=np.int64),
+    })
+    for method, (r, p) in out.items():
+        table[method] = np.concatenate(r) if r else np.zeros(0)
+        table[f"{method}_p"] = np.concatenate(p) if p else np.zeros(0)
+    return table
@@ -0,0 +1,169 @@
+"""Currency detection and conversion to EUR from a date-versioned rate table.
+
+The raw price column is "in BDT or any other currency". ``parse_prices``
+matches every distinct string, as a whole, against one regex. Both scrapes
+mark BDT with a stray ``\\xa0`` byte, left over from the Taka sign after the
+latin-1 decode. Symbols (``$``, ``€``, ``£``, ``฿``) and ISO codes before or
+after the amount are recognized as well, and a leading "... from" is skipped
+("View all 7 deals from \\xa036,215"). A bare number is taken to be in
+``DEFAULT_CURRENCY``.
+
+Amounts group thousands with commas, periods or spaces and may end in a one
+or two digit decimal part after the other separator: "1,250.50", "1.250,50",
+"1 250", "12,5". Anything else, text without an amount ("View all 7 deals",
+"Best Flexible Rate") or a malformed amount ("1,2,3", "1,234,56"), gives no
+price rather than part of one.
+
+Rates live in ``data/rates.csv`` (``date,currency,per_eur``: units of the
+currency per EUR, valid from ``date`` until the next row of that currency).
+``RateTable`` memoizes every (currency, date) rate it has looked up.
+``to_eur`` factorizes its rows into distinct (currency, date) keys, joins only
+the keys not seen before against the table with one ``merge_asof``, and
+gathers the rates back by key code. Converting tens of millions of rows
+therefore costs a factorize and a take, not a lookup per row.
+
+    rates = RateTable()
+    parsed = parse_prices(raw["Room Price (in BDT or any other currency)"])
+    price_eur = rates.to_eur(parsed["amount"], parsed["currency"], date="2026-10-19")
+"""
+import datetime
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from . import paths
+
+RATES_CSV = os.path.join(paths.ROOT, "data", "rates.csv")
+DEFAULT_CURRENCY = "BDT"
+
+SYMBOLS = {
+    "\xa0": "BDT",
+    "৳": "BDT",
+    "Tk": "BDT",
+    "US$": "USD",
+    "$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+    "฿": "THB",
+}
+# Digits, possibly with separators in between; ``AMOUNT_PATTERN`` decides what they mean
+_NUMBER = r"\d(?:[\d,. \u202f]*\d)?"
+_MARKER = "|".join(sorted(map(re.escape, SYMBOLS), key=len, reverse=True)) + "|[A-Z]{3}"
+# Spaces only: a \xa0 is the BDT marker, not padding
+PRICE_PATTERN = (
+    rf"(?:.*\bfrom[ \t]+)?"
+    rf"(?:(?P<before>{_MARKER})[ \t]*(?P<amount>{_NUMBER})"
+    rf"|(?P<trailing>{_NUMBER})[ \t]*(?P<after>{_MARKER})"
+    rf"|(?P<bare>{_NUMBER}))"
+)
+AMOUNT_PATTERN = (
+    r"(?:\d{1,3}(?P<group>[,. \u202f])\d{3}(?:(?P=group)\d{3})*|\d+)"
+    r"(?:(?P<decimal>[.,])(?P<fraction>\d{1,2}))?"
+)
+_PRICE = re.compile(PRICE_PATTERN)
+_AMOUNT = re.compile(AMOUNT_PATTERN)
+
+
+def _plain_amount(text):
+    """An amount such as "1,250.50" or "1.250,50" as "1250.50"; None if it is malformed."""
+    match = _AMOUNT.fullmatch(text)
+    if not match or (match["decimal"] and match["decimal"] == match["group"]):
+        return None
+    whole = re.sub(r"\D", "", text[:match.start("decimal")] if match["decimal"] else text)
+    return f"{whole}.{match['fraction']}" if match["decimal"] else whole
+
+
+def _parse(text):
+    match = _PRICE.fullmatch(text.strip(" \t\r\n"))
+    amount = match and _plain_amount(match["amount"] or match["trailing"] or match["bare"])
+    if not amount:
+        return None, None
+    marker = match["before"] or match["after"]
+    return amount, SYMBOLS.get(marker, marker) if marker else DEFAULT_CURRENCY
+
+
+def parse_price(text):
+    """``(amount, currency)`` of one raw price string, ``(nan, None)`` without a price."""
+    amount, currency = _parse(text)
+    return (float(amount), currency) if amount else (np.nan, None)
+
+
+def parse_prices(raw):
+    """``amount`` (float) and ``currency`` (ISO code) of every raw price string."""
+    # Scraped prices repeat a lot: parse each distinct string once. A
+    # compiled match per string is twice as fast as Series.str.extract.
+    codes, uniques = pd.factorize(raw.fillna("").astype(str))
+    parsed = [_parse(text) for text in uniques]
+    # Integer amounts stay int64 when every string has one, as read_csv would give
+    amount = pd.to_numeric(pd.Series([a for a, _ in parsed], dtype=object)).to_numpy()
+    currency = np.array([c for _, c in parsed] + [None], dtype=object)[:-1]
+    return pd.DataFrame({
+        "amount": amount[codes],
+        "currency": currency[codes],
+    }, index=raw.index)
+
+
+def _as_dates(date, n):
+    if date is None:
+        date = datetime.date.today()
+    if np.ndim(date) == 0:
+        return np.full(n, np.datetime64(pd.Timestamp(date).date(), "D"))
+    return pd.to_datetime(pd.Series(date)).to_numpy().astype("datetime64[D]")
+
+
+class RateTable:
+    """Date-versioned EUR rates with a memo of every (currency, date) looked up."""
+
+    def __init__(self, path=RATES_CSV):
+        rates = pd.read_csv(path, parse_dates=["date"])
+        rates["date"] = rates["date"].astype("datetime64[ns]")
+        self.rates = rates.sort_values("date").reset_index(drop=True)
+        self.currencies = set(self.rates["currency"])
+        self._memo = {}
+        self.lookups = 0
+
+    def _join(self, keys):
+        """Rates for new (currency, date) keys with one as-of join."""
+        self.lookups += len(keys)
+        keys = keys.assign(date=keys["date"].astype("datetime64[ns]")).sort_values("date")
+        joined = pd.merge_asof(keys, self.rates, on="date", by="currency", direction="backward")
+        for currency, date, rate in zip(joined["currency"], joined["date"], joined["per_eur"]):
+            self._memo[currency, date.to_datetime64().astype("datetime64[D]")] = rate
+
+    def per_eur(self, currency, date=None):
+        """Units of ``currency`` per EUR on ``date`` (scalar or per row); NaN without a rate."""
+        currency = pd.Series(currency, dtype=object).to_numpy()
+        days = _as_dates(date, len(currency)).astype(np.int64)
+        currency_codes, names = pd.factorize(currency)
+        rates = np.full(len(currency), np.nan)
+        valid = currency_codes >= 0
+        if not valid.any():
+            return rates
+
+        # One int64 key per row; only the distinct keys are looked up
+        day0 = int(days[valid].min())
+        codes, keys = pd.factorize(currency_codes[valid].astype(np.int64) << 32 | (days[valid] - day0))
+        pairs = [(names[k >> 32], np.datetime64(int(k & 0xFFFFFFFF) + day0, "D")) for k in keys.tolist()]
+        new = [pair for pair in pairs if pair not in self._memo]
+        if new:
+            self._join(pd.DataFrame(new, columns=["currency", "date"]))
+        rates[valid] = np.array([self._memo[pair] for pair in pairs], dtype=float)[codes]
+        return rates
+
+    def to_eur(self, amount, currency, date=None):
+        """``amount`` in EUR, rounded to cents."""
+        return pd.Series(np.asarray(amount, dtype=float) / self.per_eur(currency, date),
+                         index=getattr(amount, "index", None)).round(2)
+
+
+_tables = {}
+
+
+def rate_table(path=RATES_CSV):
+    """Shared ``RateTable`` for ``path``, reloaded when the file changes."""
+    key = (path, os.stat(path).st_mtime_ns)
+    if key not in _tables:
+        _tables[key] = RateTable(path)
+    return _tables[key]
@@ -0,0 +1,105 @@
+"""Self-contained HTML dashboard built from pre-binned aggregates.
+
+``build`` rolls the Booking.com rows up into the cells of a cube over
+``DIMENSIONS`` (location x price bracket x room category, see ``cube.build``).
+Each cell keeps its count, the sums and sums of squares of ``MEASURES``, and
+sparse histograms of them: price on ``PRICE_BIN_GROUP`` merged log-spaced
+sketch bins (about 20% wide), scores on 0.1-wide bins. The page
+(``dashboard.html`` with the payload inlined, no external scripts or fonts)
+merges the cells that match the filters in JavaScript. That is a loop over a
+few thousand cells, so filtering is instant, and medians come from the merged
+histograms as in ``cube.sketch_quantile``.
+
+Only cells are shipped, never rows. The payload is bounded by the number of
+cells, not the number of hotels: locations beyond the ``max_locations``
+largest are merged into ``OTHER``, so at most (``max_locations`` + 1) x 6 x
+the room categories cells exist.
+
+    path = write(build(booking))            # output/dashboard/index.html
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import cube, features, instrument, paths, style
+
+DASHBOARD_HTML = os.path.join(paths.ROOT, "output", "dashboard", "index.html")
+TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.html")
+
+DIMENSIONS = ["location", "price_bracket", "room_category"]
+MEASURES = ["price_eur", "rating", "room_score"]
+MAX_LOCATIONS = 300
+OTHER = "(other locations)"
+PRICE_BIN_GROUP = 4
+
+
+def _limit_locations(booking, max_locations):
+    counts = booking["location"].value_counts()
+    if len(counts) <= max_locations:
+        return booking
+    kept = booking["location"].isin(counts.index[:max_locations])
+    location = booking["location"]
+    if isinstance(location.dtype, pd.CategoricalDtype):  # compact frames
+        merged = location.cat.add_categories([OTHER]).where(kept, OTHER)
+        return booking.assign(location=merged.cat.remove_unused_categories())
+    return booking.assign(location=location.where(kept, OTHER))
+
+
+def _sparse(hist):
+    """Per row, the nonzero bins of ``hist`` as a flat ``[bin, count, ...]`` list."""
+    rows, bins = np.nonzero(hist)
+    pairs = np.column_stack([bins, hist[rows, bins]]).ravel().tolist()
+    bounds = np.searchsorted(rows, np.arange(len(hist) + 1)) * 2
+    return [pairs[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+@instrument.timed("dashboard.build")
+def build(booking, max_locations=MAX_LOCATIONS):
+    """The dashboard payload: labels, per-cell statistics and sparse histograms."""
+    booking = _limit_locations(booking, max_locations)
+    built = cube.build(booking, dimensions=DIMENSIONS, materialize=[])
+    base = built.cuboids[tuple(DIMENSIONS)]
+
+    payload = {
+        "labels": {dim: built.labels[dim] for dim in DIMENSIONS},
+        "codes": {dim: base.codes[:, i].tolist() for i, dim in enumerate(DIMENSIONS)},
+        "count": base.count[:, 0].tolist(),
+        "measures": {},
+        "rows": int(base.count[:, 0].sum()),
+        "min_location_hotels": features.MIN_LOCATION_HOTELS,
+        "other": OTHER,
+    }
+    for j, m in enumerate(MEASURES):
+        sketch, edges = base.sketches[m], cube.SKETCH_EDGES[m]
+        if m == "price_eur":
+            # Merge the 4.6% sketch bins into PRICE_BIN_GROUP-wide ones
+            sketch = sketch.reshape(len(sketch), -1, PRICE_BIN_GROUP).sum(axis=2)
+            edges = edges[::PRICE_BIN_GROUP]
+        used = np.flatnonzero(sketch.sum(axis=0))
+        lo, hi = (used[0], used[-1] + 1) if len(used) else (0, 1)
+        payload["measures"][m] = {
+            "n": base.count[:, j + 1].tolist(),
+            "sum": np.round(base.total[:, j], 4).tolist(),
+            "edges": np.round(edges[lo:hi + 1], 4).tolist(),
+            "log": m == "price_eur",
+            "hist": _sparse(sketch[:, lo:hi]),
+        }
+    return payload
+
+
+def render(payload):
+    """The HTML page with ``payload`` and the chart colours inlined."""
+    with open(TEMPLATE, encoding="utf-8") as f:
+        page = f.read()
+    colors = {name: getattr(style, name) for name in ("BG", "ACCENT", "RED", "SUBTLE", "WHITE", "CARD", "EDGE")}
+    data = json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+    return page.replace("/*COLORS*/null", json.dumps(colors)).replace("/*PAYLOAD*/null", data)
+
+
+def write(payload, path=DASHBOARD_HTML):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render(payload))
+    return path
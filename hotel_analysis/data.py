@@ -0,0 +1,19 @@
+"""Loading of the cleaned datasets."""
+import pandas as pd
+
+from . import compression, instrument, paths
+
+
+@instrument.timed("load.booking")
+def load_booking(path=paths.BOOKING_CLEANED):
+    return pd.read_csv(compression.resolve(path))
+
+
+@instrument.timed("load.tripadvisor")
+def load_tripadvisor(path=paths.TRIPADVISOR_CLEANED):
+    return pd.read_csv(compression.resolve(path))
+
+
+def load_cleaned():
+    """Return the cleaned (booking, tripadvisor) frames."""
+    return load_booking(), load_tripadvisor()
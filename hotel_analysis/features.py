@@ -0,0 +1,121 @@
+"""Derived columns and aggregates shared by the report, the charts and the slides."""
+import numpy as np
+import pandas as pd
+
+from . import instrument, memo
+
+# (bins, labels) pairs used with pd.cut
+PRICE_BRACKETS = ([0, 50, 100, 200, 500, 1000, 10000],
+                  ["<50", "50-100", "100-200", "200-500", "500-1000", "1000+"])
+WIDE_PRICE_BRACKETS = ([0, 500, 1000, 2000, 5000, 10000],
+                       ["<500", "500-1k", "1k-2k", "2k-5k", "5k+"])
+REVIEW_BRACKETS = ([0, 50, 200, 500, 1000, 5000, 100000],
+                   ["<50", "50-200", "200-500", "500-1k", "1k-5k", "5k+"])
+COMMENT_PRICE_BRACKETS = ([0, 30, 60, 100, 200, 10000],
+                          ["<30", "30-60", "60-100", "100-200", "200+"])
+
+SCORE_ORDER = ["Exceptional", "Wonderful", "Superb", "Fabulous",
+               "Very Good", "Good", "Pleasant", "Review score"]
+
+MIN_LOCATION_HOTELS = 10
+MIN_REVIEWS = 50
+FIT_MAX_PRICE = 5000
+
+
+def bracket(values, brackets, name):
+    bins, labels = brackets
+    return pd.cut(values, bins=bins, labels=labels).rename(name)
+
+
+def price_bracket(booking, brackets=PRICE_BRACKETS):
+    return bracket(booking["price_eur"], brackets, "price_bracket")
+
+
+def review_bracket(booking):
+    return bracket(booking["num_reviews"], REVIEW_BRACKETS, "review_bracket")
+
+
+def simplify_room(rt):
+    rt = str(rt).lower()
+    if "suite" in rt:
+        return "Suite"
+    elif "villa" in rt:
+        return "Villa"
+    elif "deluxe" in rt:
+        return "Deluxe"
+    elif "superior" in rt:
+        return "Superior"
+    elif "standard" in rt:
+        return "Standard"
+    elif "double" in rt:
+        return "Double"
+    elif "twin" in rt:
+        return "Twin"
+    elif "single" in rt:
+        return "Single"
+    elif "family" in rt:
+        return "Family"
+    elif "studio" in rt:
+        return "Studio"
+    else:
+        return "Other"
+
+
+def room_category(booking):
+    return booking["room_type"].apply(simplify_room).rename("room_category")
+
+
+@instrument.timed()
+def location_stats(booking, min_count=MIN_LOCATION_HOTELS):
+    """Per-location price/quality table with the value index (rating per EUR * 100)."""
+    loc = (
+        booking.groupby("location")
+        .agg(
+            median_price=("price_eur", "median"),
+            mean_rating=("rating", "mean"),
+            mean_room_score=("room_score", "mean"),
+            count=("hotel_name", "count")
+        )
+        .reset_index()
+    )
+    loc = loc[loc["count"] >= min_count].copy()
+    loc["value_index"] = (loc["mean_rating"] / loc["median_price"]) * 100
+    return loc
+
+
+@instrument.timed()
+def value_scores(booking):
+    booking_value = booking.dropna(subset=["rating", "price_eur"]).copy()
+    booking_value["value_score"] = (booking_value["rating"] / booking_value["price_eur"]) * 100
+    return booking_value
+
+
+def top_value_hotels(booking, n=15, min_reviews=MIN_REVIEWS):
+    booking_value = value_scores(booking)
+    return booking_value[booking_value["num_reviews"] >= min_reviews].nlargest(n, "value_score")
+
+
+@instrument.timed()
+def fit_price_rating(booking, max_price=FIT_MAX_PRICE):
+    """Linear fit rating ~ price below ``max_price``.
+
+    Returns ``(coeffs, fit)`` where ``fit`` holds ``expected_rating`` and
+    ``rating_residual`` (negative = overpriced for its rating).
+    """
+    mask = booking["price_eur"] < max_price
+    coeffs = memo.polyfit(booking.loc[mask, "price_eur"].to_numpy(dtype=float),
+                          booking.loc[mask, "rating"].to_numpy(dtype=float), 1)
+    fit = booking[mask].copy()
+    fit["expected_rating"] = np.polyval(coeffs, fit["price_eur"])
+    fit["rating_residual"] = fit["rating"] - fit["expected_rating"]
+    return coeffs, fit
+
+
+@instrument.timed()
+def comments(tripadvisor):
+    """TripAdvisor rows with a comment, plus length columns and the price bracket."""
+    ta = tripadvisor.dropna(subset=["comment"]).copy()
+    ta["comment_len"] = ta["comment"].str.len()
+    ta["comment_words"] = ta["comment"].str.split().str.len()
+    ta["price_bracket"] = bracket(ta["price_eur"], COMMENT_PRICE_BRACKETS, "price_bracket")
+    return ta
@@ -0,0 +1,261 @@
+"""Charts for the six headline findings (formerly scripts/findings_charts.py)."""
+import os
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import numpy as np
+from matplotlib.lines import Line2D
+
+from . import features, gaps, instrument, paths
+from .style import ACCENT, CARD, EDGE, RED, SUBTLE, WHITE, YELLOW, apply_theme, save
+
+# Staggered annotation offsets so the overpriced labels don't overlap
+OVERPRICED_OFFSETS = [
+    (250, 0.6), (-400, 0.8), (250, -0.8), (-400, -0.5),
+    (300, 0.5), (-350, -0.7), (200, 0.4)
+]
+
+
+def price_bracket_ratings(booking):
+    return (
+        booking.groupby(features.price_bracket(booking, features.WIDE_PRICE_BRACKETS), observed=True)
+        .agg(mean_rating=("rating", "mean"), count=("hotel_name", "count"))
+        .reset_index()
+    )
+
+
+def words_by_price(tripadvisor):
+    return (
+        features.comments(tripadvisor).groupby("price_bracket", observed=True)
+        .agg(mean_words=("comment_words", "mean"), count=("hotel_name", "count"))
+        .reset_index()
+    )
+
+
+def price_vs_rating(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    """Finding 1: paying more does NOT guarantee a better experience."""
+    pb = price_bracket_ratings(booking)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    colors = [RED if r < 8.1 else YELLOW if r < 8.25 else ACCENT for r in pb["mean_rating"]]
+    bars = ax.bar(pb["price_bracket"].astype(str), pb["mean_rating"], color=colors, alpha=0.85, width=0.55)
+
+    for bar, rating, count in zip(bars, pb["mean_rating"], pb["count"]):
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.03,
+                f"{rating:.2f}", ha="center", fontsize=15, fontweight="bold", color=WHITE)
+        ax.text(bar.get_x() + bar.get_width()/2, 7.55,
+                f"n={count}", ha="center", fontsize=10, color=SUBTLE)
+
+    ax.set_ylim(7.5, 8.7)
+    ax.set_title("Paying More Does NOT Guarantee a Better Experience", fontsize=18, pad=20)
+    ax.set_xlabel("Price per Night (EUR)", fontsize=13)
+    ax.set_ylabel("Average Rating", fontsize=13)
+
+    # Annotation - positioned at the top, no overlap
+    ax.text(0.5, 0.92, "Only +0.28 rating difference between cheapest and most expensive",
+            transform=ax.transAxes, ha="center", fontsize=13, color=RED,
+            bbox=dict(boxstyle="round,pad=0.5", facecolor=CARD, edgecolor=RED, alpha=0.9))
+    return save(fig, out_dir, "finding_01_price_vs_rating.png")
+
+
+def room_score_gap(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    """Finding 2: the room is the strongest point for most hotels."""
+    has_both = gaps.compute(booking)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7), gridspec_kw={"width_ratios": [1, 1.4]})
+
+    room_higher, room_equal, room_lower = has_both.counts()
+
+    sizes = [room_higher, room_equal, room_lower]
+    pie_colors = [ACCENT, YELLOW, RED]
+
+    wedges, texts, autotexts = ax1.pie(
+        sizes, colors=pie_colors, startangle=90, autopct="",
+        textprops={"color": WHITE, "fontsize": 11},
+        pctdistance=0.75, labeldistance=1.15)
+
+    # Manual labels outside
+    labels_pie = [
+        f"Room > Overall\n{room_higher} ({room_higher/len(has_both)*100:.0f}%)",
+        f"Equal\n{room_equal} ({room_equal/len(has_both)*100:.0f}%)",
+        f"Room < Overall\n{room_lower} ({room_lower/len(has_both)*100:.0f}%)"
+    ]
+    for text, label in zip(texts, labels_pie):
+        text.set_text(label)
+        text.set_fontsize(10)
+
+    ax1.set_title("Room Score vs Overall Rating", fontsize=15, pad=15, color=WHITE)
+
+    ax2.hist(has_both.gap, bins=40, color=ACCENT, alpha=0.8, edgecolor="none")
+    ax2.axvline(0, color=RED, linestyle="--", linewidth=2, label="No gap (0)")
+    ax2.axvline(has_both.mean(), color=YELLOW, linestyle="--", linewidth=2,
+                label=f"Mean gap: +{has_both.mean():.2f}")
+    ax2.set_title("Distribution of Gap (Room - Overall)", fontsize=15, pad=15, color=WHITE)
+    ax2.set_xlabel("Gap (positive = room scores higher than overall)")
+    ax2.set_ylabel("Number of Hotels")
+    ax2.legend(facecolor=CARD, edgecolor=EDGE, fontsize=11, loc="upper right")
+    return save(fig, out_dir, "finding_02_room_score_gap.png")
+
+
+def best_worst_value(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    """Finding 3: Paris = worst value for money."""
+    loc_stats = features.location_stats(booking)
+    best10 = loc_stats.nlargest(10, "value_index")
+    worst10 = loc_stats.nsmallest(10, "value_index")
+
+    fig, (ax_worst, ax_best) = plt.subplots(1, 2, figsize=(16, 8))
+
+    worst10_sorted = worst10.sort_values("value_index", ascending=True)
+    bars_w = ax_worst.barh(worst10_sorted["location"], worst10_sorted["median_price"],
+                           color=RED, alpha=0.85, height=0.6)
+    for bar, rating in zip(bars_w, worst10_sorted["mean_rating"]):
+        ax_worst.text(bar.get_width() + 50, bar.get_y() + bar.get_height()/2,
+                      f"{rating:.1f}", va="center", fontsize=11, color=YELLOW, fontweight="bold")
+
+    ax_worst.set_title("WORST Value (high price, low rating)", fontsize=14, pad=15, color=RED)
+    ax_worst.set_xlabel("Median Price (EUR)", fontsize=11)
+    ax_worst.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:,.0f}"))
+    ax_worst.text(1.0, 1.02, "Rating", transform=ax_worst.transAxes, ha="right",
+                  fontsize=10, color=YELLOW, fontweight="bold")
+
+    best10_sorted = best10.sort_values("value_index", ascending=True)
+    bars_b = ax_best.barh(best10_sorted["location"], best10_sorted["median_price"],
+                          color=ACCENT, alpha=0.85, height=0.6)
+    for bar, rating in zip(bars_b, best10_sorted["mean_rating"]):
+        ax_best.text(bar.get_width() + 20, bar.get_y() + bar.get_height()/2,
+                     f"{rating:.1f}", va="center", fontsize=11, color=YELLOW, fontweight="bold")
+
+    ax_best.set_title("BEST Value (low price, high rating)", fontsize=14, pad=15, color=ACCENT)
+    ax_best.set_xlabel("Median Price (EUR)", fontsize=11)
+    ax_best.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:,.0f}"))
+    ax_best.text(1.0, 1.02, "Rating", transform=ax_best.transAxes, ha="right",
+                 fontsize=10, color=YELLOW, fontweight="bold")
+
+    fig.suptitle("Best vs Worst Value Destinations", fontsize=20, fontweight="bold",
+                 color=WHITE, y=1.02)
+    return save(fig, out_dir, "finding_03_best_worst_value.png")
+
+
+def overpriced_hotels(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    """Finding 4: most overpriced hotels by residual from the price trend."""
+    coeffs, bf = features.fit_price_rating(booking)
+    overpriced = bf[bf["num_reviews"] >= features.MIN_REVIEWS].nsmallest(7, "rating_residual")
+
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    ax.scatter(bf["price_eur"], bf["rating"], alpha=0.12, s=12, color=SUBTLE)
+
+    x_line = np.linspace(0, features.FIT_MAX_PRICE, 100)
+    ax.plot(x_line, np.polyval(coeffs, x_line), color=YELLOW, linewidth=2, linestyle="--",
+            label="Expected rating (trend)")
+
+    ax.scatter(overpriced["price_eur"], overpriced["rating"], color=RED, s=100, zorder=5,
+               edgecolors=WHITE, linewidth=0.8, label="Most overpriced")
+
+    for i, (_, row) in enumerate(overpriced.iterrows()):
+        name = row["hotel_name"][:22]
+        ox, oy = OVERPRICED_OFFSETS[i % len(OVERPRICED_OFFSETS)]
+        ax.annotate(
+            f"{name}\n{row['location']}\nRating: {row['rating']}",
+            xy=(row["price_eur"], row["rating"]),
+            xytext=(row["price_eur"] + ox, row["rating"] + oy),
+            fontsize=8, color=RED,
+            arrowprops=dict(arrowstyle="->", color=RED, lw=0.8),
+            bbox=dict(boxstyle="round,pad=0.3", facecolor=CARD, edgecolor=RED, alpha=0.85))
+
+    ax.set_title("Overpriced Hotels: High Price, Low Rating", fontsize=18, pad=20)
+    ax.set_xlabel("Price per Night (EUR)", fontsize=13)
+    ax.set_ylabel("Rating", fontsize=13)
+    ax.set_xlim(0, features.FIT_MAX_PRICE)
+    ax.set_ylim(1, 10.5)
+    ax.legend(facecolor=CARD, edgecolor=EDGE, fontsize=11, loc="lower right")
+    return save(fig, out_dir, "finding_04_overpriced_hotels.png")
+
+
+def popularity_bias(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    """Finding 5: rating and price by number of reviews."""
+    rb = (
+        booking.groupby(features.review_bracket(booking), observed=True)
+        .agg(mean_rating=("rating", "mean"), median_price=("price_eur", "median"),
+             count=("hotel_name", "count"))
+        .reset_index()
+    )
+
+    fig, ax1 = plt.subplots(figsize=(12, 7))
+
+    x = range(len(rb))
+    bars = ax1.bar(x, rb["mean_rating"], color=ACCENT, alpha=0.85, width=0.5)
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(rb["review_bracket"].astype(str), fontsize=12)
+    ax1.set_ylabel("Mean Rating", color=ACCENT, fontsize=13)
+    ax1.set_ylim(7.8, 8.6)
+
+    for bar, rating, count in zip(bars, rb["mean_rating"], rb["count"]):
+        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.02,
+                 f"{rating:.2f}", ha="center", fontsize=11, fontweight="bold", color=WHITE)
+        ax1.text(bar.get_x() + bar.get_width()/2, 7.83,
+                 f"n={count}", ha="center", fontsize=9, color=SUBTLE)
+
+    ax2 = ax1.twinx()
+    ax2.plot(x, rb["median_price"], color=RED, marker="o", linewidth=2.5, markersize=10)
+    ax2.set_ylabel("Median Price (EUR)", color=RED, fontsize=13)
+    ax2.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"EUR {v:,.0f}"))
+
+    ax1.set_title("Rating & Price by Number of Reviews", fontsize=18, pad=20)
+    ax1.set_xlabel("Number of Reviews", fontsize=13)
+
+    legend_elements = [
+        Line2D([0], [0], color=ACCENT, lw=8, alpha=0.85, label="Mean Rating"),
+        Line2D([0], [0], color=RED, lw=2.5, marker="o", markersize=8, label="Median Price (EUR)")
+    ]
+    ax1.legend(handles=legend_elements, facecolor=CARD, edgecolor=EDGE,
+               fontsize=11, loc="upper left")
+    return save(fig, out_dir, "finding_05_popularity_bias.png")
+
+
+def review_length(booking, tripadvisor, out_dir=paths.CHARTS_DIR):
+    """Finding 6: cheaper hotels get longer reviews."""
+    cp = words_by_price(tripadvisor)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    colors_gradient = [ACCENT, "#2ECC71", YELLOW, "#E67E22", RED]
+    bars = ax.bar(cp["price_bracket"].astype(str), cp["mean_words"],
+                  color=colors_gradient, alpha=0.85, width=0.55)
+
+    for bar, words, count in zip(bars, cp["mean_words"], cp["count"]):
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.8,
+                f"{words:.0f} words", ha="center", fontsize=14, fontweight="bold", color=WHITE)
+        ax.text(bar.get_x() + bar.get_width()/2, 1.5,
+                f"n={count}", ha="center", fontsize=10, color=SUBTLE)
+
+    ax.set_title("Cheaper Hotels Get Longer Reviews", fontsize=18, pad=20)
+    ax.set_xlabel("Price per Night (EUR)", fontsize=13)
+    ax.set_ylabel("Average Words per Review", fontsize=13)
+    ax.set_ylim(0, 35)
+
+    ax.text(0.5, 0.92, "Budget guests write 2x more words than luxury guests  |  Spearman r = -0.43",
+            transform=ax.transAxes, ha="center", fontsize=12, color=RED,
+            bbox=dict(boxstyle="round,pad=0.5", facecolor=CARD, edgecolor=RED, alpha=0.9))
+    return save(fig, out_dir, "finding_06_review_length.png")
+
+
+FINDINGS = {
+    "price-vs-rating": price_vs_rating,
+    "room-score-gap": room_score_gap,
+    "best-worst-value": best_worst_value,
+    "overpriced-hotels": overpriced_hotels,
+    "popularity-bias": popularity_bias,
+    "review-length": review_length,
+}
+
+
+def render_all(booking, tripadvisor, out_dir=paths.CHARTS_DIR, names=None):
+    apply_theme()
+    os.makedirs(out_dir, exist_ok=True)
+    names = names or list(FINDINGS)
+    for i, name in enumerate(names, 1):
+        with instrument.span(f"finding.{name}"):
+            FINDINGS[name](booking, tripadvisor, out_dir)
+        print(f"{i}/{len(names)} saved")
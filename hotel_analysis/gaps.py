@@ -0,0 +1,163 @@
+"""Room score vs overall rating gaps, per hotel and per cohort.
+
+``gap = room_score - rating`` for the hotels with a room score. ``compute``
+reads both columns as NumPy arrays and keeps only the gaps and the row
+positions they came from; the frame is never copied, and rows are taken from
+it only for the hotels that get reported.
+
+``cohorts`` describes the gap distribution of every location, room category
+and price bracket in one grouped pass. The gaps are sorted once; a stable sort
+of a dimension's integer codes in that order leaves each cohort's gaps
+contiguous and already sorted, so counts, sums, shares and quantiles come from
+``np.add.reduceat`` and slice offsets.
+
+``worst`` returns the biggest disappointers, the most negative gaps, overall
+or per cohort. ``np.partition`` finds the n-th smallest gap without sorting
+the rest; only the gaps up to it are sorted. Ties keep row order, as
+``DataFrame.nsmallest`` does.
+
+    summary(booking)                           # the report's section 3
+    cohorts(booking)                           # one row per dimension and cohort
+    worst(booking, by="location", n=3)         # 3 most negative gaps per location
+"""
+import numpy as np
+import pandas as pd
+
+from . import features, instrument
+
+DIMENSIONS = ["location", "room_category", "price_bracket"]
+QUANTILES = {"p10_gap": 0.1, "median_gap": 0.5, "p90_gap": 0.9}
+WORST = 10
+
+
+class Gaps:
+    """Gaps of the hotels with a room score and their row positions in the frame."""
+
+    def __init__(self, positions, gap):
+        self.positions = positions
+        self.gap = gap
+
+    def __len__(self):
+        return len(self.gap)
+
+    def counts(self):
+        """Hotels whose room score is above, equal to and below their rating."""
+        return int((self.gap > 0).sum()), int((self.gap == 0).sum()), int((self.gap < 0).sum())
+
+    def mean(self):
+        return np.nanmean(self.gap) if len(self.gap) else np.nan
+
+    def rows(self, booking, order):
+        """The rows of ``booking`` behind the gaps at ``order``, with a ``gap`` column."""
+        return booking.iloc[self.positions[order]].assign(gap=self.gap[order])
+
+
+@instrument.timed("gaps.compute")
+def compute(booking):
+    room = booking["room_score"].to_numpy(dtype=float)
+    positions = np.flatnonzero(~np.isnan(room))
+    return Gaps(positions, room[positions] - booking["rating"].to_numpy(dtype=float)[positions])
+
+
+def _smallest(values, n):
+    """Positions of the ``n`` smallest values, ascending, earlier positions first among ties."""
+    present = ~np.isnan(values)
+    if n < present.sum():
+        cut = np.partition(values, n - 1)[n - 1]
+        present &= values <= cut
+    candidates = np.flatnonzero(present)
+    return candidates[np.lexsort((candidates, values[candidates]))][:n]
+
+
+def _groups(booking, dimension, positions):
+    """``(codes, names)`` of the rows at ``positions`` in ``dimension``; code -1 where it is missing."""
+    if dimension == "room_category":
+        # Simplify each distinct room type once; code -1 (missing) picks the appended last entry
+        types, distinct = pd.factorize(booking["room_type"].iloc[positions])
+        categories = np.array([features.simplify_room(t) for t in distinct] + [features.simplify_room(np.nan)])
+        labels = pd.Series(categories[types])
+    elif dimension == "price_bracket":
+        labels = features.price_bracket(booking[["price_eur"]].iloc[positions])
+    else:
+        labels = booking[dimension].iloc[positions]
+    return pd.factorize(labels, sort=True)
+
+
+def summary(booking, n=WORST):
+    """Hotels with both scores, mean gap, room higher/lower counts and shares, and the ``n`` worst rooms."""
+    gaps = compute(booking)
+    higher, _, lower = gaps.counts()
+    hotels = len(gaps)
+    return {
+        "hotels": hotels,
+        "mean_gap": gaps.mean(),
+        "room_higher": higher,
+        "room_higher_pct": higher / hotels * 100 if hotels else np.nan,
+        "room_lower": lower,
+        "room_lower_pct": lower / hotels * 100 if hotels else np.nan,
+        "worst_rooms": gaps.rows(booking, _smallest(gaps.gap, n)),
+    }
+
+
+@instrument.timed("gaps.cohorts")
+def cohorts(booking, dimensions=DIMENSIONS, min_count=features.MIN_LOCATION_HOTELS):
+    """Gap distribution of every cohort with at least ``min_count`` hotels.
+
+    One row per dimension and cohort: hotels, mean, std, the ``QUANTILES`` and
+    the percentage of hotels whose room scores above, equal to or below the
+    rating.
+    """
+    gaps = compute(booking)
+    present = ~np.isnan(gaps.gap)
+    positions, gap = gaps.positions[present], gaps.gap[present]
+    by_gap = np.argsort(gap, kind="stable")
+    tables = []
+    for dimension in dimensions:
+        codes, names = _groups(booking, dimension, positions)
+        order = by_gap[np.argsort(codes[by_gap], kind="stable")]
+        order = order[codes[order] >= 0]
+        sorted_gap = gap[order]
+        starts = np.searchsorted(codes[order], np.arange(len(names)))
+        count = np.diff(np.r_[starts, len(order)])
+        if not len(order):
+            continue
+        # Every cohort holds a gap (factorize names only labels it saw), so no slice is empty
+        mean = np.add.reduceat(sorted_gap, starts) / count
+        squares = np.add.reduceat((sorted_gap - np.repeat(mean, count)) ** 2, starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(squares / (count - 1))
+        table = pd.DataFrame({"dimension": dimension, "cohort": np.asarray(names), "hotels": count,
+                              "mean_gap": mean, "std_gap": std})
+        for column, q in QUANTILES.items():
+            # Linear interpolation between the ranks around q * (n - 1), as Series.quantile
+            rank = q * (count - 1)
+            lower = sorted_gap[starts + np.floor(rank).astype(int)]
+            upper = sorted_gap[starts + np.ceil(rank).astype(int)]
+            table[column] = lower + (rank - np.floor(rank)) * (upper - lower)
+        for column, sign in (("room_higher_pct", 1), ("room_equal_pct", 0), ("room_lower_pct", -1)):
+            table[column] = np.add.reduceat((np.sign(sorted_gap) == sign).astype(np.int64), starts) / count * 100
+        table = table[count >= min_count]
+        tables.append(table)
+    return pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
+
+
+@instrument.timed("gaps.worst")
+def worst(booking, by=None, n=WORST, min_count=1):
+    """The ``n`` most negative gaps, overall or within each cohort of the dimension ``by``.
+
+    Per cohort (with at least ``min_count`` hotels), rows come grouped by
+    cohort in sorted cohort order, worst first, with the cohort in ``by``.
+    """
+    gaps = compute(booking)
+    if by is None:
+        return gaps.rows(booking, _smallest(gaps.gap, n))
+    codes, names = _groups(booking, by, gaps.positions)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    picked = [np.zeros(0, dtype=np.int64)]
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if end - start >= max(min_count, 1):
+            group = order[start:end]
+            picked.append(group[_smallest(gaps.gap[group], n)])
+    picked = np.concatenate(picked)
+    return gaps.rows(booking, picked).assign(**{by: np.asarray(names)[codes[picked]]})
@@ -0,0 +1,220 @@
+"""Append-only price history of repeated Booking.com scrapes.
+
+One partition per scrape date (``data/history/YYYY-MM-DD.npz``) stores the
+day's hotels compactly, one row per hotel: a hotel listed with several rooms
+is stored at its cheapest room's price, rating and review count.
+
+* hotels are dictionary-encoded as integer keys (``keys.csv`` maps a key to
+  its hotel name and location and is only ever appended to); each partition
+  stores its keys sorted and delta-encoded;
+* prices are integer cents. The first scrape of each month is a keyframe with
+  absolute prices; later scrapes that month store the difference to the
+  keyframe price of the same hotel, which is mostly zero and compresses well;
+* ratings are tenths in one byte and review counts use the smallest integer
+  type that fits.
+
+Queries list the partitions from their file names and open only those inside
+the requested date window (plus that month's keyframe), e.g.
+
+    store = PriceHistory()
+    store.append(booking, "2026-10-19")
+    store.median_price_by_location(days=30)
+    store.price_movers(days=30, min_rise=0.2)
+"""
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import paths
+
+HISTORY_DIR = os.path.join(paths.ROOT, "data", "history")
+KEY_COLUMNS = ["hotel_name", "location"]
+NO_RATING = 255
+NO_REVIEWS = -1
+
+
+def _smallest_int(values):
+    """``values`` cast to the narrowest signed integer dtype that holds them."""
+    lo, hi = (int(values.min()), int(values.max())) if len(values) else (0, 0)
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return values.astype(dtype)
+    return values.astype(np.int64)
+
+
+def _as_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value))
+
+
+class PriceHistory:
+    """Date-partitioned store of hotel prices, ratings and review counts."""
+
+    def __init__(self, root=HISTORY_DIR):
+        self.root = root
+        self.keys_path = os.path.join(root, "keys.csv")
+        self._keyframes = {}
+        self.partitions_read = []
+        if os.path.exists(self.keys_path):
+            self.keys = pd.read_csv(self.keys_path, dtype={"hotel_name": str, "location": str})
+        else:
+            self.keys = pd.DataFrame(columns=KEY_COLUMNS)
+        self._key_index = {k: i for i, k in enumerate(zip(self.keys["hotel_name"], self.keys["location"]))}
+
+    def _path(self, date):
+        return os.path.join(self.root, f"{date.isoformat()}.npz")
+
+    def dates(self):
+        """Stored scrape dates, oldest first."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(datetime.date.fromisoformat(name[:-4]) for name in os.listdir(self.root)
+                      if name.endswith(".npz"))
+
+    def _window(self, days, end):
+        dates = self.dates()
+        end = _as_date(end) if end else (dates[-1] if dates else datetime.date.today())
+        start = end - datetime.timedelta(days=days - 1)
+        return [d for d in dates if start <= d <= end]
+
+    # -- writing ------------------------------------------------------------
+
+    def _encode_keys(self, frame):
+        new = [k for k in dict.fromkeys(zip(frame["hotel_name"], frame["location"]))
+               if k not in self._key_index]
+        if new:
+            added = pd.DataFrame(new, columns=KEY_COLUMNS)
+            added.to_csv(self.keys_path, mode="a", header=not os.path.exists(self.keys_path), index=False)
+            for key in new:
+                self._key_index[key] = len(self._key_index)
+            self.keys = pd.concat([self.keys, added], ignore_index=True)
+        return np.array([self._key_index[k] for k in zip(frame["hotel_name"], frame["location"])],
+                        dtype=np.int64)
+
+    def append(self, booking, date):
+        """Store one scrape; dates must be later than every stored one.
+
+        A hotel (name and location) with several rows keeps its cheapest one.
+        """
+        date = _as_date(date)
+        dates = self.dates()
+        if dates and date <= dates[-1]:
+            raise ValueError(f"history is append-only: {date} is not after {dates[-1]}")
+        os.makedirs(self.root, exist_ok=True)
+
+        frame = (booking.dropna(subset=KEY_COLUMNS + ["price_eur"])
+                 .sort_values("price_eur", kind="stable").drop_duplicates(KEY_COLUMNS))
+        keys = self._encode_keys(frame)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        price = np.round(frame["price_eur"].to_numpy(dtype=float)[order] * 100).astype(np.int64)
+        rating = frame["rating"].to_numpy(dtype=float)[order]
+        reviews = frame["num_reviews"].to_numpy(dtype=float)[order]
+
+        month = [d for d in dates if (d.year, d.month) == (date.year, date.month)]
+        base = month[0] if month else date
+        if month:
+            base_keys, base_price = self._keyframe(base)
+            price = price - self._align(keys, base_keys, base_price)
+
+        np.savez_compressed(
+            self._path(date),
+            base=np.array(base.isoformat()),
+            keys=_smallest_int(np.diff(keys, prepend=0)),
+            price=_smallest_int(price),
+            rating=np.where(np.isnan(rating), NO_RATING, np.round(rating * 10)).astype(np.uint8),
+            reviews=_smallest_int(np.where(np.isnan(reviews), NO_REVIEWS, reviews).astype(np.int64)),
+        )
+        return self._path(date)
+
+    # -- reading ------------------------------------------------------------
+
+    @staticmethod
+    def _align(keys, base_keys, base_price):
+        """Keyframe price of each key, 0 for hotels missing from the keyframe."""
+        if not len(base_keys):
+            return np.zeros(len(keys), dtype=np.int64)
+        pos = np.minimum(np.searchsorted(base_keys, keys), len(base_keys) - 1)
+        return np.where(base_keys[pos] == keys, base_price[pos], 0)
+
+    def _load(self, date):
+        self.partitions_read.append(date)
+        with np.load(self._path(date)) as f:
+            return {name: f[name] for name in f.files}
+
+    def _keyframe(self, date):
+        if date not in self._keyframes:
+            part = self._load(date)
+            self._keyframes[date] = (np.cumsum(part["keys"], dtype=np.int64), part["price"].astype(np.int64))
+        return self._keyframes[date]
+
+    def read(self, date):
+        """One scrape as a frame of key, price_eur, rating and num_reviews."""
+        date = _as_date(date)
+        part = self._load(date)
+        keys = np.cumsum(part["keys"], dtype=np.int64)
+        price = part["price"].astype(np.int64)
+        base = datetime.date.fromisoformat(str(part["base"]))
+        if base == date:
+            self._keyframes[date] = (keys, price)
+        else:
+            price = price + self._align(keys, *self._keyframe(base))
+        rating = part["rating"].astype(float)
+        reviews = part["reviews"].astype(float)
+        return pd.DataFrame({
+            "key": keys,
+            "price_eur": price / 100,
+            "rating": np.where(part["rating"] == NO_RATING, np.nan, rating / 10),
+            "num_reviews": np.where(part["reviews"] == NO_REVIEWS, np.nan, reviews),
+        })
+
+    def scan(self, days=30, end=None):
+        """All scrapes of the ``days`` days up to ``end`` (default: the latest) as one frame."""
+        parts = []
+        for date in self._window(days, end):
+            part = self.read(date)
+            part.insert(0, "date", date)
+            parts.append(part)
+        if not parts:
+            return pd.DataFrame(columns=["date", "key", "price_eur", "rating", "num_reviews"])
+        return pd.concat(parts, ignore_index=True)
+
+    def with_hotels(self, frame):
+        """``frame`` with the hotel name and location of each key."""
+        return self.keys.iloc[frame["key"]].reset_index(drop=True).join(frame.reset_index(drop=True))
+
+    # -- queries ------------------------------------------------------------
+
+    def median_price_by_location(self, days=30, end=None):
+        """Median price and number of observations per location over the window."""
+        scans = self.scan(days, end)
+        location = self.keys["location"].to_numpy(dtype=object)[scans["key"].to_numpy(dtype=np.int64)]
+        return (
+            scans.groupby(location)
+            .agg(median_price=("price_eur", "median"), observations=("price_eur", "size"),
+                 hotels=("key", "nunique"))
+            .rename_axis("location")
+            .reset_index()
+        )
+
+    def price_movers(self, days=30, end=None, min_rise=0.2, max_rating_change=0.0):
+        """Hotels whose price rose by more than ``min_rise`` while the rating
+        moved by at most ``max_rating_change`` between the first and the last
+        scrape of the window. Only those two partitions (and their keyframes)
+        are read.
+        """
+        window = self._window(days, end)
+        if len(window) < 2:
+            return pd.DataFrame()
+        first = self.read(window[0])
+        last = self.read(window[-1])
+        both = first.merge(last, on="key", suffixes=("_start", "_end"))
+        both["rise"] = both["price_eur_end"] / both["price_eur_start"] - 1
+        flat = (both["rating_end"] - both["rating_start"]).abs() <= max_rating_change + 1e-9
+        movers = both[(both["rise"] > min_rise) & flat].sort_values("rise", ascending=False)
+        columns = ["key", "price_eur_start", "price_eur_end", "rise", "rating_start", "rating_end"]
+        return self.with_hotels(movers[columns]).drop(columns="key")
@@ -0,0 +1,119 @@
+"""Per-cohort top-k leaderboards (best value, over- and underpriced).
+
+Instead of a ``groupby(...).nlargest(k)`` per grouping, each board sorts all
+hotels by its score once; every grouping then only needs a stable sort of the
+group codes in that order, which keeps each group's hotels best-first, and the
+rank inside a group is the distance from the group's first row. All groupings
+share the same score ordering.
+
+The long-format result is written to ``output/tables/leaderboards.csv`` and
+``load()`` returns it indexed by (board, grouping, group) for direct lookups.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import features, paths
+
+LEADERBOARDS_CSV = os.path.join(paths.TABLES_DIR, "leaderboards.csv")
+
+# board -> (score column, descending)
+BOARDS = {
+    "best_value": ("value_score", True),
+    "overpriced": ("rating_residual", False),
+    "underpriced": ("rating_residual", True),
+}
+
+# grouping name -> cohort columns ([] = one global board)
+GROUPINGS = {
+    "all": [],
+    "location": ["location"],
+    "room_category": ["room_category"],
+    "price_bracket": ["price_bracket"],
+    "review_score": ["review_score"],
+    "bed_type": ["bed_type"],
+    "location+room_category": ["location", "room_category"],
+    "location+price_bracket": ["location", "price_bracket"],
+}
+
+HOTEL_COLUMNS = ["hotel_name", "location", "room_type", "price_eur", "rating", "num_reviews"]
+
+
+def cohorts(booking, min_reviews=features.MIN_REVIEWS):
+    """Scored hotels with at least ``min_reviews`` reviews and every cohort column."""
+    hotels = features.value_scores(booking)
+    _, fit = features.fit_price_rating(hotels)
+    hotels["rating_residual"] = fit["rating_residual"]
+    hotels["room_category"] = features.room_category(hotels)
+    hotels["price_bracket"] = features.price_bracket(hotels)
+    hotels = hotels[hotels["num_reviews"] >= min_reviews].reset_index(drop=True)
+    hotels["num_reviews"] = hotels["num_reviews"].astype("int64")
+    return hotels
+
+
+def _group_codes(hotels, columns):
+    if not columns:
+        return np.zeros(len(hotels), dtype=np.int64), ["all"]
+    # ngroup() numbers groups in size()'s index order; rows with a missing
+    # cohort value get NaN, mapped to -1 to leave them out of that grouping
+    groups = hotels.groupby(columns, observed=True)
+    keys = groups.size().index
+    labels = [" | ".join(map(str, key)) if isinstance(key, tuple) else str(key) for key in keys]
+    return groups.ngroup().fillna(-1).to_numpy(dtype=np.int64), labels
+
+
+def top_k_by_group(order, codes, k):
+    """First ``k`` rows of each group, given a best-first row ``order``.
+
+    Returns ``(rows, ranks)`` grouped by code, each group still best-first;
+    rows with code -1 are skipped.
+    """
+    grouped = order[np.argsort(codes[order], kind="stable")]
+    grouped = grouped[codes[grouped] >= 0]
+    group = codes[grouped]
+    starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    rank = np.arange(len(grouped)) - np.repeat(starts, np.diff(np.r_[starts, len(grouped)]))
+    keep = rank < k
+    return grouped[keep], rank[keep] + 1
+
+
+def build(booking, k=10, boards=BOARDS, groupings=GROUPINGS, min_reviews=features.MIN_REVIEWS):
+    hotels = cohorts(booking, min_reviews)
+    codes = {name: _group_codes(hotels, columns) for name, columns in groupings.items()}
+
+    parts = []
+    for board, (column, descending) in boards.items():
+        score = hotels[column].to_numpy(dtype=float)
+        scored = np.flatnonzero(~np.isnan(score))
+        key = -score[scored] if descending else score[scored]
+        order = scored[np.argsort(key, kind="stable")]
+        for grouping, (group_codes, labels) in codes.items():
+            rows, rank = top_k_by_group(order, group_codes, k)
+            part = hotels.loc[rows, HOTEL_COLUMNS].reset_index(drop=True)
+            part.insert(0, "board", board)
+            part.insert(1, "grouping", grouping)
+            part.insert(2, "group", np.asarray(labels, dtype=object)[group_codes[rows]])
+            part.insert(3, "rank", rank)
+            part["score"] = score[rows]
+            parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+
+def save(table, path=LEADERBOARDS_CSV):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table.to_csv(path, index=False)
+    return path
+
+
+def load(path=LEADERBOARDS_CSV):
+    table = pd.read_csv(path, dtype={"group": str})
+    return table.set_index(["board", "grouping", "group"]).sort_index()
+
+
+def lookup(table, board, grouping, group):
+    """Leaderboard rows for one cohort, best first (empty if the cohort is unknown)."""
+    key = (board, grouping, group)
+    if key not in table.index:
+        return table.iloc[:0]
+    return table.loc[[key]].reset_index()
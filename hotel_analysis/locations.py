@@ -0,0 +1,201 @@
+"""Location hierarchy: neighbourhood -> town -> region.
+
+Booking.com locations are either a town ("Ao Nang Beach") or a neighbourhood
+and its town ("Chaweng City Center , Chaweng"). ``LocationHierarchy`` parses
+and normalizes them into one node table with integer parent pointers. Rows
+point at their finest node, which is the town itself when no neighbourhood is
+given.
+
+Aggregates are summed per finest node once and rolled up to any level
+through the ancestor arrays with ``np.bincount``, so a town's figures include
+all of its neighbourhoods without re-grouping strings. The data has no country
+column, so regions come from an optional ``data/regions.csv`` (columns
+``town,region``); unlisted towns belong to ``UNASSIGNED``. No such file ships,
+so the command line only offers the region level once one is added.
+
+The hierarchy has exactly three levels. A town listed as a neighbourhood of
+another town is nested under it, and its own neighbourhoods are flattened
+into that outer town: "Silom, Bang Rak" becomes the neighbourhood "Silom" of
+Bangkok, next to "Bang Rak", and its rows do not count towards Bang Rak.
+"""
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from . import features, paths
+
+REGIONS_CSV = paths.REGIONS
+
+LEVELS = ["neighbourhood", "town", "region"]
+NEIGHBOURHOOD, TOWN, REGION = range(3)
+UNASSIGNED = "(unassigned)"
+
+
+def normalize(name):
+    """Canonical spelling: NFC, single spaces, no space before commas."""
+    name = unicodedata.normalize("NFC", str(name))
+    name = re.sub(r"\s+", " ", name).strip()
+    return re.sub(r"\s*,\s*", ", ", name)
+
+
+def split_location(name):
+    """``(neighbourhood, town)`` of a normalized location; neighbourhood may be None."""
+    head, sep, town = name.rpartition(", ")
+    return (head or None) if sep else None, town
+
+
+def load_regions(path=REGIONS_CSV):
+    """Town -> region mapping from ``path`` (empty if the file does not exist)."""
+    if not os.path.exists(path):
+        return {}
+    table = pd.read_csv(path)
+    return {normalize(t).casefold(): r for t, r in zip(table["town"], table["region"])}
+
+
+class LocationHierarchy:
+    """Node table (``names``, ``level``, ``parent``) plus the finest node of every row."""
+
+    def __init__(self, locations, regions=None):
+        regions = load_regions() if regions is None else regions
+        raw = pd.Series(locations, dtype=object)
+        distinct = raw.dropna().unique()
+
+        parsed = {loc: split_location(normalize(loc)) for loc in distinct}
+
+        # A "town" that is also listed as a neighbourhood of exactly one other
+        # town ("Silom, Bang Rak" vs "Bang Rak, Bangkok") is nested under it
+        towns_of = {}
+        for neighbourhood, town in parsed.values():
+            if neighbourhood:
+                towns_of.setdefault(neighbourhood.casefold(), set()).add(town)
+        for loc, (neighbourhood, town) in parsed.items():
+            outer = towns_of.get(town.casefold(), set())
+            if len(outer) == 1 and next(iter(outer)).casefold() != town.casefold():
+                parsed[loc] = (neighbourhood or town, next(iter(outer)))
+
+        # Nodes are keyed case-insensitively; each displays its most common spelling
+        spelling, keys = {}, {}
+        counts = raw.value_counts()
+        for loc, (neighbourhood, town) in parsed.items():
+            town_key = ("town", town.casefold())
+            leaf_key = ("neighbourhood", neighbourhood.casefold(), town_key) if neighbourhood else town_key
+            keys[loc] = (leaf_key, town_key)
+            for key, label in ((town_key, town), (leaf_key, neighbourhood)):
+                if label is not None:
+                    spelling.setdefault(key, {}).setdefault(label, 0)
+                    spelling[key][label] += counts[loc]
+
+        def display(key):
+            return max(spelling[key].items(), key=lambda item: (item[1], item[0]))[0]
+
+        town_keys = sorted({town for _, town in keys.values()}, key=lambda k: display(k).casefold())
+        region_names = sorted({regions.get(k[1], UNASSIGNED) for k in town_keys})
+        leaf_keys = sorted({leaf for leaf, _ in keys.values() if leaf[0] == "neighbourhood"},
+                           key=lambda k: (display(k[2]).casefold(), display(k).casefold()))
+
+        # Parents always precede their children: regions, towns, neighbourhoods
+        names, level, parent, index = [], [], [], {}
+        for name in region_names:
+            index[("region", name)] = len(names)
+            names.append(name)
+            level.append(REGION)
+            parent.append(-1)
+        for key in town_keys:
+            index[key] = len(names)
+            names.append(display(key))
+            level.append(TOWN)
+            parent.append(index[("region", regions.get(key[1], UNASSIGNED))])
+        for key in leaf_keys:
+            index[key] = len(names)
+            names.append(f"{display(key)}, {display(key[2])}")
+            level.append(NEIGHBOURHOOD)
+            parent.append(index[key[2]])
+
+        self.names = np.array(names, dtype=object)
+        self.level = np.array(level, dtype=np.int8)
+        self.parent = np.array(parent, dtype=np.int32)
+        leaf_of = {loc: index[leaf] for loc, (leaf, _) in keys.items()}
+        self.row_node = raw.map(leaf_of).fillna(-1).to_numpy(dtype=np.int32)
+
+        # ancestors[lvl][node]: the node's ancestor-or-self at level lvl, -1 if
+        # the node sits above that level. ``up`` walks every node one level up
+        # per step, so each level costs one vectorized lookup.
+        self.ancestors = {}
+        up = np.arange(len(names), dtype=np.int32)
+        for lvl in range(len(LEVELS)):
+            self.ancestors[lvl] = np.where(self.level <= lvl, up, -1).astype(np.int32)
+            if lvl + 1 < len(LEVELS):
+                up = np.where(self.level <= lvl, self.parent[up], up)
+
+    def nodes(self, level):
+        return np.flatnonzero(self.level == level)
+
+    def row_codes(self, level):
+        """Node at ``level`` for every row (-1 when the row is not that fine)."""
+        codes = np.full(len(self.row_node), -1, dtype=np.int32)
+        known = self.row_node >= 0
+        codes[known] = self.ancestors[level][self.row_node[known]]
+        return codes
+
+    def rollup(self, values):
+        """Per-node sums of ``values`` (one entry per row, NaN ignored) at every level.
+
+        The rows are summed once into their finest nodes; each level then adds
+        those leaf sums into its ancestors in one ``bincount``.
+        """
+        values = np.asarray(values, dtype=float)
+        ok = (self.row_node >= 0) & ~np.isnan(values)
+        n = len(self.names)
+        leaf = np.bincount(self.row_node[ok], weights=values[ok], minlength=n)
+        totals = np.zeros(n)
+        for lvl in range(len(LEVELS)):
+            anc = self.ancestors[lvl]
+            has = anc >= 0
+            totals += np.bincount(anc[has], weights=leaf[has], minlength=n)
+        return totals
+
+    def median(self, values, level):
+        """Exact per-node median of ``values`` at ``level`` (NaN where empty)."""
+        values = np.asarray(values, dtype=float)
+        codes = self.row_codes(level)
+        ok = (codes >= 0) & ~np.isnan(values)
+        medians = np.full(len(self.names), np.nan)
+        if not ok.any():
+            return medians
+        order = np.lexsort((values[ok], codes[ok]))
+        codes, values = codes[ok][order], values[ok][order]
+        nodes, starts, size = np.unique(codes, return_index=True, return_counts=True)
+        medians[nodes] = (values[starts + (size - 1) // 2] + values[starts + size // 2]) / 2
+        return medians
+
+
+def location_stats(booking, level="town", min_count=features.MIN_LOCATION_HOTELS, hierarchy=None):
+    """``features.location_stats`` at any hierarchy level, with parents rolled up.
+
+    At the town level every town includes all of its neighbourhoods, so small
+    neighbourhoods count towards their town instead of being dropped.
+    """
+    hierarchy = hierarchy or LocationHierarchy(booking["location"])
+    lvl = LEVELS.index(level)
+    count = hierarchy.rollup(booking["hotel_name"].notna())
+    rating_n = hierarchy.rollup(booking["rating"].notna())
+    room_n = hierarchy.rollup(booking["room_score"].notna())
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_rating = hierarchy.rollup(booking["rating"]) / rating_n
+        mean_room_score = hierarchy.rollup(booking["room_score"]) / room_n
+    nodes = hierarchy.nodes(lvl)
+    parent = hierarchy.parent[nodes]
+    loc = pd.DataFrame({
+        level: hierarchy.names[nodes],
+        "parent": np.where(parent >= 0, hierarchy.names[np.maximum(parent, 0)], None),
+        "median_price": hierarchy.median(booking["price_eur"], lvl)[nodes],
+        "mean_rating": mean_rating[nodes],
+        "mean_room_score": mean_room_score[nodes],
+        "count": count[nodes].astype(np.int64),
+    })
+    loc = loc[loc["count"] >= min_count].reset_index(drop=True)
+    loc["value_index"] = (loc["mean_rating"] / loc["median_price"]) * 100
+    return loc
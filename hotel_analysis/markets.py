@@ -0,0 +1,205 @@
+"""Per-market fan-out/fan-in runs of the deep analysis.
+
+A market is a town of the location hierarchy (``locations.LocationHierarchy``),
+or a region with ``level="region"``; markets with fewer than ``MIN_HOTELS``
+Booking.com rows are left out. TripAdvisor rows carry no location, so a row
+joins the market of the Booking.com hotel with the same name, else the market
+whose name appears in its hotel name ("Novotel Bangkok Sukhumvit"), else none.
+
+``run`` fans the markets out to a process pool, largest first so that one
+big market does not start last. Both frames are put in shared memory once
+(``shared.SharedFrame``); a task carries only its market's row positions and
+the worker attaches to the frames and takes those rows. Each worker writes the
+report, the overview charts and the finding charts of its market to
+``<out_dir>/<slug>/`` and returns one summary row and its
+rating-by-price-bracket table, so almost nothing comes back either. The fan-in
+joins them into ``comparison.csv`` and ``price_brackets.csv``:
+
+    from hotel_analysis import data, markets
+    comparison = markets.run(*data.load_cleaned(), workers=8)
+"""
+import contextlib
+import io
+import os
+import re
+import time
+import unicodedata
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from . import features, instrument, locations, paths, shared
+
+MARKETS_DIR = os.path.join(paths.ROOT, "output", "markets")
+MIN_HOTELS = 20
+COMPARISON_COLUMNS = [
+    "market", "hotels", "tripadvisor_rows", "median_price", "mean_rating", "value_index",
+    "spearman_price_rating", "spearman_p", "room_higher_pct", "spearman_reviews_rating",
+    "spearman_price_words", "best_value_hotel", "seconds",
+]
+
+
+def slug(market):
+    """Directory name of ``market``: ASCII, lower case, words joined by dashes."""
+    text = unicodedata.normalize("NFKD", market).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "market"
+
+
+def booking_markets(booking, level="town", hierarchy=None):
+    """Market name of every Booking.com row (None for rows without a location)."""
+    hierarchy = hierarchy or locations.LocationHierarchy(booking["location"])
+    codes = hierarchy.row_codes(locations.LEVELS.index(level))
+    names = np.where(codes >= 0, hierarchy.names[np.maximum(codes, 0)], None)
+    return pd.Series(names, index=booking.index, dtype=object, name="market")
+
+
+def tripadvisor_markets(tripadvisor, booking, market_of, markets):
+    """Market of every TripAdvisor row: by hotel name, else by a market named in it."""
+    def key(names):
+        return names.astype(str).str.strip().str.casefold()
+
+    by_hotel = pd.Series(market_of.to_numpy(), index=key(booking["hotel_name"]))
+    by_hotel = by_hotel[by_hotel.isin(markets) & ~by_hotel.index.duplicated()]
+    found = key(tripadvisor["hotel_name"]).map(by_hotel)
+    pattern = "|".join(re.escape(m) for m in sorted(markets, key=len, reverse=True))
+    if pattern:
+        named = tripadvisor["hotel_name"].astype(str).str.extract(rf"\b({pattern})\b", flags=re.IGNORECASE)[0]
+        canonical = {m.casefold(): m for m in markets}
+        found = found.fillna(named.str.casefold().map(canonical))
+    return found.rename("market")
+
+
+def partition_rows(booking, tripadvisor, level="town", min_hotels=MIN_HOTELS):
+    """``{market: (booking positions, tripadvisor positions)}`` for every market with
+    ``min_hotels`` rows, largest first."""
+    market_of = booking_markets(booking, level)
+    counts = market_of.value_counts()
+    markets = list(counts[counts >= min_hotels].index)
+    ta_market = tripadvisor_markets(tripadvisor, booking, market_of, markets)
+    booking_rows = pd.Series(np.arange(len(booking))).groupby(market_of.to_numpy()).indices
+    tripadvisor_rows = pd.Series(np.arange(len(tripadvisor))).groupby(ta_market.to_numpy()).indices
+    empty = np.array([], dtype=np.int64)
+    return {m: (booking_rows[m], tripadvisor_rows.get(m, empty)) for m in markets}
+
+
+def partition(booking, tripadvisor, level="town", min_hotels=MIN_HOTELS):
+    """``{market: (booking, tripadvisor)}`` for every market with ``min_hotels`` rows, largest first."""
+    return {m: (booking.iloc[b], tripadvisor.iloc[t])
+            for m, (b, t) in partition_rows(booking, tripadvisor, level, min_hotels).items()}
+
+
+def summarize(market, booking, tripadvisor):
+    """One comparison row and the rating-by-price-bracket table of a market."""
+    from . import report
+
+    source = report.FrameSource(booking, tripadvisor)
+    spearman, spearman_p = source.price_rating_correlation()["spearman"]
+    values = features.top_value_hotels(booking, n=1)
+    row = {
+        "market": market,
+        "hotels": len(booking),
+        "tripadvisor_rows": len(tripadvisor),
+        "median_price": booking["price_eur"].median(),
+        "mean_rating": booking["rating"].mean(),
+        "spearman_price_rating": spearman,
+        "spearman_p": spearman_p,
+        "room_higher_pct": source.room_gap_summary()["room_higher_pct"],
+        "spearman_reviews_rating": source.reviews_rating_correlation()[0],
+        "spearman_price_words": source.price_words_correlation()[0] if len(tripadvisor) > 2 else np.nan,
+        "best_value_hotel": values["hotel_name"].iloc[0] if len(values) else None,
+    }
+    row["value_index"] = row["mean_rating"] / row["median_price"] * 100
+    brackets = source.rating_by_price_bracket().reset_index().assign(market=market)
+    return row, brackets
+
+
+def analyze(market, booking, tripadvisor, out_dir, charts=True):
+    """Worker: report and charts of one market under ``out_dir``; returns ``summarize()``."""
+    from . import report
+
+    start = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    # Small markets leave some brackets and correlations empty: NaN, not a warning each
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        with open(os.path.join(out_dir, "report.txt"), "w") as f, contextlib.redirect_stdout(f):
+            print(f"MARKET: {market} ({len(booking)} Booking.com, {len(tripadvisor)} TripAdvisor rows)")
+            report.print_report(booking, tripadvisor)
+        if charts:
+            from . import charts as overview, findings
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                overview.render_all(booking, tripadvisor, out_dir)
+                findings.render_all(booking, tripadvisor, out_dir)
+        row, brackets = summarize(market, booking, tripadvisor)
+    row["seconds"] = time.perf_counter() - start
+    return row, brackets
+
+
+def analyze_shared(market, booking, booking_rows, tripadvisor, tripadvisor_rows, out_dir, charts=True):
+    """``analyze`` on rows of ``shared.SharedFrame`` handles, attached in this worker."""
+    booking = shared.SharedFrame.attach(booking).frame(booking_rows)
+    tripadvisor = shared.SharedFrame.attach(tripadvisor).frame(tripadvisor_rows)
+    return analyze(market, booking, tripadvisor, out_dir, charts)
+
+
+def fan_in(results, out_dir):
+    """Cross-market tables from the workers' results, written to ``out_dir``."""
+    comparison = (pd.DataFrame([row for row, _ in results], columns=COMPARISON_COLUMNS)
+                  .sort_values("value_index", ascending=False, ignore_index=True))
+    tables = [table for _, table in results]
+    brackets = (pd.concat(tables, ignore_index=True) if tables
+                else pd.DataFrame(columns=["market", "price_bracket", "mean_rating"]))
+    labels = features.PRICE_BRACKETS[1]
+    brackets = brackets.pivot(index="market", columns="price_bracket", values="mean_rating")
+    brackets = brackets.reindex(index=comparison["market"],
+                                columns=[b for b in labels if b in brackets.columns.astype(str)])
+    os.makedirs(out_dir, exist_ok=True)
+    comparison.to_csv(os.path.join(out_dir, "comparison.csv"), index=False)
+    brackets.to_csv(os.path.join(out_dir, "price_brackets.csv"))
+    return comparison, brackets
+
+
+def run(booking, tripadvisor, out_dir=MARKETS_DIR, level="town", min_hotels=MIN_HOTELS,
+        workers=None, charts=True, only=None):
+    """Analyze every market in ``workers`` processes (all cores by default); returns the fan-in tables.
+
+    ``workers=1`` runs in this process, which keeps tracebacks and traces simple.
+    Raises ValueError when a name in ``only`` is not a market with
+    ``min_hotels`` hotels, or when no market is left to analyze.
+    """
+    with instrument.span("markets.partition"):
+        parts = partition_rows(booking, tripadvisor, level, min_hotels)
+    if only:
+        unknown = [name for name in only if not any(name in (m, slug(m)) for m in parts)]
+        if unknown:
+            raise ValueError(f"no {level} with {min_hotels}+ hotels named {', '.join(map(repr, unknown))}")
+        parts = {m: rows for m, rows in parts.items() if m in only or slug(m) in only}
+    if not parts:
+        raise ValueError(f"no {level} has {min_hotels}+ hotels")
+    workers = min(workers or os.cpu_count() or 1, max(len(parts), 1))
+    print(f"{len(parts)} markets with {min_hotels}+ hotels, {workers} worker(s)")
+
+    results = []
+    with instrument.span("markets.fan_out", markets=len(parts), workers=workers):
+        if workers == 1:
+            for market, (b, t) in parts.items():
+                results.append(analyze(market, booking.iloc[b], tripadvisor.iloc[t],
+                                       os.path.join(out_dir, slug(market)), charts))
+                print(f"{len(results)}/{len(parts)} {market} ({results[-1][0]['seconds']:.1f}s)")
+        else:
+            # The frames go into shared memory once; each task only carries its row positions
+            with (shared.SharedFrame.create(booking) as booking_shared,
+                  shared.SharedFrame.create(tripadvisor) as tripadvisor_shared,
+                  ProcessPoolExecutor(max_workers=workers) as pool):
+                futures = [pool.submit(analyze_shared, market, booking_shared.handle, b, tripadvisor_shared.handle, t,
+                                       os.path.join(out_dir, slug(market)), charts)
+                           for market, (b, t) in parts.items()]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    print(f"{len(results)}/{len(parts)} {results[-1][0]['market']} "
+                          f"({results[-1][0]['seconds']:.1f}s)")
+    with instrument.span("markets.fan_in"):
+        return fan_in(results, out_dir)
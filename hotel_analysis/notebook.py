@@ -0,0 +1,150 @@
+"""Cleaned frames and report tables for the notebook, cached by data hash.
+
+``load()`` gives the notebook the same data the scripts use instead of a copy
+of the cleaning code:
+
+    from hotel_analysis import notebook
+    nb = notebook.load()
+    nb.booking, nb.tripadvisor          # the cleaned CSVs
+    nb["location_stats"]                # any table of TABLES or CHART_TABLES
+
+When a raw file is newer than its cleaned CSV, ``cleaning.run()`` refreshes
+the cleaned files first, exactly as ``python -m hotel_analysis clean`` would.
+The result is keyed by a hash of the raw and cleaned files and of the
+package source, memoized in the process and pickled to
+``output/cache/notebook-<key>.pkl``. A kernel restart then costs one hash of
+the files and one unpickle, and any change to the data or the code misses the
+cache.
+"""
+import hashlib
+import os
+import pickle
+
+from . import compression, instrument, paths
+
+CACHE_DIR = os.path.join(paths.ROOT, "output", "cache")
+CACHE_VERSION = 1
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Precomputed into ``Snapshot.tables``: the report's FrameSource methods ...
+TABLES = [
+    "price_rating_correlation", "rating_by_price_bracket", "review_label_stats", "room_gap_summary",
+    "location_stats", "residual_extremes", "bed_type_stats", "rating_by_review_bracket",
+    "reviews_rating_correlation", "comments", "words_by_price_bracket", "price_words_correlation",
+]
+# ... and the frames behind the finding charts, as (module, function, dataset)
+CHART_TABLES = {
+    "room_gap": ("gaps", "compute", "booking"),
+    "price_fit": ("features", "fit_price_rating", "booking"),
+    "price_bracket_ratings": ("findings", "price_bracket_ratings", "booking"),
+    "words_by_price": ("findings", "words_by_price", "tripadvisor"),
+}
+
+_memo = {}
+
+
+class Snapshot:
+    """Cleaned frames, raw row counts and report tables of one version of the data."""
+
+    def __init__(self, key, booking, tripadvisor, raw_rows, tables):
+        self.key = key
+        self.booking = booking
+        self.tripadvisor = tripadvisor
+        self.raw_rows = raw_rows
+        self.tables = tables
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def __repr__(self):
+        return (f"<Snapshot {self.key}: {len(self.booking)} Booking.com rows, "
+                f"{len(self.tripadvisor)} TripAdvisor rows, {len(self.tables)} tables>")
+
+
+def _files(raw_dir, cleaned_dir):
+    files = {
+        "booking": (os.path.join(raw_dir, "booking_hotel.csv"), os.path.join(cleaned_dir, "booking_cleaned.csv")),
+        "tripadvisor": (os.path.join(raw_dir, "tripadvisor_room.csv"),
+                        os.path.join(cleaned_dir, "tripadvisor_cleaned.csv")),
+    }
+    return {name: tuple(map(compression.resolve, pair)) for name, pair in files.items()}
+
+
+def fingerprint(raw_dir=paths.RAW_DIR, cleaned_dir=paths.CLEANED_DIR):
+    """Hash of the raw and cleaned files and of the package source."""
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for raw, cleaned in _files(raw_dir, cleaned_dir).values():
+        digest.update(compression.file_digest(raw).encode())
+        digest.update(compression.file_digest(cleaned).encode())
+    for name in sorted(os.listdir(PACKAGE_DIR)):
+        if name.endswith(".py"):
+            digest.update(compression.file_digest(os.path.join(PACKAGE_DIR, name)).encode())
+    return digest.hexdigest()[:16]
+
+
+def stale(raw_dir=paths.RAW_DIR, cleaned_dir=paths.CLEANED_DIR):
+    """True when a cleaned CSV is missing or older than its raw file."""
+    for raw, cleaned in _files(raw_dir, cleaned_dir).values():
+        if not os.path.exists(cleaned) or os.stat(raw).st_mtime_ns > os.stat(cleaned).st_mtime_ns:
+            return True
+    return False
+
+
+@instrument.timed("notebook.build")
+def build(key, raw_dir=paths.RAW_DIR, cleaned_dir=paths.CLEANED_DIR):
+    """Compute a ``Snapshot`` from the files (no caching)."""
+    import importlib
+
+    from . import cleaning, data, report
+
+    files = _files(raw_dir, cleaned_dir)
+    booking = data.load_booking(files["booking"][1])
+    tripadvisor = data.load_tripadvisor(files["tripadvisor"][1])
+    raw_rows = {
+        "booking": len(cleaning.read_booking_raw(files["booking"][0])),
+        "tripadvisor": len(cleaning.read_tripadvisor_raw(files["tripadvisor"][0])),
+    }
+    source = report.FrameSource(booking, tripadvisor)
+    tables = {name: getattr(source, name)() for name in TABLES}
+    frames = {"booking": booking, "tripadvisor": tripadvisor}
+    for name, (module, function, dataset) in CHART_TABLES.items():
+        tables[name] = getattr(importlib.import_module(f".{module}", __package__), function)(frames[dataset])
+    return Snapshot(key, booking, tripadvisor, raw_rows, tables)
+
+
+def load(raw_dir=paths.RAW_DIR, cleaned_dir=paths.CLEANED_DIR, cache_dir=CACHE_DIR, clean=True):
+    """The current ``Snapshot``: from memory, else from the pickle cache, else built.
+
+    With ``clean`` (the default) stale cleaned CSVs are regenerated first.
+    """
+    if clean and stale(raw_dir, cleaned_dir):
+        from . import cleaning
+
+        cleaning.run(raw_dir=raw_dir, cleaned_dir=cleaned_dir)
+    key = fingerprint(raw_dir, cleaned_dir)
+    if key in _memo:
+        return _memo[key]
+
+    path = os.path.join(cache_dir, f"notebook-{key}.pkl")
+    try:
+        with instrument.span("notebook.unpickle"), open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        snapshot = build(key, raw_dir, cleaned_dir)
+        _save(snapshot, path)
+    _memo.clear()
+    _memo[key] = snapshot
+    return snapshot
+
+
+def _save(snapshot, path):
+    """Pickle ``snapshot`` to ``path`` (atomically) and drop older notebook caches."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    for name in os.listdir(directory):
+        if name.startswith("notebook-") and name.endswith(".pkl") and os.path.join(directory, name) != path:
+            os.remove(os.path.join(directory, name))
@@ -0,0 +1,111 @@
+"""Group-wise robust price outliers.
+
+The cleaning step keeps its fixed EUR 5-10000 window; on top of it every
+Booking.com row gets a ``price_outlier`` flag that compares its log price with
+the hotels of the same location and room category, so a EUR 3000 suite is
+normal in a luxury resort town and an outlier in a backpacker one.
+
+The robust z-score is ``(log price - median) / scale``, where ``scale`` is
+``1.4826 * MAD`` (``method="mad"``) or ``IQR / 1.349`` (``method="iqr"``); both
+equal the standard deviation for normal data. Groups with fewer than
+``MIN_GROUP`` priced rows, or with no spread, fall back to the location and
+then to all rows. Each level is computed for all groups at once from one
+sort (two for the MAD), so there is no Python loop over groups.
+
+Rows are flagged, never dropped; analyses filter with
+``booking[~booking["price_outlier"]]`` when they want to.
+"""
+import numpy as np
+import pandas as pd
+
+from . import features
+
+LEVELS = [["location", "room_category"], ["location"], []]
+MIN_GROUP = 8
+THRESHOLD = 3.5
+MAD_TO_SD = 1.4826
+IQR_TO_SD = 1.349
+
+
+def _quantiles(codes, values, probs, n_groups):
+    """Per-group quantiles (linear interpolation, as pandas) of ``values`` grouped by ``codes``.
+
+    ``codes`` must be sorted and ``values`` sorted within each group. Returns
+    the group sizes and, for each probability, the per-group quantiles (NaN
+    for empty groups).
+    """
+    size = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(size) - size
+    result = []
+    for p in probs:
+        if not len(values):
+            result.append(np.full(n_groups, np.nan))
+            continue
+        pos = starts + p * np.maximum(size - 1, 0)
+        lo = np.minimum(np.floor(pos).astype(np.int64), len(values) - 1)
+        hi = np.minimum(lo + 1, np.maximum(starts + size - 1, 0))
+        quantile = values[lo] + (values[hi] - values[lo]) * (pos - lo)
+        result.append(np.where(size > 0, quantile, np.nan))
+    return size, result
+
+
+def robust_z(values, codes, method="mad"):
+    """Robust z-score of every value within its group.
+
+    ``codes`` are dense integer group ids. Returns the scores (NaN for NaN
+    values) and, per row, the number of non-NaN values and the scale of its
+    group.
+    """
+    values = np.asarray(values, dtype=float)
+    n_groups = int(codes.max()) + 1 if len(codes) else 0
+    ok = ~np.isnan(values)
+    order = np.lexsort((values[ok], codes[ok]))
+    sorted_codes, sorted_values = codes[ok][order], values[ok][order]
+    size, (q1, median, q3) = _quantiles(sorted_codes, sorted_values, (0.25, 0.5, 0.75), n_groups)
+
+    if method == "iqr":
+        scale = (q3 - q1) / IQR_TO_SD
+    elif method == "mad":
+        deviation = np.abs(sorted_values - median[sorted_codes])
+        order = np.lexsort((deviation, sorted_codes))
+        _, (mad,) = _quantiles(sorted_codes, deviation[order], (0.5,), n_groups)
+        scale = MAD_TO_SD * mad
+    else:
+        raise ValueError(f"unknown method {method!r} (use 'mad' or 'iqr')")
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (values - median[codes]) / scale[codes]
+    return z, size[codes], scale[codes]
+
+
+def price_robust_z(booking, levels=LEVELS, min_group=MIN_GROUP, method="mad"):
+    """Robust z-score of every row's log price at the finest usable grouping level."""
+    frame = booking.assign(room_category=features.room_category(booking))
+    log_price = np.log(frame["price_eur"].to_numpy(dtype=float))
+    z = np.full(len(frame), np.nan)
+    done = np.zeros(len(frame), dtype=bool)
+    for keys in levels:
+        codes = (frame.groupby(keys, sort=False, dropna=False).ngroup().to_numpy() if keys
+                 else np.zeros(len(frame), dtype=np.int64))
+        level_z, size, scale = robust_z(log_price, codes, method)
+        usable = ~done & (size >= min_group) & (scale > 0)
+        z[usable] = level_z[usable]
+        done |= usable
+    return pd.Series(z, index=booking.index, name="price_robust_z")
+
+
+def price_outliers(booking, threshold=THRESHOLD, **kwargs):
+    """``price_outlier`` flag: |robust z| of the log price above ``threshold``."""
+    return (price_robust_z(booking, **kwargs).abs() > threshold).rename("price_outlier")
+
+
+def with_flags(booking):
+    """``booking`` with a ``price_outlier`` column (computed if the CSV predates it)."""
+    if "price_outlier" in booking:
+        return booking
+    return booking.assign(price_outlier=price_outliers(booking))
+
+
+def without_outliers(booking):
+    booking = with_flags(booking)
+    return booking[~booking["price_outlier"].astype(bool)]
@@ -0,0 +1,16 @@
+"""Project paths, resolved from the package location so nothing depends on the cwd."""
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RAW_DIR = os.path.join(ROOT, "data", "raw")
+CLEANED_DIR = os.path.join(ROOT, "data", "cleaned")
+CHARTS_DIR = os.path.join(ROOT, "output", "charts")
+PRESENTATION_DIR = os.path.join(ROOT, "output", "presentation")
+TABLES_DIR = os.path.join(ROOT, "output", "tables")
+
+BOOKING_RAW = os.path.join(RAW_DIR, "booking_hotel.csv")
+TRIPADVISOR_RAW = os.path.join(RAW_DIR, "tripadvisor_room.csv")
+BOOKING_CLEANED = os.path.join(CLEANED_DIR, "booking_cleaned.csv")
+TRIPADVISOR_CLEANED = os.path.join(CLEANED_DIR, "tripadvisor_cleaned.csv")
+REGIONS = os.path.join(ROOT, "data", "regions.csv")
@@ -0,0 +1,323 @@
+"""PDF slide deck (formerly scripts/presentation.py)."""
+import os
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+
+from . import features, gaps, instrument, paths
+from .findings import OVERPRICED_OFFSETS, price_bracket_ratings, words_by_price
+from .style import ACCENT, BG, CARD, EDGE, RED, SUBTLE, WHITE, YELLOW, apply_theme
+
+W, H = 13, 9
+PRESENTATION_PDF = os.path.join(paths.PRESENTATION_DIR, "hotel_presentation.pdf")
+
+
+def _text_slide():
+    fig = plt.figure(figsize=(W, H))
+    fig.patch.set_facecolor(BG)
+    return fig
+
+
+def cover(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.62, "What 5,500 Hotels\nTeach Us About\nValue for Money",
+             ha="center", va="center", fontsize=46, fontweight="bold", color=WHITE,
+             linespacing=1.3)
+    fig.text(0.5, 0.35, "A data-driven analysis of Booking.com & TripAdvisor",
+             ha="center", fontsize=20, color=ACCENT, style="italic")
+    fig.text(0.5, 0.18, "3,290 Booking.com hotels  |  2,248 TripAdvisor hotels  |  Real data",
+             ha="center", fontsize=14, color=SUBTLE)
+    fig.text(0.5, 0.08, "Giorgio Vernarecci  -  Data Analyst",
+             ha="center", fontsize=14, color=SUBTLE)
+    return fig
+
+
+def question(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.65, "The Question",
+             ha="center", fontsize=38, fontweight="bold", color=ACCENT)
+    fig.text(0.5, 0.45,
+             "Does paying more for a hotel\nactually get you a better experience?",
+             ha="center", fontsize=28, color=WHITE, linespacing=1.4)
+    fig.text(0.5, 0.22,
+             "I analyzed 5,500+ hotels across Booking.com and TripAdvisor\n"
+             "to find out what really drives guest satisfaction\n"
+             "and where travelers get the best (and worst) value.",
+             ha="center", fontsize=16, color=SUBTLE, linespacing=1.5)
+    return fig
+
+
+def key_number(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.78, "The Short Answer", ha="center", fontsize=20, color=SUBTLE)
+    fig.text(0.5, 0.55, "+0.28", ha="center", fontsize=130, fontweight="bold", color=RED)
+    fig.text(0.5, 0.30,
+             "That's the rating difference between\na EUR 500/night hotel and a EUR 5,000/night hotel",
+             ha="center", fontsize=22, color=WHITE, linespacing=1.4)
+    fig.text(0.5, 0.12, "Spearman correlation: r = 0.19 (weak positive)",
+             ha="center", fontsize=14, color=SUBTLE)
+    return fig
+
+
+def price_vs_rating(booking, tripadvisor):
+    pb = price_bracket_ratings(booking)
+
+    fig, ax = plt.subplots(figsize=(W, H))
+    colors = [RED if r < 8.1 else YELLOW if r < 8.25 else ACCENT for r in pb["mean_rating"]]
+    bars = ax.bar(pb["price_bracket"].astype(str), pb["mean_rating"], color=colors, alpha=0.85, width=0.55)
+    for bar, rating, count in zip(bars, pb["mean_rating"], pb["count"]):
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.03,
+                f"{rating:.2f}", ha="center", fontsize=16, fontweight="bold", color=WHITE)
+        ax.text(bar.get_x() + bar.get_width()/2, 7.55,
+                f"n={count}", ha="center", fontsize=10, color=SUBTLE)
+    ax.set_ylim(7.5, 8.7)
+    ax.set_title("Paying More Does NOT Guarantee a Better Experience",
+                 fontsize=20, fontweight="bold", pad=20)
+    ax.set_xlabel("Price per Night (EUR)", fontsize=14)
+    ax.set_ylabel("Average Rating", fontsize=14)
+    ax.text(0.5, 0.92, "Only +0.28 rating difference across a 10x price increase",
+            transform=ax.transAxes, ha="center", fontsize=14, color=RED,
+            bbox=dict(boxstyle="round,pad=0.5", facecolor=CARD, edgecolor=RED, alpha=0.9))
+    plt.tight_layout()
+    return fig
+
+
+def room_score_gap(booking, tripadvisor):
+    has_both = gaps.compute(booking)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(W, H), gridspec_kw={"width_ratios": [1, 1.4]})
+
+    room_higher, room_equal, room_lower = has_both.counts()
+
+    sizes = [room_higher, room_equal, room_lower]
+    pie_colors = [ACCENT, YELLOW, RED]
+    wedges, texts, _ = ax1.pie(sizes, colors=pie_colors, startangle=90, autopct="",
+                               textprops={"color": WHITE, "fontsize": 11},
+                               pctdistance=0.75, labeldistance=1.15)
+    labels_pie = [
+        f"Room > Overall\n{room_higher} ({room_higher/len(has_both)*100:.0f}%)",
+        f"Equal\n{room_equal} ({room_equal/len(has_both)*100:.0f}%)",
+        f"Room < Overall\n{room_lower} ({room_lower/len(has_both)*100:.0f}%)"
+    ]
+    for text, label in zip(texts, labels_pie):
+        text.set_text(label)
+        text.set_fontsize(11)
+    ax1.set_title("Room Score vs Overall Rating", fontsize=16, fontweight="bold", pad=15)
+
+    ax2.hist(has_both.gap, bins=40, color=ACCENT, alpha=0.8, edgecolor="none")
+    ax2.axvline(0, color=RED, linestyle="--", linewidth=2, label="No gap (0)")
+    ax2.axvline(has_both.mean(), color=YELLOW, linestyle="--", linewidth=2,
+                label=f"Mean gap: +{has_both.mean():.2f}")
+    ax2.set_title("88% of Hotels: Room Is the Strongest Point",
+                  fontsize=16, fontweight="bold", pad=15)
+    ax2.set_xlabel("Gap (Room Score - Overall Rating)")
+    ax2.set_ylabel("Number of Hotels")
+    ax2.legend(facecolor=CARD, edgecolor=EDGE, fontsize=11)
+    plt.tight_layout()
+    return fig
+
+
+def best_worst_value(booking, tripadvisor):
+    loc_stats = features.location_stats(booking)
+    best10 = loc_stats.nlargest(10, "value_index")
+    worst10 = loc_stats.nsmallest(10, "value_index")
+
+    fig, (ax_w, ax_b) = plt.subplots(1, 2, figsize=(W, H))
+
+    worst_s = worst10.sort_values("value_index", ascending=True)
+    bars_w = ax_w.barh(worst_s["location"], worst_s["median_price"], color=RED, alpha=0.85, height=0.6)
+    for bar, rating in zip(bars_w, worst_s["mean_rating"]):
+        ax_w.text(bar.get_width() + 50, bar.get_y() + bar.get_height()/2,
+                  f"{rating:.1f}", va="center", fontsize=11, color=YELLOW, fontweight="bold")
+    ax_w.set_title("WORST Value", fontsize=16, fontweight="bold", pad=15, color=RED)
+    ax_w.set_xlabel("Median Price (EUR)")
+    ax_w.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:,.0f}"))
+    ax_w.text(1.0, 1.02, "Rating", transform=ax_w.transAxes, ha="right",
+              fontsize=10, color=YELLOW, fontweight="bold")
+
+    best_s = best10.sort_values("value_index", ascending=True)
+    bars_b = ax_b.barh(best_s["location"], best_s["median_price"], color=ACCENT, alpha=0.85, height=0.6)
+    for bar, rating in zip(bars_b, best_s["mean_rating"]):
+        ax_b.text(bar.get_width() + 20, bar.get_y() + bar.get_height()/2,
+                  f"{rating:.1f}", va="center", fontsize=11, color=YELLOW, fontweight="bold")
+    ax_b.set_title("BEST Value", fontsize=16, fontweight="bold", pad=15, color=ACCENT)
+    ax_b.set_xlabel("Median Price (EUR)")
+    ax_b.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:,.0f}"))
+    ax_b.text(1.0, 1.02, "Rating", transform=ax_b.transAxes, ha="right",
+              fontsize=10, color=YELLOW, fontweight="bold")
+
+    fig.suptitle("Paris vs Thailand: Where Does Your Money Go?",
+                 fontsize=22, fontweight="bold", color=WHITE, y=0.98)
+    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    return fig
+
+
+def overpriced_hotels(booking, tripadvisor):
+    coeffs, bf = features.fit_price_rating(booking)
+    overpriced = bf[bf["num_reviews"] >= features.MIN_REVIEWS].nsmallest(7, "rating_residual")
+
+    fig, ax = plt.subplots(figsize=(W, H))
+    ax.scatter(bf["price_eur"], bf["rating"], alpha=0.12, s=12, color=SUBTLE)
+    x_line = np.linspace(0, features.FIT_MAX_PRICE, 100)
+    ax.plot(x_line, np.polyval(coeffs, x_line), color=YELLOW, linewidth=2, linestyle="--",
+            label="Expected rating")
+    ax.scatter(overpriced["price_eur"], overpriced["rating"], color=RED, s=100, zorder=5,
+               edgecolors=WHITE, linewidth=0.8, label="Most overpriced")
+
+    for i, (_, row) in enumerate(overpriced.iterrows()):
+        name = row["hotel_name"][:22]
+        ox, oy = OVERPRICED_OFFSETS[i % len(OVERPRICED_OFFSETS)]
+        ax.annotate(f"{name}\n{row['location']}\nRating: {row['rating']}",
+                    xy=(row["price_eur"], row["rating"]),
+                    xytext=(row["price_eur"] + ox, row["rating"] + oy),
+                    fontsize=8, color=RED,
+                    arrowprops=dict(arrowstyle="->", color=RED, lw=0.8),
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor=CARD, edgecolor=RED, alpha=0.85))
+
+    ax.set_title("Overpriced: High Price, Low Rating", fontsize=20, fontweight="bold", pad=20)
+    ax.set_xlabel("Price per Night (EUR)", fontsize=14)
+    ax.set_ylabel("Rating", fontsize=14)
+    ax.set_xlim(0, features.FIT_MAX_PRICE)
+    ax.set_ylim(1, 10.5)
+    ax.legend(facecolor=CARD, edgecolor=EDGE, fontsize=11, loc="lower right")
+    plt.tight_layout()
+    return fig
+
+
+def review_length(booking, tripadvisor):
+    cp = words_by_price(tripadvisor)
+
+    fig, ax = plt.subplots(figsize=(W, H))
+    colors_g = [ACCENT, "#2ECC71", YELLOW, "#E67E22", RED]
+    bars = ax.bar(cp["price_bracket"].astype(str), cp["mean_words"],
+                  color=colors_g, alpha=0.85, width=0.55)
+    for bar, words, count in zip(bars, cp["mean_words"], cp["count"]):
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.8,
+                f"{words:.0f} words", ha="center", fontsize=15, fontweight="bold", color=WHITE)
+        ax.text(bar.get_x() + bar.get_width()/2, 1.5,
+                f"n={count}", ha="center", fontsize=10, color=SUBTLE)
+    ax.set_title("Cheaper Hotels Get Longer Reviews", fontsize=20, fontweight="bold", pad=20)
+    ax.set_xlabel("Price per Night (EUR)", fontsize=14)
+    ax.set_ylabel("Average Words per Review", fontsize=14)
+    ax.set_ylim(0, 35)
+    ax.text(0.5, 0.92,
+            "Budget guests write 2x more words than luxury guests  |  Spearman r = -0.43",
+            transform=ax.transAxes, ha="center", fontsize=13, color=RED,
+            bbox=dict(boxstyle="round,pad=0.5", facecolor=CARD, edgecolor=RED, alpha=0.9))
+    plt.tight_layout()
+    return fig
+
+
+def takeaways(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.88, "Key Takeaways", ha="center", fontsize=36, fontweight="bold", color=ACCENT)
+
+    items = [
+        ("1.", "Price is a poor predictor of quality", "+0.28 rating difference across 10x price range"),
+        ("2.", "Rooms are the strongest asset", "88% of hotels score higher on rooms than overall"),
+        ("3.", "Paris is the worst value destination", "6 of the 10 worst value locations are in Paris"),
+        ("4.", "Overpriced hotels are identifiable", "Residual analysis reveals consistent underperformers"),
+        ("5.", "Budget guests leave richer feedback", "2x longer reviews at cheap hotels (r = -0.43)"),
+    ]
+    for i, (num, title, detail) in enumerate(items):
+        y = 0.72 - i * 0.13
+        fig.text(0.08, y, num, fontsize=22, fontweight="bold", color=ACCENT)
+        fig.text(0.14, y, title, fontsize=20, fontweight="bold", color=WHITE)
+        fig.text(0.14, y - 0.04, detail, fontsize=14, color=SUBTLE)
+    return fig
+
+
+def methodology(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.88, "Methodology", ha="center", fontsize=36, fontweight="bold", color=ACCENT)
+
+    methods = [
+        ("Data Source", "Kaggle - Hotel Dataset: Rates, Reviews & Amenities (6k+)\nby joyshil0599 - CC0 License"),
+        ("Datasets", "Booking.com (3,465 rows) + TripAdvisor (5,330 rows)"),
+        ("Cleaning", "Encoding fixes, currency conversion (BDT to EUR at 1:120),\noutlier removal, string normalization, duplicate handling"),
+        ("After Cleaning", "Booking: 3,290 hotels  |  TripAdvisor: 2,248 hotels"),
+        ("Analysis", "Pearson & Spearman correlations, linear regression\nfor residual analysis, descriptive statistics"),
+        ("Tools", "Python (pandas, numpy, scipy, matplotlib)"),
+    ]
+    for i, (label, desc) in enumerate(methods):
+        y = 0.74 - i * 0.11
+        fig.text(0.08, y, label, fontsize=16, fontweight="bold", color=ACCENT)
+        fig.text(0.30, y, desc, fontsize=14, color=WHITE, linespacing=1.3)
+
+    fig.text(0.5, 0.08,
+             "Note: BDT/EUR conversion rate is approximate. The two datasets cover\n"
+             "different market segments and are analyzed separately where appropriate.",
+             ha="center", fontsize=12, color=SUBTLE, linespacing=1.4)
+    return fig
+
+
+def about(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.70, "Giorgio Vernarecci",
+             ha="center", fontsize=40, fontweight="bold", color=WHITE)
+    fig.text(0.5, 0.60, "Data Analyst",
+             ha="center", fontsize=26, color=ACCENT)
+    fig.text(0.5, 0.48,
+             "SQL  |  Python  |  R  |  Tableau  |  n8n",
+             ha="center", fontsize=18, color=SUBTLE)
+    fig.text(0.5, 0.34,
+             "Former hospitality professional turned data analyst.\n"
+             "I combine operational experience with analytics\n"
+             "to find insights others miss.",
+             ha="center", fontsize=18, color=WHITE, linespacing=1.5)
+    fig.text(0.5, 0.15,
+             "Let's connect - follow me for more data stories.",
+             ha="center", fontsize=16, color=ACCENT, style="italic")
+    fig.text(0.5, 0.06,
+             "github.com/logiop  |  Built with Python",
+             ha="center", fontsize=12, color=SUBTLE)
+    return fig
+
+
+def sources(booking, tripadvisor):
+    fig = _text_slide()
+    fig.text(0.5, 0.80, "Sources & Links", ha="center", fontsize=32, fontweight="bold", color=ACCENT)
+
+    links = [
+        "Dataset: kaggle.com/datasets/joyshil0599/hotel-dataset-rates-reviews-and-amenities5k",
+        "GitHub:  github.com/logiop",
+        "LinkedIn: linkedin.com/in/giorgio-vernarecci-4b5a8a23b",
+    ]
+    for i, s in enumerate(links):
+        fig.text(0.12, 0.60 - i * 0.10, s, fontsize=16, color=WHITE)
+
+    fig.text(0.5, 0.20, "Thank you for reading.",
+             ha="center", fontsize=22, color=SUBTLE, style="italic")
+    return fig
+
+
+SLIDES = [
+    (cover, "Cover"),
+    (question, "Question"),
+    (key_number, "Key Number"),
+    (price_vs_rating, "Price vs Rating"),
+    (room_score_gap, "Room Score Gap"),
+    (best_worst_value, "Best vs Worst Value"),
+    (overpriced_hotels, "Overpriced Hotels"),
+    (review_length, "Review Length"),
+    (takeaways, "Key Takeaways"),
+    (methodology, "Methodology"),
+    (about, "About"),
+    (sources, "Sources"),
+]
+
+
+def build(booking, tripadvisor, path=PRESENTATION_PDF):
+    apply_theme(bold_titles=False)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with PdfPages(path) as pdf:
+        for i, (slide, label) in enumerate(SLIDES, 1):
+            with instrument.span(f"slide.{slide.__name__}"):
+                fig = slide(booking, tripadvisor)
+                pdf.savefig(fig)
+            plt.close(fig)
+            print(f"Slide {i}/{len(SLIDES)} - {label}")
+    print(f"\nPresentation saved: {os.path.basename(path)}")
+    return path
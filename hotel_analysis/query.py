@@ -0,0 +1,206 @@
+"""Local HTTP query service for value-score and value-index lookups.
+
+The index is built once from the cleaned Booking.com frame: for every location
+the hotels are kept as NumPy arrays pre-sorted by value score and by rating
+residual, so a filtered top-k query is a boolean mask over an already ordered
+slice. Results are memoized in an LRU cache keyed on the normalized query.
+
+    GET /hotels?location=Ao Nang&max_price=200&min_reviews=50&k=10
+    GET /hotels?sort=overpriced&location=Paris&k=5
+    GET /locations?order=worst&k=10
+    GET /stats
+
+Start with ``python -m hotel_analysis query-server`` (127.0.0.1:8765).
+"""
+import functools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from . import features
+
+HOST = "127.0.0.1"
+PORT = 8765
+CACHE_SIZE = 4096
+MAX_K = 1000
+
+# sort name -> (score column, descending)
+SORTS = {
+    "value": ("value_score", True),
+    "underpriced": ("rating_residual", True),
+    "overpriced": ("rating_residual", False),
+}
+HOTEL_FIELDS = ["hotel_name", "location", "price_eur", "rating", "num_reviews",
+                "value_score", "rating_residual"]
+
+
+class HotelIndex:
+    """Per-location hotel arrays pre-sorted for each ranking in ``SORTS``."""
+
+    def __init__(self, booking):
+        hotels = features.value_scores(booking)
+        _, fit = features.fit_price_rating(hotels)
+        hotels["rating_residual"] = fit["rating_residual"]
+        hotels = hotels.reset_index(drop=True)
+
+        records = hotels[HOTEL_FIELDS].astype({"num_reviews": "Int64"}).astype(object)
+        self.records = records.where(records.notna(), None).to_dict("records")
+        self.locations = sorted(hotels["location"].dropna().unique())
+        self._location_stats = {}
+        self._booking = booking
+
+        price = hotels["price_eur"].to_numpy()
+        reviews = hotels["num_reviews"].fillna(0).to_numpy(dtype=float)
+        codes = hotels["location"].map({loc: i for i, loc in enumerate(self.locations)})
+        codes = codes.fillna(-1).to_numpy(dtype=np.int64)
+
+        # slices[sort][location] = (rows, price, reviews) ordered best-first
+        self.slices = {}
+        for sort, (column, descending) in SORTS.items():
+            score = hotels[column].to_numpy(dtype=float)
+            scored = np.flatnonzero(~np.isnan(score))
+            key = -score[scored] if descending else score[scored]
+            ranked = scored[np.argsort(key, kind="stable")]
+            # A stable sort of the ranked rows by location code gives every
+            # location's ranking as one contiguous slice
+            by_code = ranked[np.argsort(codes[ranked], kind="stable")]
+            bounds = np.searchsorted(codes[by_code], np.arange(len(self.locations) + 1))
+            by_loc = {None: (ranked, price[ranked], reviews[ranked])}
+            for i, loc in enumerate(self.locations):
+                rows = by_code[bounds[i]:bounds[i + 1]]
+                by_loc[loc] = (rows, price[rows], reviews[rows])
+            self.slices[sort] = by_loc
+
+        self.hotels = functools.lru_cache(maxsize=CACHE_SIZE)(self._hotels)
+        self.location_ranking = functools.lru_cache(maxsize=CACHE_SIZE)(self._location_ranking)
+
+    def match_locations(self, text):
+        """Locations whose name contains ``text`` (case-insensitive); None = all."""
+        if not text:
+            return [None]
+        text = text.lower()
+        return [loc for loc in self.locations if text in loc.lower()]
+
+    def _hotels(self, location=None, sort="value", k=10, min_price=0.0, max_price=float("inf"),
+                min_reviews=0):
+        candidates = []
+        for loc in self.match_locations(location):
+            rows, price, reviews = self.slices[sort][loc]
+            keep = (price >= min_price) & (price <= max_price) & (reviews >= min_reviews)
+            candidates.append(rows[keep][:k])
+        if not candidates:
+            return []
+        rows = np.concatenate(candidates)
+        if len(candidates) > 1:
+            column, descending = SORTS[sort]
+            score = np.array([self.records[r][column] for r in rows])
+            rows = rows[np.argsort(-score if descending else score, kind="stable")][:k]
+        return [self.records[r] for r in rows]
+
+    def _location_ranking(self, order="best", k=10, min_count=features.MIN_LOCATION_HOTELS):
+        if min_count not in self._location_stats:
+            self._location_stats[min_count] = (
+                features.location_stats(self._booking, min_count)
+                .sort_values("value_index", ascending=False, kind="stable")
+            )
+        ranked = self._location_stats[min_count]
+        ranked = ranked.head(k) if order == "best" else ranked.iloc[::-1].head(k)
+        return ranked.drop(columns="mean_room_score").to_dict("records")
+
+    def cache_info(self):
+        return {"hotels": self.hotels.cache_info()._asdict(),
+                "locations": self.location_ranking.cache_info()._asdict()}
+
+
+def _number(params, name, default, cast=float):
+    return cast(params[name][0]) if name in params else default
+
+
+def _k(params):
+    k = _number(params, "k", 10, int)
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}")
+    return k
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this every
+    # keep-alive response waits on a delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        index = self.server.index
+        try:
+            if url.path == "/hotels":
+                sort = params.get("sort", ["value"])[0]
+                if sort not in SORTS:
+                    raise ValueError(f"sort must be one of {sorted(SORTS)}")
+                body = index.hotels(
+                    location=params.get("location", [None])[0],
+                    sort=sort,
+                    k=_k(params),
+                    min_price=_number(params, "min_price", 0.0),
+                    max_price=_number(params, "max_price", float("inf")),
+                    min_reviews=_number(params, "min_reviews", 0),
+                )
+            elif url.path == "/locations":
+                order = params.get("order", ["best"])[0]
+                if order not in ("best", "worst"):
+                    raise ValueError("order must be 'best' or 'worst'")
+                body = index.location_ranking(
+                    order=order,
+                    k=_k(params),
+                    min_count=_number(params, "min_count", features.MIN_LOCATION_HOTELS, int),
+                )
+            elif url.path == "/stats":
+                body = {"requests": self.server.requests, "uptime": time.time() - self.server.started,
+                        "cache": index.cache_info()}
+            else:
+                self._send(404, {"error": f"no route {url.path}"})
+                return
+        except ValueError as exc:
+            self._send(400, {"error": str(exc)})
+            return
+        with self.server.counter_lock:
+            self.server.requests += 1
+        self._send(200, body)
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(booking, host=HOST, port=PORT):
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.index = HotelIndex(booking)
+    server.requests = 0
+    server.counter_lock = threading.Lock()
+    server.started = time.time()
+    return server
+
+
+def serve(host=HOST, port=PORT):
+    from . import data
+
+    server = make_server(data.load_booking(), host, port)
+    print(f"query service on http://{host}:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,191 @@
+"""Printed deep-analysis report, one function per section.
+
+Sections read their tables from a *source*: ``FrameSource`` computes them from
+the in-memory frames, ``sqlbackend.Database`` with SQL over an on-disk SQLite
+file. Both expose the same methods and return the same tables.
+"""
+import pandas as pd
+
+from . import features, instrument, stats
+
+HOTEL_COLUMNS = ["hotel_name", "location", "price_eur", "rating", "expected_rating",
+                 "rating_residual", "num_reviews"]
+LOCATION_COLUMNS = ["location", "median_price", "mean_rating", "value_index", "count"]
+
+
+class FrameSource:
+    """Report tables computed with pandas from the cleaned frames."""
+
+    def __init__(self, booking, tripadvisor):
+        self.booking = booking
+        self.tripadvisor = tripadvisor
+        self._comments = None
+
+    def comments(self):
+        if self._comments is None:
+            self._comments = features.comments(self.tripadvisor)
+        return self._comments
+
+    def price_rating_correlation(self):
+        return stats.price_rating_correlation(self.booking)
+
+    def rating_by_price_bracket(self):
+        return stats.rating_by_price_bracket(self.booking)
+
+    def review_label_stats(self):
+        return stats.review_label_stats(self.booking)
+
+    def room_gap_summary(self):
+        return stats.room_gap_summary(self.booking)
+
+    def location_stats(self):
+        return features.location_stats(self.booking)
+
+    def residual_extremes(self, n=10, min_reviews=features.MIN_REVIEWS):
+        """``(coeffs, overpriced, underpriced)``: the ``n`` most negative and positive residuals."""
+        coeffs, booking_fit = features.fit_price_rating(self.booking)
+        reviewed = booking_fit[booking_fit["num_reviews"] >= min_reviews]
+        return coeffs, reviewed.nsmallest(n, "rating_residual"), reviewed.nlargest(n, "rating_residual")
+
+    def bed_type_stats(self):
+        return stats.bed_type_stats(self.booking)
+
+    def rating_by_review_bracket(self):
+        return stats.rating_by_review_bracket(self.booking)
+
+    def reviews_rating_correlation(self):
+        return stats.reviews_rating_correlation(self.booking)
+
+    def words_by_price_bracket(self):
+        return stats.words_by_price_bracket(self.comments())
+
+    def price_words_correlation(self):
+        return stats.price_words_correlation(self.comments())
+
+
+def correlation(source):
+    print("\n\n--- 1. CORRELATION: PRICE vs RATING ---")
+    corr = source.price_rating_correlation()
+    r, p = corr["pearson"]
+    print(f"Pearson correlation: {r:.4f} (p-value: {p:.2e})")
+    r, p = corr["spearman"]
+    print(f"Spearman correlation: {r:.4f} (p-value: {p:.2e})")
+    print("\nRating by price bracket:")
+    print(source.rating_by_price_bracket().to_string())
+
+
+def labels(source):
+    print("\n\n--- 2. REVIEW LABELS vs ACTUAL RATINGS ---")
+    print(source.review_label_stats().to_string())
+
+
+def room_gap(source):
+    print("\n\n--- 3. ROOM SCORE vs OVERALL RATING (GAP) ---")
+    gap = source.room_gap_summary()
+    print(f"Hotels with both scores: {gap['hotels']}")
+    print(f"Mean gap (room - overall): {gap['mean_gap']:.2f}")
+    print(f"Hotels where room > overall: {gap['room_higher']} ({gap['room_higher_pct']:.1f}%)")
+    print(f"Hotels where room < overall: {gap['room_lower']} ({gap['room_lower_pct']:.1f}%)")
+
+    print("\nBiggest negative gaps (room disappoints vs overall):")
+    worst_rooms = gap["worst_rooms"][["hotel_name", "location", "rating", "room_score", "gap", "price_eur"]]
+    print(worst_rooms.to_string(index=False))
+
+
+def locations(source):
+    print("\n\n--- 4. LOCATION: PRICE vs QUALITY ---")
+    loc_deep = source.location_stats()
+    print("\nBEST VALUE locations (high rating, low price):")
+    print(loc_deep.nlargest(10, "value_index")[LOCATION_COLUMNS].to_string(index=False))
+    print("\nWORST VALUE locations (low rating, high price):")
+    print(loc_deep.nsmallest(10, "value_index")[LOCATION_COLUMNS].to_string(index=False))
+
+
+def residuals(source):
+    print("\n\n--- 5. OVERPRICED vs UNDERPRICED HOTELS ---")
+    coeffs, overpriced, underpriced = source.residual_extremes()
+    print(f"Linear model: Rating = {coeffs[0]:.6f} * Price + {coeffs[1]:.2f}")
+
+    print("\nMost OVERPRICED (low rating for price, min 50 reviews):")
+    print(overpriced[HOTEL_COLUMNS].to_string(index=False))
+    print("\nMost UNDERPRICED / best surprises (high rating for price, min 50 reviews):")
+    print(underpriced[HOTEL_COLUMNS].to_string(index=False))
+
+
+def bed_types(source):
+    print("\n\n--- 6. BED TYPE IMPACT ---")
+    print(source.bed_type_stats().to_string(index=False))
+
+
+def popularity(source):
+    print("\n\n--- 7. POPULARITY BIAS: REVIEWS vs RATING ---")
+    print(source.rating_by_review_bracket().to_string())
+    corr_rev, p_rev = source.reviews_rating_correlation()
+    print(f"\nSpearman corr (num_reviews vs rating): {corr_rev:.4f} (p={p_rev:.2e})")
+
+
+def comments(source):
+    print("\n\n--- 8. TRIPADVISOR: COMMENT LENGTH ANALYSIS ---")
+    print(source.words_by_price_bracket().to_string())
+    corr_c, p_c = source.price_words_correlation()
+    print(f"\nSpearman corr (price vs comment length): {corr_c:.4f} (p={p_c:.2e})")
+
+
+def key_findings(source):
+    spearman, _ = source.price_rating_correlation()["spearman"]
+    room_higher_pct = source.room_gap_summary()["room_higher_pct"]
+    corr_rev, _ = source.reviews_rating_correlation()
+    corr_c, _ = source.price_words_correlation()
+
+    print("\n\n" + "=" * 70)
+    print("KEY FINDINGS")
+    print("=" * 70)
+    print(f"""
+1. PRICE-RATING CORRELATION: Weak positive (Spearman={spearman:.3f}).
+   Paying more does NOT guarantee a significantly better experience.
+
+2. ROOM SCORE GAP: {room_higher_pct:.0f}% of hotels have room scores
+   HIGHER than their overall rating. Rooms are generally the strongest point.
+
+3. BEST VALUE LOCATIONS: Budget-friendly areas deliver ratings nearly as
+   high as premium destinations.
+
+4. OVERPRICED HOTELS EXIST: Some expensive hotels consistently underperform
+   relative to their price point (see residual analysis).
+
+5. POPULARITY BIAS: Hotels with more reviews tend to have slightly higher
+   ratings (Spearman={corr_rev:.3f}), suggesting a survivorship/visibility effect.
+
+6. REVIEW LENGTH: Guests at cheaper hotels write {'longer' if corr_c < 0 else 'shorter'}
+   comments (corr={corr_c:.3f}), possibly because they have more to report.
+""")
+
+
+SECTIONS = {
+    "correlation": correlation,
+    "labels": labels,
+    "room-gap": room_gap,
+    "locations": locations,
+    "residuals": residuals,
+    "bed-types": bed_types,
+    "popularity": popularity,
+    "comments": comments,
+    "findings": key_findings,
+}
+
+
+def print_sections(source, sections=None):
+    """Print the selected report sections (all of them by default) from ``source``."""
+    pd.set_option("display.max_columns", 20)
+    pd.set_option("display.width", 120)
+
+    print("=" * 70)
+    print("DEEP ANALYSIS - HOTEL DATASET")
+    print("=" * 70)
+    for name in sections or SECTIONS:
+        with instrument.span(f"report.{name}"):
+            SECTIONS[name](source)
+
+
+def print_report(booking, tripadvisor, sections=None):
+    print_sections(FrameSource(booking, tripadvisor), sections)
@@ -0,0 +1,278 @@
+"""Stratified samples for fast exploratory runs, with sampling errors.
+
+``sample_csv`` reads a cleaned CSV once, in chunks, and keeps at most
+``per_stratum`` rows of every stratum (location x price bracket for
+Booking.com, price bracket for TripAdvisor). Each row gets a uniform random
+key and a stratum keeps the rows with the smallest keys seen so far, which is
+reservoir sampling with the reservoirs merged chunk by chunk. Every sampled
+row carries its stratum and its weight ``N_h / n_h``.
+
+Estimates are weighted (``domain_mean``, ``domain_median``) and come with a
+standard error from the stratified variance formula with finite-population
+correction. Domains that cut across strata (review brackets, comment price
+brackets) use the linearized ratio-estimator variance. A stratum sampled in
+full contributes no error, so with a large ``per_stratum`` the estimates are
+exactly the full-data figures.
+
+    booking, tripadvisor = load_sample()        # drawn once, then read from disk
+    print_estimates(booking, tripadvisor)
+    charts.render_all(*map(self_weighting, (booking, tripadvisor)))
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import compression, features, paths
+
+SAMPLE_FILES = {
+    "booking": os.path.join(paths.TABLES_DIR, "sample_booking.csv"),
+    "tripadvisor": os.path.join(paths.TABLES_DIR, "sample_tripadvisor.csv"),
+}
+# The cleaned files (path, size, mtime) and parameters the saved samples were drawn from
+SAMPLE_SOURCE = os.path.join(paths.TABLES_DIR, "sample_source.json")
+PER_STRATUM = 50
+CHUNKSIZE = 100_000
+Z_95 = 1.96
+
+
+def strata(frame):
+    """Stratum label of every row: location (when present) and price bracket."""
+    bracket = features.price_bracket(frame).astype(str)
+    if "location" not in frame:
+        return bracket
+    return frame["location"].fillna("").astype(str) + " | " + bracket
+
+
+def reservoir_sample(chunks, per_stratum=PER_STRATUM, seed=0):
+    """Stratified uniform sample of the rows of ``chunks`` (an iterable of frames)."""
+    rng = np.random.default_rng(seed)
+    pool, population = None, pd.Series(dtype=np.int64)
+    for chunk in chunks:
+        chunk = chunk.assign(stratum=strata(chunk).to_numpy(), _key=rng.random(len(chunk)))
+        population = population.add(chunk["stratum"].value_counts(), fill_value=0)
+        pool = chunk if pool is None else pd.concat([pool, chunk], ignore_index=True)
+        pool = pool.sort_values("_key", kind="stable").groupby("stratum", sort=False).head(per_stratum)
+    sample = pool.sort_values(["stratum", "_key"]).drop(columns="_key").reset_index(drop=True)
+    sample["stratum"] = sample["stratum"].astype("category")
+    taken = sample["stratum"].map(sample["stratum"].value_counts())
+    sample["weight"] = sample["stratum"].map(population).to_numpy(dtype=float) / taken.to_numpy()
+    return sample
+
+
+def sample_csv(path, per_stratum=PER_STRATUM, chunksize=CHUNKSIZE, seed=0):
+    with pd.read_csv(compression.resolve(path), chunksize=chunksize) as chunks:
+        return reservoir_sample(chunks, per_stratum, seed)
+
+
+def _sources():
+    files = [compression.resolve(path) for path in (paths.BOOKING_CLEANED, paths.TRIPADVISOR_CLEANED)]
+    return [[path, os.stat(path).st_size, os.stat(path).st_mtime_ns] for path in files]
+
+
+def draw(per_stratum=PER_STRATUM, chunksize=CHUNKSIZE, seed=0):
+    """Sample both cleaned CSVs and save the samples to ``SAMPLE_FILES``."""
+    sources = _sources()
+    frames = (
+        sample_csv(paths.BOOKING_CLEANED, per_stratum, chunksize, seed),
+        sample_csv(paths.TRIPADVISOR_CLEANED, per_stratum, chunksize, seed),
+    )
+    os.makedirs(paths.TABLES_DIR, exist_ok=True)
+    for frame, path in zip(frames, SAMPLE_FILES.values()):
+        frame.to_csv(path, index=False)
+    with open(SAMPLE_SOURCE, "w") as f:
+        json.dump({"sources": sources, "per_stratum": per_stratum, "seed": seed}, f)
+    return frames
+
+
+def load_sample(**kwargs):
+    """The saved (booking, tripadvisor) samples.
+
+    Drawn first if missing, and drawn again (with the saved ``per_stratum``
+    and seed unless given) when a cleaned CSV changed since.
+    """
+    try:
+        with open(SAMPLE_SOURCE) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        saved = None
+    if saved is None or not all(os.path.exists(path) for path in SAMPLE_FILES.values()):
+        return draw(**kwargs)
+    if saved["sources"] != _sources():
+        return draw(**{"per_stratum": saved["per_stratum"], "seed": saved["seed"], **kwargs})
+    return tuple(pd.read_csv(path, dtype={"stratum": "category"}) for path in SAMPLE_FILES.values())
+
+
+def self_weighting(sample):
+    """Subsample in which every row has the same weight, for charts.
+
+    Stratum ``h`` keeps ``N_h / w_max`` of its rows (``w_max`` is the largest
+    weight), so stratum shares match the population. Rows are in random key
+    order within a stratum, so the first ones are a uniform subsample.
+    """
+    w_max = sample["weight"].max()
+    keep = (sample.groupby("stratum")["weight"].transform("size") * sample["weight"] / w_max).round()
+    position = sample.groupby("stratum").cumcount()
+    return sample[position < keep].reset_index(drop=True)
+
+
+def _stratum_sizes(sample):
+    taken = sample.groupby("stratum")["weight"].agg(n="size", weight="first")
+    taken["N"] = taken["n"] * taken["weight"]
+    return taken
+
+
+def _domain(sample, by):
+    if by is None:
+        return pd.Series("all", index=sample.index)
+    return sample[by] if isinstance(by, str) else by
+
+
+def domain_mean(sample, value, by=None):
+    """Weighted mean of ``value`` per ``by`` group with its standard error.
+
+    Uses the linearized variance of a ratio estimator: the deviations
+    ``z = (y - mean_d) / N_d`` of the domain rows (zero elsewhere) are summed
+    with the stratified variance ``sum_h N_h^2 (1 - n_h/N_h) s_zh^2 / n_h``.
+    Rows with a missing ``value`` are outside every domain.
+    """
+    y = sample[value] if isinstance(value, str) else pd.Series(value, index=sample.index)
+    domain = _domain(sample, by)
+    ok = y.notna() & domain.notna()
+    rows = pd.DataFrame({"stratum": sample["stratum"], "d": domain, "w": sample["weight"],
+                         "y": y.astype(float)})[ok]
+    rows["wy"] = rows["w"] * rows["y"]
+    est = rows.groupby("d", observed=True).agg(n=("y", "size"), population=("w", "sum"), wy=("wy", "sum"))
+    est["mean"] = est["wy"] / est["population"]
+
+    mean, population = (rows["d"].map(est[c]).astype(float) for c in ("mean", "population"))
+    rows["z"] = (rows["y"] - mean) / population
+    rows["z2"] = rows["z"] ** 2
+    sums = rows.groupby(["d", "stratum"], observed=True)[["z", "z2"]].sum().reset_index()
+    sizes = _stratum_sizes(sample)
+    n = sums["stratum"].map(sizes["n"]).to_numpy(dtype=float)
+    big_n = sums["stratum"].map(sizes["N"]).to_numpy(dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s2 = np.where(n > 1, (sums["z2"] - sums["z"] ** 2 / n) / (n - 1), 0.0)
+        sums["var"] = np.where(n < big_n, big_n ** 2 * (1 - n / big_n) * s2 / n, 0.0)
+    est["se"] = np.sqrt(sums.groupby("d", observed=True)["var"].sum().clip(lower=0))
+    return est[["n", "population", "mean", "se"]]
+
+
+def _weighted_quantiles(codes, y, w, q):
+    """Per-group ``q[code]``-quantiles of ``y`` under weights ``w``.
+
+    One sort by (group, value); the cumulative weight share of each group is
+    offset by its code so that a single ``searchsorted`` finds every group's
+    quantile. At an exact tie the two neighbours are averaged, as pandas does.
+    """
+    order = np.lexsort((y, codes))
+    codes, y, w = codes[order], y[order], w[order]
+    totals = np.bincount(codes, weights=w)
+    cum = np.cumsum(w)
+    starts = np.searchsorted(codes, np.arange(len(totals)))
+    share = (cum - (cum[starts] - w[starts])[codes]) / totals[codes]
+    ends = np.searchsorted(codes, np.arange(len(totals)), side="right") - 1
+    # A q near 0 can land on the previous group's last row (its share is 1.0): keep it in its group
+    i = np.clip(np.searchsorted(codes + share, np.arange(len(totals)) + q - 1e-12), starts, ends)
+    tie = np.isclose(share[i], q) & (i < ends)
+    return np.where(tie, (y[i] + y[np.minimum(i + 1, len(y) - 1)]) / 2, y[i])
+
+
+def domain_median(sample, value, by=None):
+    """Weighted median of ``value`` per ``by`` group with a Woodruff standard error.
+
+    The standard error of the estimated CDF at the median (a domain mean of
+    ``y <= median``) gives a 95% interval on the probability scale, which is
+    mapped back through the weighted quantiles and halved.
+    """
+    y = sample[value].astype(float)
+    domain = _domain(sample, by)
+    ok = (y.notna() & domain.notna()).to_numpy()
+    codes, labels = pd.factorize(domain[ok], sort=True)
+    values, weights = y.to_numpy()[ok], sample["weight"].to_numpy()[ok]
+    median = _weighted_quantiles(codes, values, weights, np.full(len(labels), 0.5))
+
+    below = pd.Series(np.nan, index=sample.index)
+    below[ok] = (values <= median[codes]).astype(float)
+    spread = domain_mean(sample, below, by=domain)["se"].reindex(labels).to_numpy()
+    lo = _weighted_quantiles(codes, values, weights, np.maximum(0.5 - Z_95 * spread, 0.0))
+    hi = _weighted_quantiles(codes, values, weights, np.minimum(0.5 + Z_95 * spread, 1.0))
+    return pd.DataFrame({"median": median, "se": (hi - lo) / (2 * Z_95)}, index=labels)
+
+
+def _table(sample, by, means=(), medians=(), min_count=0):
+    """One row per ``by`` group: ``<stat>`` and ``<stat>_se`` columns plus the estimated count."""
+    by = _domain(sample, by)
+    if not isinstance(by.dtype, pd.CategoricalDtype):
+        by = by.astype("category")  # factorized once instead of in every groupby
+    columns = {}
+    for name, value in means:
+        est = domain_mean(sample, value, by)
+        columns[name], columns[f"{name}_se"] = est["mean"], est["se"]
+    for name, value in medians:
+        est = domain_median(sample, value, by)
+        columns[name], columns[f"{name}_se"] = est["median"], est["se"]
+    count = domain_mean(sample, pd.Series(1.0, index=sample.index), by)
+    table = pd.DataFrame(columns)
+    table["count"] = count["population"].round().astype(np.int64)
+    table["sampled"] = count["n"]
+    table.index.name = by.name
+    return table[table["count"] >= min_count]
+
+
+def rating_by_price_bracket(booking):
+    return _table(booking, features.price_bracket(booking),
+                  means=[("mean_rating", "rating"), ("mean_room_score", "room_score")],
+                  medians=[("median_rating", "rating")])
+
+
+def rating_by_review_bracket(booking):
+    return _table(booking, features.review_bracket(booking),
+                  means=[("mean_rating", "rating")], medians=[("median_price", "price_eur")])
+
+
+def location_stats(booking, min_count=features.MIN_LOCATION_HOTELS):
+    """Sampled ``features.location_stats``; the value index error ignores the covariance."""
+    loc = _table(booking, "location", means=[("mean_rating", "rating")],
+                 medians=[("median_price", "price_eur")], min_count=min_count).reset_index()
+    loc["value_index"] = loc["mean_rating"] / loc["median_price"] * 100
+    loc["value_index_se"] = loc["value_index"] * np.hypot(loc["mean_rating_se"] / loc["mean_rating"],
+                                                          loc["median_price_se"] / loc["median_price"])
+    return loc
+
+
+def words_by_price_bracket(tripadvisor):
+    ta = features.comments(tripadvisor)
+    return _table(ta, ta["price_bracket"], means=[("mean_words", "comment_words")],
+                  medians=[("median_price", "price_eur")])
+
+
+def print_estimates(booking, tripadvisor):
+    """The bracket and location tables of the deep-analysis report, estimated from samples."""
+    pd.set_option("display.max_columns", 20)
+    pd.set_option("display.width", 140)
+    print("=" * 70)
+    print("SAMPLED ESTIMATES (columns ending in _se are standard errors)")
+    print("=" * 70)
+    print(f"Booking.com: {len(booking)} sampled rows from {booking['stratum'].nunique()} strata, "
+          f"representing {booking['weight'].sum():.0f} hotels")
+    print(f"TripAdvisor: {len(tripadvisor)} sampled rows from {tripadvisor['stratum'].nunique()} strata, "
+          f"representing {tripadvisor['weight'].sum():.0f} hotels")
+
+    print("\nRating by price bracket:")
+    print(rating_by_price_bracket(booking).to_string(float_format="{:.3f}".format))
+    print("\nRating by review bracket:")
+    print(rating_by_review_bracket(booking).to_string(float_format="{:.3f}".format))
+
+    loc = location_stats(booking)
+    columns = ["location", "median_price", "median_price_se", "mean_rating", "mean_rating_se",
+               "value_index", "value_index_se", "count"]
+    print("\nBEST VALUE locations:")
+    print(loc.nlargest(10, "value_index")[columns].to_string(index=False, float_format="{:.3f}".format))
+    print("\nWORST VALUE locations:")
+    print(loc.nsmallest(10, "value_index")[columns].to_string(index=False, float_format="{:.3f}".format))
+
+    print("\nTripAdvisor comment length by price bracket:")
+    print(words_by_price_bracket(tripadvisor).to_string(float_format="{:.3f}".format))
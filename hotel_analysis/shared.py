@@ -0,0 +1,196 @@
+"""Frame columns in shared memory, attached by pool workers without a copy.
+
+Submitting a DataFrame to a ``ProcessPoolExecutor`` pickles it for every task,
+and every worker holds its own copy. ``SharedFrame.create`` instead writes
+the columns once into one shared-memory block (or a memory-mapped file with
+``path=``); its ``handle`` is a small dict of offsets that pickles in
+microseconds. ``SharedFrame.attach(handle)`` in a worker maps the same pages
+and wraps them in read-only NumPy views, so adding workers adds neither RAM
+nor serialization time:
+
+    with shared.SharedFrame.create(booking) as owner:
+        pool.submit(task, owner.handle, rows)
+
+    def task(handle, rows):
+        data = shared.SharedFrame.attach(handle)
+        data.column("price_eur")            # zero-copy float64 view
+        data.frame(rows)                    # the DataFrame, for those rows only
+
+Numbers and booleans are stored as they are; nullable integer columns as
+values plus a mask. Strings and categoricals are dictionary-encoded: int32
+codes per row and the distinct values as one UTF-8 blob with offsets, decoded
+in the worker only for the codes it asks for. ``frame()`` restores the
+original dtypes and index.
+"""
+import mmap
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+ALIGN = 64
+
+_attached = {}
+
+
+def _encode(column):
+    """Arrays and kind of one column: ``{suffix: array}`` and the dtype to restore."""
+    dtype = column.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes, categories = column.cat.codes.to_numpy(np.int32), column.cat.categories
+        kind = "category"
+    elif pd.api.types.is_string_dtype(dtype) or dtype == object:
+        codes, categories = pd.factorize(column)
+        codes = codes.astype(np.int32)
+        kind = "string"
+    elif isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        mask = column.isna().to_numpy()
+        values = column.to_numpy(dtype=dtype.numpy_dtype, na_value=0)
+        return {"values": values, "mask": mask}, "masked"
+    else:
+        return {"values": column.to_numpy()}, "numpy"
+    blobs = [str(value).encode() for value in categories]
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in blobs], out=offsets[1:])
+    return {"codes": codes, "offsets": offsets, "blob": np.frombuffer(b"".join(blobs), dtype=np.uint8)}, kind
+
+
+class SharedFrame:
+    """Read-only NumPy views of a frame's columns in one shared buffer."""
+
+    def __init__(self, handle, buffer, closer, owner=False):
+        self.handle = handle
+        self.owner = owner
+        self._buffer = buffer
+        self._closer = closer
+        self._categories = {}
+        self.arrays = {}
+        for key, (dtype, offset, length) in handle["arrays"].items():
+            array = np.ndarray(length, dtype=dtype, buffer=buffer, offset=offset)
+            array.flags.writeable = False
+            self.arrays[key] = array
+
+    @classmethod
+    def create(cls, frame, path=None):
+        """Copy ``frame`` into a new shared-memory block, or a new file at ``path``."""
+        columns, arrays = [], {}
+        for name in frame.columns:
+            parts, kind = _encode(frame[name])
+            columns.append((name, kind, str(frame[name].dtype)))
+            arrays.update({f"{name}\0{suffix}": array for suffix, array in parts.items()})
+        if pd.api.types.is_integer_dtype(frame.index.dtype):
+            arrays["\0index"] = frame.index.to_numpy(np.int64)
+
+        layout, size = {}, 0
+        for key, array in arrays.items():
+            layout[key] = (array.dtype.str, size, len(array))
+            size += -(-max(array.nbytes, 1) // ALIGN) * ALIGN
+        handle = {"rows": len(frame), "columns": columns, "arrays": layout, "size": max(size, 1)}
+
+        if path is None:
+            shm = shared_memory.SharedMemory(create=True, size=handle["size"])
+            handle["name"] = shm.name
+            buffer, closer = shm.buf, shm
+        else:
+            with open(path, "wb") as f:
+                f.truncate(handle["size"])
+            handle["path"] = os.path.abspath(path)
+            with open(path, "r+b") as f:
+                buffer = closer = mmap.mmap(f.fileno(), handle["size"])
+        for key, array in arrays.items():
+            _, offset, length = layout[key]
+            np.ndarray(length, dtype=array.dtype, buffer=buffer, offset=offset)[:] = array
+        return cls(handle, buffer, closer, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        """Views of the block or file of ``handle``; attached once per process."""
+        key = handle.get("name") or handle["path"]
+        if key not in _attached:
+            if "name" in handle:
+                try:
+                    shm = shared_memory.SharedMemory(handle["name"], track=False)
+                except TypeError:
+                    # Before Python 3.13 attaching registers the block again; pool
+                    # workers share the creator's resource tracker, so that is a no-op
+                    shm = shared_memory.SharedMemory(handle["name"])
+                buffer, closer = shm.buf, shm
+            else:
+                with open(handle["path"], "rb") as f:
+                    buffer = closer = mmap.mmap(f.fileno(), handle["size"], access=mmap.ACCESS_READ)
+            _attached[key] = cls(handle, buffer, closer)
+        return _attached[key]
+
+    def __len__(self):
+        return self.handle["rows"]
+
+    def column(self, name):
+        """Values (numbers) or codes (strings, categories) of ``name``, without a copy."""
+        kinds = {column: kind for column, kind, _ in self.handle["columns"]}
+        return self.arrays[f"{name}\0{'values' if kinds[name] in ('numpy', 'masked') else 'codes'}"]
+
+    def categories(self, name, codes=None):
+        """Object array of the distinct values of ``name`` (only ``codes`` decoded, if given)."""
+        if name not in self._categories:
+            offsets = self.arrays[f"{name}\0offsets"]
+            self._categories[name] = np.full(len(offsets) - 1, None, dtype=object)
+        categories = self._categories[name]
+        wanted = np.arange(len(categories)) if codes is None else np.unique(codes[codes >= 0])
+        missing = wanted[pd.isna(categories[wanted])]
+        if len(missing):
+            blob, offsets = self.arrays[f"{name}\0blob"], self.arrays[f"{name}\0offsets"].tolist()
+            for code in missing.tolist():
+                categories[code] = blob[offsets[code]:offsets[code + 1]].tobytes().decode()
+        return categories
+
+    def series(self, name, rows=None):
+        """Column ``name`` (or ``rows`` of it) with its original dtype."""
+        kind, dtype = next((k, d) for column, k, d in self.handle["columns"] if column == name)
+        take = (lambda array: array) if rows is None else (lambda array: array[rows])
+        if kind == "numpy":
+            return pd.Series(take(self.arrays[f"{name}\0values"]), name=name, copy=False)
+        if kind == "masked":
+            values = pd.Series(take(self.arrays[f"{name}\0values"]), name=name, dtype=dtype)
+            return values.mask(take(self.arrays[f"{name}\0mask"]))
+        codes = take(self.arrays[f"{name}\0codes"])
+        if kind == "category":
+            return pd.Series(pd.Categorical.from_codes(codes, categories=self.categories(name), validate=False),
+                             name=name)
+        return pd.Series(np.append(self.categories(name, codes), np.nan)[codes], name=name, dtype=dtype)
+
+    def frame(self, rows=None, columns=None):
+        """The frame (or ``rows`` of it, by position) with its original dtypes and index.
+
+        Without ``rows`` the number columns are views of the shared buffer.
+        """
+        columns = columns or [column for column, _, _ in self.handle["columns"]]
+        frame = pd.DataFrame({name: self.series(name, rows) for name in columns}, copy=False)
+        if "\0index" in self.arrays:
+            index = self.arrays["\0index"]
+            frame.index = pd.Index(index if rows is None else index[rows])
+        return frame
+
+    def close(self):
+        """Drop this process's mapping (views still in use keep it alive until they go)."""
+        self.arrays, self._buffer, self._categories = {}, None, {}
+        _attached.pop(self.handle.get("name") or self.handle.get("path"), None)
+        try:
+            self._closer.close()
+        except BufferError:
+            pass
+
+    def unlink(self):
+        """Free the block or delete the file; only the creator does this."""
+        if "name" in self.handle:
+            self._closer.unlink()
+        else:
+            os.remove(self.handle["path"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
@@ -0,0 +1,287 @@
+"""SQLite backend for the deep-analysis report.
+
+``load()`` streams the cleaned CSVs into an on-disk SQLite file in chunks, so
+only one chunk is ever held in memory, and indexes location, price_eur and
+num_reviews. ``Database`` answers every report table with SQL (brackets as
+CASE expressions, medians and average ranks with window functions), returning
+the same tables as ``report.FrameSource``, so the report can run on datasets
+larger than RAM:
+
+    python -m hotel_analysis sql-load
+    python -m hotel_analysis stats --backend sql
+"""
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from . import compression, features, paths, stats
+
+DB_PATH = os.path.join(paths.ROOT, "output", "hotels.sqlite")
+CHUNKSIZE = 100_000
+
+SCHEMA = """
+CREATE TABLE booking (
+    hotel_name TEXT, location TEXT, rating REAL, review_score TEXT,
+    num_reviews REAL, room_score REAL, room_type TEXT, bed_type TEXT,
+    price_bdt REAL, currency TEXT, price_eur REAL, source TEXT, price_outlier INTEGER
+);
+CREATE TABLE tripadvisor (
+    hotel_name TEXT, price_bdt REAL, num_reviews REAL, comment TEXT,
+    currency TEXT, price_eur REAL, source TEXT, comment_words INTEGER
+);
+"""
+
+INDEXES = """
+CREATE INDEX booking_location ON booking (location);
+CREATE INDEX booking_price_eur ON booking (price_eur);
+CREATE INDEX booking_num_reviews ON booking (num_reviews);
+CREATE INDEX tripadvisor_price_eur ON tripadvisor (price_eur);
+"""
+
+
+def load(db_path=DB_PATH, booking_csv=paths.BOOKING_CLEANED,
+         tripadvisor_csv=paths.TRIPADVISOR_CLEANED, chunksize=CHUNKSIZE):
+    """(Re)build the database from the cleaned CSVs; returns the row counts."""
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    rows = {}
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        for table, csv in (("booking", booking_csv), ("tripadvisor", tripadvisor_csv)):
+            rows[table] = 0
+            for chunk in pd.read_csv(compression.resolve(csv), chunksize=chunksize):
+                if table == "tripadvisor":
+                    # Word counts are needed by section 8; str.split() has no SQL equivalent
+                    chunk["comment_words"] = chunk["comment"].str.split().str.len()
+                chunk.to_sql(table, conn, if_exists="append", index=False)
+                rows[table] += len(chunk)
+        conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+    conn.close()
+    return rows
+
+
+def _bracket_case(column, brackets):
+    """CASE expression giving the ``pd.cut`` bin position (right-closed), else NULL."""
+    bins, _ = brackets
+    whens = " ".join(f"WHEN {column} > {lo} AND {column} <= {hi} THEN {i}"
+                     for i, (lo, hi) in enumerate(zip(bins[:-1], bins[1:])))
+    return f"CASE {whens} END"
+
+
+def _bracket_index(positions, brackets, name):
+    labels = brackets[1]
+    return pd.CategoricalIndex([labels[int(i)] for i in positions], categories=labels,
+                               ordered=True, name=name)
+
+
+class Database:
+    """Report tables computed with SQL from a database built by ``load()``."""
+
+    def __init__(self, db_path=DB_PATH):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"{db_path} not found, run `python -m hotel_analysis sql-load`")
+        self.conn = sqlite3.connect(db_path)
+
+    def close(self):
+        self.conn.close()
+
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def scalar_row(self, sql, params=()):
+        return self.conn.execute(sql, params).fetchone()
+
+    # -- building blocks ----------------------------------------------------
+
+    def grouped(self, table, key, where, aggregates, median=None):
+        """Per-group aggregates, plus the exact median of ``median`` (column, name).
+
+        ``key`` is a column or expression (NULL keys are dropped), ``aggregates``
+        maps output names to SQL aggregate expressions. Rows come back ordered
+        by key.
+        """
+        selects = ", ".join(f"{expr} AS {name}" for name, expr in aggregates.items())
+        sql = f"SELECT {key} AS grp, {selects} FROM {table} WHERE {where} AND {key} IS NOT NULL GROUP BY grp"
+        if median:
+            column, name = median
+            sql = f"""
+                WITH agg AS ({sql}),
+                ranked AS (
+                    SELECT {key} AS grp, {column} AS v,
+                           ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY {column}) AS rn,
+                           COUNT(*) OVER (PARTITION BY {key}) AS n
+                    FROM {table}
+                    WHERE {where} AND {key} IS NOT NULL AND {column} IS NOT NULL
+                ),
+                med AS (SELECT grp, AVG(v) AS {name} FROM ranked
+                        WHERE rn IN ((n + 1) / 2, (n + 2) / 2) GROUP BY grp)
+                SELECT agg.*, med.{name} FROM agg LEFT JOIN med USING (grp)
+            """
+        return self.query(sql + " ORDER BY grp")
+
+    def _pearson_sql(self, sql, n=None, mx=None, my=None):
+        """Pearson r and p-value of the (x, y) rows returned by ``sql``.
+
+        Centred sums need the means first; pass them when they are known to
+        save the first scan.
+        """
+        if n is None:
+            n, mx, my = self.scalar_row(f"SELECT COUNT(*), AVG(x), AVG(y) FROM ({sql})")
+        sxy, sxx, syy = self.scalar_row(
+            f"SELECT SUM((x - ?) * (y - ?)), SUM((x - ?) * (x - ?)), SUM((y - ?) * (y - ?)) FROM ({sql})",
+            (mx, my, mx, mx, my, my),
+        )
+        # No rows, or a constant column: no correlation (NaN, as stats.pearson), not a clamped 1.0
+        if n < 2 or sxy is None or not sxx * syy > 0:
+            return np.nan, np.nan
+        r = float(np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0))
+        return r, stats._pvalue(r, n)
+
+    def pearson(self, table, x, y, where="1"):
+        return self._pearson_sql(f"SELECT {x} AS x, {y} AS y FROM {table} "
+                                 f"WHERE {where} AND {x} IS NOT NULL AND {y} IS NOT NULL")
+
+    def spearman(self, table, x, y, where="1"):
+        """Spearman correlation: Pearson over average ranks (ties share their mean rank)."""
+        rows = f"SELECT {x} AS a, {y} AS b FROM {table} WHERE {where} AND {x} IS NOT NULL AND {y} IS NOT NULL"
+        ranks = f"""
+            SELECT (RANK() OVER (ORDER BY a) * 2 + COUNT(*) OVER (PARTITION BY a) - 1) / 2.0 AS x,
+                   (RANK() OVER (ORDER BY b) * 2 + COUNT(*) OVER (PARTITION BY b) - 1) / 2.0 AS y
+            FROM ({rows})
+        """
+        # Average ranks of n rows always have mean (n + 1) / 2, so the ranking
+        # window only runs once
+        n, = self.scalar_row(f"SELECT COUNT(*) FROM ({rows})")
+        return self._pearson_sql(ranks, n, (n + 1) / 2, (n + 1) / 2)
+
+    # -- report tables ------------------------------------------------------
+
+    def price_rating_correlation(self):
+        return {
+            "pearson": self.pearson("booking", "price_eur", "rating"),
+            "spearman": self.spearman("booking", "price_eur", "rating"),
+        }
+
+    def rating_by_price_bracket(self):
+        key = _bracket_case("price_eur", features.PRICE_BRACKETS)
+        table = self.grouped("booking", key, "1", {
+            "mean_rating": "AVG(rating)",
+            "mean_room_score": "AVG(room_score)",
+            "count": "COUNT(hotel_name)",
+        }, median=("rating", "median_rating"))
+        table.index = _bracket_index(table.pop("grp"), features.PRICE_BRACKETS, "price_bracket")
+        return table[["mean_rating", "median_rating", "mean_room_score", "count"]]
+
+    def review_label_stats(self, min_count=10):
+        # Two-pass sample standard deviation, as in pandas
+        table = self.query("""
+            WITH m AS (SELECT review_score, AVG(rating) AS mean FROM booking GROUP BY review_score)
+            SELECT review_score AS grp, SUM((rating - m.mean) * (rating - m.mean)) AS ss
+            FROM booking JOIN m USING (review_score) WHERE rating IS NOT NULL GROUP BY grp ORDER BY grp
+        """).set_index("grp")
+        label_stats = self.grouped("booking", "review_score", "1", {
+            "mean_rating": "AVG(rating)",
+            "n_rating": "COUNT(rating)",
+            "min_rating": "MIN(rating)",
+            "max_rating": "MAX(rating)",
+            "count": "COUNT(hotel_name)",
+        }, median=("price_eur", "median_price")).set_index("grp")
+        n = label_stats.pop("n_rating")
+        label_stats.insert(1, "std_rating", np.sqrt(table["ss"] / (n - 1)).where(n > 1))
+        label_stats = label_stats[["mean_rating", "std_rating", "min_rating", "max_rating",
+                                   "median_price", "count"]]
+        label_stats.index.name = "review_score"
+        label_stats = label_stats.sort_values("mean_rating", ascending=False)
+        return label_stats[label_stats["count"] >= min_count]
+
+    def room_gap_summary(self):
+        hotels, mean_gap, higher, lower = self.scalar_row("""
+            SELECT COUNT(*), AVG(room_score - rating),
+                   SUM(room_score - rating > 0), SUM(room_score - rating < 0)
+            FROM booking WHERE room_score IS NOT NULL
+        """)
+        worst_rooms = self.query("""
+            SELECT *, room_score - rating AS gap FROM booking WHERE room_score IS NOT NULL
+            ORDER BY gap, rowid LIMIT 10
+        """)
+        return {
+            "hotels": hotels,
+            "mean_gap": mean_gap,
+            "room_higher": int(higher or 0),
+            "room_higher_pct": (higher or 0) / hotels * 100,
+            "room_lower": int(lower or 0),
+            "room_lower_pct": (lower or 0) / hotels * 100,
+            "worst_rooms": worst_rooms,
+        }
+
+    def location_stats(self, min_count=features.MIN_LOCATION_HOTELS):
+        loc = self.grouped("booking", "location", "1", {
+            "mean_rating": "AVG(rating)",
+            "mean_room_score": "AVG(room_score)",
+            "count": "COUNT(hotel_name)",
+        }, median=("price_eur", "median_price")).rename(columns={"grp": "location"})
+        loc = loc[["location", "median_price", "mean_rating", "mean_room_score", "count"]]
+        loc = loc[loc["count"] >= min_count].copy()
+        loc["value_index"] = (loc["mean_rating"] / loc["median_price"]) * 100
+        return loc
+
+    def fit_price_rating(self, max_price=features.FIT_MAX_PRICE):
+        """Least-squares ``rating ~ price`` below ``max_price``, as ``[slope, intercept]``."""
+        where = f"price_eur < {max_price} AND rating IS NOT NULL"
+        mx, my = self.scalar_row(f"SELECT AVG(price_eur), AVG(rating) FROM booking WHERE {where}")
+        sxy, sxx = self.scalar_row(
+            f"SELECT SUM((price_eur - ?) * (rating - ?)), SUM((price_eur - ?) * (price_eur - ?)) "
+            f"FROM booking WHERE {where}", (mx, my, mx, mx))
+        slope = sxy / sxx
+        return np.array([slope, my - slope * mx])
+
+    def residual_extremes(self, n=10, min_reviews=features.MIN_REVIEWS):
+        coeffs = self.fit_price_rating()
+        sql = f"""
+            SELECT *, ? * price_eur + ? AS expected_rating,
+                   rating - (? * price_eur + ?) AS rating_residual
+            FROM booking
+            WHERE price_eur < {features.FIT_MAX_PRICE} AND num_reviews >= ?
+            ORDER BY rating_residual {{}}, rowid LIMIT ?
+        """
+        params = (*coeffs, *coeffs, min_reviews, n)
+        return coeffs, self.query(sql.format("ASC"), params), self.query(sql.format("DESC"), params)
+
+    def bed_type_stats(self, min_count=30):
+        bed_stats = self.grouped("booking", "bed_type", "1", {
+            "mean_rating": "AVG(rating)",
+            "count": "COUNT(hotel_name)",
+        }, median=("price_eur", "median_price")).rename(columns={"grp": "bed_type"})
+        bed_stats = bed_stats[["bed_type", "median_price", "mean_rating", "count"]]
+        bed_stats = bed_stats.sort_values("median_price", ascending=False)
+        return bed_stats[bed_stats["count"] >= min_count]
+
+    def rating_by_review_bracket(self):
+        key = _bracket_case("num_reviews", features.REVIEW_BRACKETS)
+        table = self.grouped("booking", key, "1", {
+            "mean_rating": "AVG(rating)",
+            "count": "COUNT(hotel_name)",
+        }, median=("price_eur", "median_price"))
+        table.index = _bracket_index(table.pop("grp"), features.REVIEW_BRACKETS, "review_bracket")
+        return table[["mean_rating", "median_price", "count"]]
+
+    def reviews_rating_correlation(self):
+        return self.spearman("booking", "num_reviews", "rating")
+
+    def words_by_price_bracket(self):
+        key = _bracket_case("price_eur", features.COMMENT_PRICE_BRACKETS)
+        table = self.grouped("tripadvisor", key, "comment IS NOT NULL", {
+            "mean_words": "AVG(comment_words)",
+            "count": "COUNT(hotel_name)",
+        }, median=("price_eur", "median_price"))
+        table.index = _bracket_index(table.pop("grp"), features.COMMENT_PRICE_BRACKETS, "price_bracket")
+        return table[["mean_words", "median_price", "count"]]
+
+    def price_words_correlation(self):
+        return self.spearman("tripadvisor", "price_eur", "comment_words", where="comment IS NOT NULL")
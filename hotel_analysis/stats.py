@@ -0,0 +1,172 @@
+"""Statistics behind the deep-analysis report.
+
+Correlations are computed with NumPy and their p-values with a small
+incomplete-beta routine (the same t-test scipy.stats uses), because importing
+``scipy.stats`` alone costs over a second of startup. Results are memoized on
+disk per input columns (see ``memo``).
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+from . import features, gaps, memo
+
+
+def _betacf(a, b, x, max_iter=10000, eps=1e-15):
+    # Continued fraction for the incomplete beta function (modified Lentz)
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                   -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1 + aa * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + aa / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1) < eps:
+            break
+    return h
+
+
+def betainc(a, b, x):
+    """Regularized incomplete beta I_x(a, b), matching ``scipy.special.betainc``."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1 - math.exp(log_front) * _betacf(b, a, 1 - x) / b
+
+
+def _pvalue(r, n):
+    df = n - 2
+    if df <= 0:
+        return np.nan
+    # Two-sided t-test, written as a regularized incomplete beta in r
+    return betainc(df / 2, 0.5, 1 - r * r)
+
+
+def _correlate(x, y):
+    if len(x) < 2:
+        return np.nan, np.nan
+    xm = x - x.mean()
+    ym = y - y.mean()
+    scale = np.sqrt(np.dot(xm, xm) * np.dot(ym, ym))
+    # A constant (or non-finite) column has no correlation, as in scipy: NaN, not a clamped 1.0
+    if not np.isfinite(scale) or scale == 0:
+        return np.nan, np.nan
+    r = float(np.clip(np.dot(xm, ym) / scale, -1.0, 1.0))
+    return r, _pvalue(r, len(x))
+
+
+@memo.memoize("stats.pearson")
+def _pearson(x, y):
+    return _correlate(x, y)
+
+
+@memo.memoize("stats.spearman")
+def _spearman(x, y):
+    return _correlate(pd.Series(x).rank().values, pd.Series(y).rank().values)
+
+
+def pearson(x, y):
+    """Pearson correlation and two-sided p-value, like ``scipy.stats.pearsonr``."""
+    return _pearson(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+
+
+def spearman(x, y):
+    """Spearman rank correlation and p-value, like ``scipy.stats.spearmanr``."""
+    return _spearman(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+
+
+def price_rating_correlation(booking):
+    return {
+        "pearson": pearson(booking["price_eur"], booking["rating"]),
+        "spearman": spearman(booking["price_eur"], booking["rating"]),
+    }
+
+
+def rating_by_price_bracket(booking):
+    return (
+        booking.groupby(features.price_bracket(booking), observed=True)
+        .agg(
+            mean_rating=("rating", "mean"),
+            median_rating=("rating", "median"),
+            mean_room_score=("room_score", "mean"),
+            count=("hotel_name", "count")
+        )
+    )
+
+
+def review_label_stats(booking, min_count=10):
+    label_stats = (
+        booking.groupby("review_score")
+        .agg(
+            mean_rating=("rating", "mean"),
+            std_rating=("rating", "std"),
+            min_rating=("rating", "min"),
+            max_rating=("rating", "max"),
+            median_price=("price_eur", "median"),
+            count=("hotel_name", "count")
+        )
+        .sort_values("mean_rating", ascending=False)
+    )
+    return label_stats[label_stats["count"] >= min_count]
+
+
+def room_gap_summary(booking):
+    return gaps.summary(booking)
+
+
+def bed_type_stats(booking, min_count=30):
+    bed_stats = (
+        booking.groupby("bed_type")
+        .agg(
+            median_price=("price_eur", "median"),
+            mean_rating=("rating", "mean"),
+            count=("hotel_name", "count")
+        )
+        .reset_index()
+        .sort_values("median_price", ascending=False)
+    )
+    return bed_stats[bed_stats["count"] >= min_count]
+
+
+def rating_by_review_bracket(booking):
+    return (
+        booking.groupby(features.review_bracket(booking), observed=True)
+        .agg(
+            mean_rating=("rating", "mean"),
+            median_price=("price_eur", "median"),
+            count=("hotel_name", "count")
+        )
+    )
+
+
+def reviews_rating_correlation(booking):
+    has_reviews = booking["num_reviews"].notna()
+    return spearman(booking.loc[has_reviews, "num_reviews"], booking.loc[has_reviews, "rating"])
+
+
+def words_by_price_bracket(ta):
+    return (
+        ta.groupby("price_bracket", observed=True)
+        .agg(
+            mean_words=("comment_words", "mean"),
+            median_price=("price_eur", "median"),
+            count=("hotel_name", "count")
+        )
+    )
+
+
+def price_words_correlation(ta):
+    return spearman(ta["price_eur"], ta["comment_words"])
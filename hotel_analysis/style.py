@@ -0,0 +1,45 @@
+"""Shared dark theme for charts and slides."""
+import os
+
+from . import instrument
+
+BG = "#0A1628"
+ACCENT = "#00D4AA"
+RED = "#FF6B6B"
+BLUE = "#3498db"
+YELLOW = "#F1C40F"
+SUBTLE = "#8899AA"
+WHITE = "#FFFFFF"
+CARD = "#132039"
+EDGE = "#1a2d4a"
+
+
+def apply_theme(bold_titles=True):
+    """Set the dark rcParams; importing matplotlib is deferred until a chart is drawn."""
+    import matplotlib.pyplot as plt
+
+    params = {
+        "figure.facecolor": BG,
+        "axes.facecolor": BG,
+        "axes.edgecolor": EDGE,
+        "axes.labelcolor": SUBTLE,
+        "xtick.color": SUBTLE,
+        "ytick.color": SUBTLE,
+        "text.color": WHITE,
+        "font.size": 12,
+    }
+    if bold_titles:
+        params.update({"axes.titlesize": 16, "axes.titleweight": "bold"})
+    plt.rcParams.update(params)
+    return plt
+
+
+def save(fig, out_dir, filename):
+    import matplotlib.pyplot as plt
+
+    path = os.path.join(out_dir, filename)
+    with instrument.span("chart.savefig", file=filename):
+        plt.tight_layout()
+        plt.savefig(path, dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    return path
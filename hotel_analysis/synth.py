@@ -0,0 +1,120 @@
+"""Synthetic raw scrapes of any size, in the exact format of ``data/raw``.
+
+Rows are bootstrapped from the shipped samples, so locations, room and bed
+types, review labels and comments keep their real distributions and missing
+values. Their numbers are jittered and re-rendered the way the scrapes write
+them, so the cleaning code does the same work as on real data:
+
+* prices carry the mangled currency byte and comma thousands (``"  \\xa0146,026"``);
+* review counts use comma thousands (``"1,304"``);
+* only cells holding a plain amount are jittered; the others ("View all 7
+  deals", "View all 7 deals from \\xa036,215", empty cells) are copied as they
+  are, so the no-price paths of the parser run as often as in the samples;
+* TripAdvisor names are rank-prefixed (``"12. Hotel Name"``), ranks running
+  over the whole file;
+* a share of the free-text cells is padded with spaces;
+* files are latin-1 with CRLF line endings.
+
+The files are written in chunks, so the size is limited by disk, not memory:
+
+    synth.generate(SYNTH_DIR, rows=1_000_000)
+    cleaning.run(raw_dir=SYNTH_DIR, cleaned_dir=...)
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import paths
+
+SYNTH_DIR = os.path.join(paths.ROOT, "data", "synthetic")
+CHUNK_ROWS = 200_000
+PADDED_SHARE = 0.05
+PRICE_JITTER = 0.1
+
+
+def read_sample(path):
+    """Raw file as strings, with empty cells kept as ``""``."""
+    return pd.read_csv(path, encoding="latin1", dtype=str, keep_default_na=False)
+
+
+# A plain amount: optional spaces and currency byte, then comma-thousands digits
+AMOUNT_CELL = r"^(?P<lead> *\xa0?)(?P<amount>\d{1,3}(?:,\d{3})*|\d+)$"
+
+
+def _jitter(values, rng, spread):
+    return np.round(values * rng.uniform(1 - spread, 1 + spread, len(values)))
+
+
+def _jitter_amounts(column, rng, spread):
+    """``column`` with its plain amounts jittered and re-rendered; other cells unchanged."""
+    found = column.str.extract(AMOUNT_CELL)
+    plain = found["amount"].notna().to_numpy()
+    amounts = pd.to_numeric(found["amount"][plain].str.replace(",", "", regex=False)).to_numpy(dtype=float)
+    values = column.to_numpy(dtype=object).copy()
+    values[plain] = [f"{lead}{v:,.0f}" for lead, v in zip(found["lead"][plain], _jitter(amounts, rng, spread))]
+    return values
+
+
+def _pad(column, rng, leading=True):
+    values = column.to_numpy(dtype=object)
+    for i in np.flatnonzero(rng.random(len(values)) < PADDED_SHARE):
+        if values[i]:
+            spaces = " " * rng.integers(1, 4)
+            values[i] = f"{spaces if leading else ''}{values[i]}{spaces}"
+    return values
+
+
+def booking_chunk(sample, n, rng):
+    """``n`` raw Booking.com rows bootstrapped from ``sample``."""
+    rows = sample.iloc[rng.integers(len(sample), size=n)].reset_index(drop=True)
+    name, location, _, _, reviews, _, room_type, _, price = rows.columns
+    rows[price] = _jitter_amounts(rows[price], rng, PRICE_JITTER)
+    rows[reviews] = _jitter_amounts(rows[reviews], rng, 0.2)
+    for column in (name, location, room_type):
+        rows[column] = _pad(rows[column], rng)
+    return rows
+
+
+def tripadvisor_chunk(sample, n, rng, first_rank=1):
+    """``n`` raw TripAdvisor rows bootstrapped from ``sample``, ranked from ``first_rank``."""
+    rows = sample.iloc[rng.integers(len(sample), size=n)].reset_index(drop=True)
+    name, price, reviews, comment = rows.columns
+    names = rows[name].str.replace(r"^\d+\.\s*", "", regex=True)
+    ranks = range(first_rank, first_rank + n)
+    rows[name] = [f"{rank}. {label}" for rank, label in zip(ranks, _pad(names, rng, leading=False))]
+    rows[price] = _jitter_amounts(rows[price], rng, PRICE_JITTER)
+    rows[reviews] = _jitter_amounts(rows[reviews], rng, 0.2)
+    rows[comment] = _pad(rows[comment], rng)
+    return rows
+
+
+def _write(path, sample, total, make_chunk, chunk_rows):
+    with open(path, "w", encoding="latin1", newline="") as f:
+        f.write(",".join(sample.columns) + "\r\n")
+        for start in range(0, total, chunk_rows):
+            chunk = make_chunk(min(chunk_rows, total - start), start)
+            chunk.to_csv(f, header=False, index=False, lineterminator="\r\n")
+
+
+def generate(out_dir=SYNTH_DIR, rows=100_000, tripadvisor_rows=None, seed=0, chunk_rows=CHUNK_ROWS,
+             raw_dir=paths.RAW_DIR):
+    """Write ``booking_hotel.csv`` and ``tripadvisor_room.csv`` into ``out_dir``.
+
+    Both files get ``rows`` rows unless ``tripadvisor_rows`` is given. Returns
+    the paths of the two files.
+    """
+    tripadvisor_rows = rows if tripadvisor_rows is None else tripadvisor_rows
+    rng = np.random.default_rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+
+    booking_sample = read_sample(os.path.join(raw_dir, "booking_hotel.csv"))
+    booking_path = os.path.join(out_dir, "booking_hotel.csv")
+    _write(booking_path, booking_sample, rows,
+           lambda n, start: booking_chunk(booking_sample, n, rng), chunk_rows)
+
+    tripadvisor_sample = read_sample(os.path.join(raw_dir, "tripadvisor_room.csv"))
+    tripadvisor_path = os.path.join(out_dir, "tripadvisor_room.csv")
+    _write(tripadvisor_path, tripadvisor_sample, tripadvisor_rows,
+           lambda n, start: tripadvisor_chunk(tripadvisor_sample, n, rng, first_rank=start + 1), chunk_rows)
+    return booking_path, tripadvisor_path
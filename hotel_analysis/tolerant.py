@@ -0,0 +1,192 @@
+"""Single-pass CSV reader that repairs malformed rows instead of skipping them.
+
+``pd.read_csv(on_bad_lines="skip")`` drops a row with too many fields without a
+trace, and after an unbalanced quote it reads the following lines into one
+field. ``read_csv`` here streams the file once in blocks, parses each block
+with the C ``csv`` module and repairs the two malformations the scrapes are prone to:
+
+* extra fields: an unquoted comma in the free-text column (``free_field``, the
+  last one by default) splits it, so the surplus fields are joined back;
+* unbalanced quotes: a quote that opens a field normally closes on a later
+  line. The scrapes end records with CRLF and break lines inside comments
+  with a bare LF, so a quote still open at a CRLF is closed there. In an LF
+  file it is closed at the end of its line when one of the lines it would
+  swallow is a record of its own, or when it spans more than
+  ``MAX_RECORD_LINES`` lines.
+
+Rows that still do not fit (too few fields) are quarantined with their line
+number (in a CRLF file, counting CRLFs only), the reason and the raw text.
+Every outcome is counted:
+
+    frame, counts = tolerant.read_csv(path, quarantine="quarantine.csv")
+    counts   # {"rows": 4477, "quote_repairs": 0, "merged_fields": 0, ...}
+
+Empty cells become NaN and columns that parse as numbers are converted, like
+``pd.read_csv`` does.
+"""
+import csv
+import itertools
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import compression
+
+BLOCK_CHARS = 1 << 24
+MAX_RECORD_LINES = 20
+COUNTERS = ["rows", "quote_repairs", "merged_fields", "quarantined", "blank"]
+
+
+def _parse_line(line):
+    return next(csv.reader([line]), [])
+
+
+def _blocks(f, terminator, size=BLOCK_CHARS):
+    """Lists of the lines of ``f`` between terminators, ``size`` characters at a time."""
+    rest = ""
+    while True:
+        block = f.read(size)
+        if not block:
+            break
+        block = rest + block
+        cut = block.rfind(terminator)
+        if cut < 0:
+            rest = block
+            continue
+        rest = block[cut + len(terminator):]
+        yield block[:cut].split(terminator)
+    if rest:
+        yield rest.split(terminator)
+
+
+class _Parser:
+    """Rows, counters and quarantined lines of a stream of line lists.
+
+    ``csv.reader`` runs over each whole list; ``reader.line_num`` shows when a
+    row took more than one line. In a CRLF file the lines are whole records
+    (a bare LF inside a comment does not split them), so that can only be an
+    unbalanced quote. In an LF file it is a quoted field over several lines
+    unless one of the lines it took looks like a record of its own.
+    """
+
+    def __init__(self, n_fields, free_field, crlf):
+        self.n_fields = n_fields
+        self.free = free_field % n_fields
+        self.crlf = crlf
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.rows = []
+        self.rejected = []
+        self.first_line = 2
+
+    def _own_record(self, line):
+        return not line.count('"') % 2 and len(_parse_line(line)) >= self.n_fields
+
+    def _may_continue(self, n_lines):
+        """Whether the next block could still change a record that took ``n_lines`` lines so far."""
+        return n_lines == 1 or not self.crlf and n_lines <= MAX_RECORD_LINES
+
+    def _unbalanced(self, lines):
+        return self.crlf or len(lines) > MAX_RECORD_LINES or any(map(self._own_record, lines[1:]))
+
+    def feed(self, lines, last=False):
+        """Parse ``lines``; returns the lines of the last record, to parse again with the next ones.
+
+        ``csv`` closes a quote still open at the end of its input, so a record
+        at the end of a block is held back unless it is complete for sure.
+        """
+        n_fields, rows = self.n_fields, self.rows
+        start = 0
+        while start < len(lines):
+            reader = csv.reader(itertools.islice(lines, start, None))
+            done = 0
+            restart = None
+            try:
+                for fields in reader:
+                    end = start + reader.line_num
+                    if end == len(lines) and not last and self._may_continue(end - start - done):
+                        self.first_line += start + done
+                        return lines[start + done:]
+                    if reader.line_num - done > 1:
+                        group = lines[start + done:end]
+                        if self._unbalanced(group):
+                            fields = self._repair(group)
+                            restart = start + done + 1
+                        else:
+                            fields = _parse_line("\n".join(group))
+                    if len(fields) == n_fields:
+                        rows.append(fields)
+                    else:
+                        self._fix(fields, self.first_line + start + done, lines[start + done])
+                    if restart is not None:
+                        break
+                    done = reader.line_num
+            except csv.Error:
+                # A line break outside quotes, usually after a quote swallowed the next lines
+                group = lines[start + done:start + reader.line_num]
+                if start + reader.line_num == len(lines) and not last and self._may_continue(len(group)):
+                    self.first_line += start + done
+                    return group
+                if len(group) > 1:
+                    self._fix(self._repair(group), self.first_line + start + done, group[0])
+                else:
+                    self.rejected.append((self.first_line + start + done, "line break outside quotes", group[0]))
+                restart = start + done + 1
+            start = len(lines) if restart is None else restart
+        self.first_line += len(lines)
+        return []
+
+    def _repair(self, group):
+        """Fields of ``group[0]`` with its open quote closed at the end of the line."""
+        self.counts["quote_repairs"] += 1
+        return _parse_line(group[0])
+
+    def _fix(self, fields, line, text):
+        if len(fields) == self.n_fields:
+            self.rows.append(fields)
+        elif not fields:
+            self.counts["blank"] += 1
+        elif len(fields) > self.n_fields:
+            extra = len(fields) - self.n_fields
+            fields[self.free:self.free + extra + 1] = [",".join(fields[self.free:self.free + extra + 1])]
+            self.counts["merged_fields"] += 1
+            self.rows.append(fields)
+        else:
+            self.rejected.append((line, f"{len(fields)} of {self.n_fields} fields", text))
+
+
+def read_csv(path, encoding="latin1", free_field=-1, quarantine=None, threaded=False):
+    """Read ``path``, repairing what can be repaired; returns the frame and the counters.
+
+    ``quarantine`` is a CSV path for the rows that could not be repaired,
+    written when there are some and removed otherwise. Compressed files are
+    read through ``compression.open_text`` (``threaded``: see there).
+    """
+    with compression.open_text(path, encoding, threaded) as f:
+        first = f.readline()
+        crlf = first.endswith("\r\n")
+        header = _parse_line(first.rstrip("\r\n"))
+        parser = _Parser(len(header), free_field, crlf)
+        carry = []
+        for lines in _blocks(f, "\r\n" if crlf else "\n"):
+            carry = parser.feed(carry + lines)
+        parser.feed(carry, last=True)
+
+    counts = parser.counts
+    counts["rows"] = len(parser.rows)
+    counts["quarantined"] = len(parser.rejected)
+    if quarantine and parser.rejected:
+        os.makedirs(os.path.dirname(os.path.abspath(quarantine)), exist_ok=True)
+        pd.DataFrame(parser.rejected, columns=["line", "reason", "text"]).to_csv(quarantine, index=False)
+    elif quarantine and os.path.exists(quarantine):
+        os.remove(quarantine)
+
+    frame = pd.DataFrame(parser.rows, columns=header, dtype=object)
+    for column in frame:
+        values = frame[column].replace("", np.nan)
+        try:
+            frame[column] = pd.to_numeric(values)
+        except (ValueError, TypeError):
+            frame[column] = values.infer_objects()
+    frame.attrs["read_counts"] = counts
+    return frame, counts
@@ -0,0 +1,266 @@
+"""Resident worker: keeps the cleaned frames in memory and re-renders on change.
+
+The worker loads both cleaned datasets once, polls ``data/raw/`` and
+``data/cleaned/`` for modified files and, when one changes, re-cleans or
+reloads only that dataset and re-renders only the outputs that read it.
+Requests arrive as JSON lines over a Unix socket::
+
+    {"cmd": "chart", "name": "best-value"}         -> {"ok": true, "path": ...}
+    {"cmd": "finding", "name": "review-length"}     -> {"ok": true, "path": ...}
+    {"cmd": "section", "name": "locations"}         -> {"ok": true, "text": ...}
+    {"cmd": "presentation"} / {"cmd": "status"} / {"cmd": "reload"}
+
+Start it with ``python -m hotel_analysis worker`` and query it with
+``python -m hotel_analysis ask chart best-value``.
+"""
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from . import paths
+
+SOCKET_PATH = os.path.join(paths.ROOT, "output", ".worker.sock")
+
+BOOKING = "booking"
+TRIPADVISOR = "tripadvisor"
+
+# dataset -> (raw file, cleaned file)
+WATCHED = {
+    BOOKING: (paths.BOOKING_RAW, paths.BOOKING_CLEANED),
+    TRIPADVISOR: (paths.TRIPADVISOR_RAW, paths.TRIPADVISOR_CLEANED),
+}
+
+# Outputs that read something other than (only) the Booking.com frame. The
+# location-clusters chart also reads the saved clusters, which ``poll`` refits
+# whenever the Booking.com frame changes.
+DEPENDS = {
+    ("chart", "price-distribution"): {BOOKING, TRIPADVISOR},
+    ("finding", "review-length"): {TRIPADVISOR},
+    ("section", "comments"): {TRIPADVISOR},
+    ("section", "findings"): {BOOKING, TRIPADVISOR},
+}
+
+
+def depends_on(kind, name):
+    return DEPENDS.get((kind, name), {BOOKING})
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class Worker:
+    """In-memory datasets plus the bookkeeping of which outputs are stale."""
+
+    def __init__(self, out_dir=paths.CHARTS_DIR, render_on_change=True):
+        import matplotlib
+
+        matplotlib.use("Agg")
+        from . import charts, findings, report, style
+
+        self.charts = charts.CHARTS
+        self.findings = findings.FINDINGS
+        self.report = report
+        self.sections = report.SECTIONS
+        style.apply_theme()
+
+        self.out_dir = out_dir
+        self.render_on_change = render_on_change
+        self.lock = threading.RLock()
+        self.frames = {}
+        self.versions = {BOOKING: 0, TRIPADVISOR: 0}
+        self.mtimes = {}
+        self._section_text = {}
+        for dataset in WATCHED:
+            self._load(dataset)
+
+    # -- datasets -----------------------------------------------------------
+
+    def _load(self, dataset):
+        from . import data
+
+        loader = data.load_booking if dataset == BOOKING else data.load_tripadvisor
+        self.frames[dataset] = loader(WATCHED[dataset][1])
+        self.versions[dataset] += 1
+        for path in WATCHED[dataset]:
+            self.mtimes[path] = _mtime(path)
+
+    def _clean(self, dataset):
+        from . import cleaning, compression
+
+        raw, cleaned = WATCHED[dataset]
+        if dataset == BOOKING:
+            frame = cleaning.clean_booking(cleaning.read_booking_raw(raw))
+        else:
+            frame = cleaning.clean_tripadvisor(cleaning.read_tripadvisor_raw(raw))
+        # Written uncompressed, as ``clean`` does without --compress; a stale
+        # .gz left by ``clean --compress`` would otherwise keep being loaded
+        path = compression.output_path(cleaned)
+        frame.to_csv(path, index=False)
+        compression.replace_variants(path)
+
+    def _refit_clusters(self):
+        from . import clusters
+
+        # Saved clusters fitted on the old cleaned file would label the chart with stale clusters
+        clusters.refit_saved(self.frames[BOOKING], data=WATCHED[BOOKING][1], path=clusters.LOCATION_CLUSTERS_CSV,
+                             source_path=clusters.LOCATION_CLUSTERS_SOURCE)
+
+    def poll(self):
+        """Reload datasets whose raw or cleaned file changed; return their names.
+
+        If cleaning or loading a dataset raises, its recorded mtimes are left
+        alone, so the next poll retries it; datasets reloaded before the error
+        are still refreshed, then the error propagates.
+        """
+        changed = set()
+        with self.lock:
+            try:
+                for dataset, (raw, cleaned) in WATCHED.items():
+                    if _mtime(raw) != self.mtimes.get(raw):
+                        self._clean(dataset)
+                    elif _mtime(cleaned) == self.mtimes.get(cleaned):
+                        continue
+                    self._load(dataset)
+                    changed.add(dataset)
+                    if dataset == BOOKING:
+                        self._refit_clusters()
+            finally:
+                if changed:
+                    self._refresh(changed)
+        return changed
+
+    def _refresh(self, changed):
+        for key in list(self._section_text):
+            if depends_on("section", key) & changed:
+                del self._section_text[key]
+        if not self.render_on_change:
+            return
+        for kind, registry in (("chart", self.charts), ("finding", self.findings)):
+            for name in registry:
+                if depends_on(kind, name) & changed:
+                    self.render(kind, name)
+
+    # -- outputs ------------------------------------------------------------
+
+    def _args(self):
+        return self.frames[BOOKING], self.frames[TRIPADVISOR]
+
+    def render(self, kind, name):
+        with self.lock:
+            if kind == "chart":
+                return self.charts[name][0](*self._args(), self.out_dir)
+            return self.findings[name](*self._args(), self.out_dir)
+
+    def section(self, name):
+        """Printed report section, cached until one of its datasets changes."""
+        with self.lock:
+            cached = name in self._section_text
+            if not cached:
+                buf = io.StringIO()
+                with contextlib.redirect_stdout(buf):
+                    self.sections[name](self.report.FrameSource(*self._args()))
+                self._section_text[name] = buf.getvalue()
+            return self._section_text[name], cached
+
+    def presentation(self):
+        from . import presentation
+
+        with self.lock, contextlib.redirect_stdout(io.StringIO()):
+            return presentation.build(*self._args())
+
+    def status(self):
+        return {
+            "versions": dict(self.versions),
+            "rows": {k: len(v) for k, v in self.frames.items()},
+            "cached_sections": sorted(self._section_text),
+        }
+
+    def handle(self, request):
+        cmd = request.get("cmd")
+        name = request.get("name")
+        registry = {"chart": self.charts, "finding": self.findings, "section": self.sections}
+        if cmd in registry and name not in registry[cmd]:
+            return {"ok": False, "error": f"unknown {cmd} {name!r}"}
+        start = time.perf_counter()
+        if cmd in ("chart", "finding"):
+            result = {"path": self.render(cmd, name)}
+        elif cmd == "section":
+            text, cached = self.section(name)
+            result = {"text": text, "cached": cached}
+        elif cmd == "presentation":
+            result = {"path": self.presentation()}
+        elif cmd == "reload":
+            result = {"changed": sorted(self.poll())}
+        elif cmd == "status":
+            result = self.status()
+        else:
+            return {"ok": False, "error": f"unknown command {cmd!r}"}
+        result.update(ok=True, seconds=round(time.perf_counter() - start, 4))
+        return result
+
+    def watch(self, interval, stop):
+        while not stop.wait(interval):
+            try:
+                changed = self.poll()
+            except Exception as exc:
+                # e.g. a raw CSV caught half-written: keep serving, retry next tick
+                print(f"reload failed, retrying: {exc!r}", file=sys.stderr, flush=True)
+                continue
+            if changed:
+                print(f"reloaded {', '.join(sorted(changed))}", flush=True)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.worker.handle(json.loads(line))
+            except Exception as exc:
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def serve(socket_path=SOCKET_PATH, interval=1.0, render_on_change=True, out_dir=paths.CHARTS_DIR):
+    """Run the worker until interrupted."""
+    worker = Worker(out_dir=out_dir, render_on_change=render_on_change)
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _Handler)
+    server.worker = worker
+    stop = threading.Event()
+    watcher = threading.Thread(target=worker.watch, args=(interval, stop), daemon=True)
+    watcher.start()
+    # serve_forever() must be stopped from another thread
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    print(f"worker listening on {socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        os.unlink(socket_path)
+
+
+def request(payload, socket_path=SOCKET_PATH, timeout=120):
+    """Send one request to a running worker and return its decoded response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
@@ -0,0 +1,12 @@
+import pytest
+
+from hotel_analysis import memo
+
+
+@pytest.fixture(autouse=True)
+def stats_cache(tmp_path):
+    """Memoized statistics go to a per-test cache file, never output/cache."""
+    memo.enable(str(tmp_path / "stats.sqlite"))
+    yield
+    memo.clear()
+    memo.enable()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hotel_analysis import anomalies, data
+
+
+def scrape():
+    prices = [100.0 + i for i in range(9)] + [9000.0]
+    return pd.DataFrame({
+        "hotel_name": [f"Hotel {i}" for i in range(10)],
+        "location": "Krabi",
+        "room_type": "Standard Double Room",
+        "price_eur": prices,
+        "rating": [8.0 + i / 10 for i in range(10)],
+        "num_reviews": 500,
+        "review_score": "Excellent",
+    })
+
+
+def run(path, tmp_path, **kwargs):
+    return anomalies.run(str(path), state_path=str(tmp_path / "state.csv"), loads_path=str(tmp_path / "loads.csv"),
+                         scores_path=str(tmp_path / "scores.csv"), **kwargs)
+
+
+def test_extreme_price_in_small_group_is_flagged(tmp_path):
+    scrape().to_csv(tmp_path / "scrape.csv", index=False)
+    top, rows, flagged = run(tmp_path / "scrape.csv", tmp_path)
+    assert (rows, flagged) == (10, 1)
+    assert top.loc[0, "price_eur"] == 9000 and top.loc[0, "anomaly_reason"] == "price"
+    assert top.loc[0, "anomaly_score"] > anomalies.THRESHOLD
+
+
+def test_chan_merge_matches_one_pass():
+    rng = np.random.default_rng(0)
+    values = rng.normal(5, 2, 1000)
+    keys = pd.Series(rng.choice(["a", "b", "c"], 1000))
+    merged = anomalies.RunningStats()
+    for part in np.array_split(np.arange(1000), 7):
+        merged.update(keys.iloc[part], values[part])
+    for key, table in merged.table.iterrows():
+        group = values[(keys == key).to_numpy()]
+        assert table["n"] == len(group)
+        assert table["mean"] == pytest.approx(group.mean(), rel=1e-12)
+        assert table["m2"] == pytest.approx(((group - group.mean()) ** 2).sum(), rel=1e-10)
+
+
+def test_chunked_load_gives_same_state(tmp_path):
+    booking = data.load_booking().head(2000)
+    booking.to_csv(tmp_path / "booking.csv", index=False)
+    states = []
+    for chunksize in (2000, 300):
+        run(tmp_path / "booking.csv", tmp_path / str(chunksize), chunksize=chunksize)
+        states.append(pd.read_csv(tmp_path / str(chunksize) / "state.csv", keep_default_na=False)
+                      .sort_values(["check", "level", "key"], ignore_index=True))
+    pd.testing.assert_frame_equal(states[0], states[1], rtol=1e-9)
+
+
+def test_duplicate_load_is_refused(tmp_path):
+    scrape().to_csv(tmp_path / "scrape.csv", index=False)
+    run(tmp_path / "scrape.csv", tmp_path)
+    with pytest.raises(ValueError, match="already scored"):
+        run(tmp_path / "scrape.csv", tmp_path)
+    assert len(anomalies.loads(str(tmp_path / "loads.csv"))) == 1
+
+
+def test_raw_scrape_is_refused(tmp_path):
+    pd.DataFrame({"Hotel Name": ["A"], "Price": ["BDT 1,000"]}).to_csv(tmp_path / "raw.csv", index=False)
+    with pytest.raises(ValueError, match="not a cleaned"):
+        run(tmp_path / "raw.csv", tmp_path)
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from hotel_analysis import cleaning
+
+
+def test_dropped_rows_are_counted_per_reason():
+    prices = ["\xa012,000", "$ 150", "£90", "View all 3 deals", "\xa0500", "\xa024,000"]
+    raw = pd.DataFrame({
+        "name": [f"Hotel {i}" for i in range(6)],
+        "location": "Krabi",
+        "rating": [8.0, 8.0, 8.0, 8.0, 8.0, None],
+        "review_score": "Very Good",
+        "reviews": "100",
+        "room_score": 8.5,
+        "room_type": "Double Room",
+        "bed_type": "1 double bed",
+        "price": prices,
+    })
+    booking = cleaning.clean_booking(raw, date="2026-10-19")
+    assert booking["hotel_name"].tolist() == ["Hotel 0"]
+    assert booking.attrs["dropped"] == {
+        "without an amount": 1, "without a USD rate": 1, "without a GBP rate": 1,
+        "without a rating": 1, "outside EUR 5-10000": 1,
+    }
+    assert cleaning._describe_drops({"without an amount": 0}) == "none"
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from hotel_analysis import clusters, data
+
+
+@pytest.fixture
+def saved(tmp_path):
+    booking = data.load_booking()
+    source = tmp_path / "booking.csv"
+    booking.to_csv(source, index=False)
+    paths = {"path": str(tmp_path / "locations.csv"), "source_path": str(tmp_path / "source.json"),
+             "data": str(source)}
+    clusters.run(clusters.chunked(str(source)), location_path=paths["path"], source=str(source),
+                 source_path=paths["source_path"])
+    return booking, paths
+
+
+def test_profiles_describe_the_given_frame(saved):
+    booking, paths = saved
+    labels = pd.read_csv(paths["path"]).set_index("location")["cluster"]
+    cheap = booking[booking["price_eur"] < 200]
+    locs = clusters.location_clusters(cheap, **paths).set_index("location")
+    assert (locs["cluster"] == labels.reindex(locs.index)).all()
+    assert (locs["median_price"] < 200).all()
+    assert locs["hotels"].sum() == len(cheap)
+
+
+def test_changed_data_is_refitted(saved, monkeypatch):
+    booking, paths = saved
+    assert clusters._saved_labels(paths["path"], paths["source_path"], paths["data"]) is not None
+    booking.head(100).to_csv(paths["data"], index=False)
+    assert clusters._saved_labels(paths["path"], paths["source_path"], paths["data"]) is None
+    fitted = []
+    monkeypatch.setattr(clusters, "cluster_locations", lambda frame: fitted.append(frame) or (frame, None))
+    clusters.location_clusters(booking.head(100), **paths)
+    assert fitted
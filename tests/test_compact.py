@@ -0,0 +1,19 @@
+import pandas as pd
+
+from hotel_analysis import compact, data
+
+
+def test_integer_columns_are_downcast():
+    assert compact.compact_column(pd.Series([1, 250_000], dtype="int64")).dtype == "int32"
+    assert compact.compact_column(pd.Series([1, None, 300], dtype="Int64")).dtype == "Int16"
+    assert compact.compact_column(pd.Series([1.0, None, 3.0])).dtype == "Int8"
+    assert compact.compact_column(pd.Series([True, False])).dtype == bool
+    assert compact.compact_column(pd.Series([0.5, 1.0])).dtype == "float64"
+
+
+def test_values_are_unchanged():
+    for frame in data.load_cleaned():
+        small = compact.compact(frame)
+        assert small.memory_usage(deep=True).sum() < frame.memory_usage(deep=True).sum()
+        assert small["price_bdt"].dtype == "int32"
+        pd.testing.assert_frame_equal(small.astype(frame.dtypes.to_dict()), frame)
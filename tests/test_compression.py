@@ -0,0 +1,70 @@
+import gzip
+
+import pytest
+
+from hotel_analysis import compression
+
+# Many chunks at the small CHUNK below, so the bounded queue fills up
+DATA = b"".join(b"%d,hotel %d,\xa0%d\r\n" % (i, i % 97, i * 31 % 1000) for i in range(20_000))
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(compression, "CHUNK", 4096)
+
+
+def _write(tmp_path, name, data=DATA):
+    path = compression.output_path(str(tmp_path / "rooms.csv"), name)
+    with compression._open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+@pytest.mark.parametrize("name", compression.CODECS)
+def test_round_trip(tmp_path, name, threaded):
+    path = _write(tmp_path, name)
+    assert compression.codec(path) == name
+    with compression.open_binary(path, threaded=threaded) as f:
+        assert f.read() == DATA
+    if threaded:
+        assert not f.raw.thread.is_alive()
+    with compression.open_text(path, "latin1", threaded=threaded) as f:
+        lines = f.readlines()
+    assert "".join(lines) == DATA.decode("latin1")
+    assert lines[0].endswith("\r\n")
+
+
+@pytest.mark.parametrize("name", compression.CODECS)
+def test_closing_early_stops_the_thread(tmp_path, name):
+    path = _write(tmp_path, name)
+    f = compression.open_binary(path, threaded=True)
+    assert f.read(100) == DATA[:100]
+    raw = f.raw
+    # The reader is blocked on the full queue by now
+    f.close()
+    assert not raw.thread.is_alive()
+    assert raw.source.closed
+    f.close()
+
+
+def test_errors_reach_the_reading_thread(tmp_path):
+    path = str(tmp_path / "rooms.csv.gz")
+    with open(path, "wb") as f:
+        f.write(gzip.compress(DATA)[:5000])
+    for threaded in (False, True):
+        with compression.open_binary(path, threaded=threaded) as f:
+            with pytest.raises(EOFError):
+                f.read()
+
+
+def test_resolve_finds_the_compressed_variant(tmp_path):
+    plain = str(tmp_path / "rooms.csv")
+    assert compression.resolve(plain) == plain
+    path = _write(tmp_path, "xz")
+    assert compression.resolve(plain) == path
+    kept = _write(tmp_path, "gzip")
+    compression.replace_variants(kept)
+    assert compression.resolve(plain) == kept
+    with pytest.raises(ValueError):
+        compression.output_path(plain, "zip")
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats as scipy_stats
+
+from hotel_analysis import correlation
+
+SCIPY = {"pearson": scipy_stats.pearsonr, "spearman": scipy_stats.spearmanr}
+
+
+def _frame(n, seed=0):
+    """Correlated columns with ties and different missing rows per column."""
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=n)
+    frame = pd.DataFrame({
+        "a": x,
+        "b": 0.7 * x + rng.normal(size=n),
+        "c": np.round(-0.4 * x + rng.normal(size=n), 1),
+        "d": rng.integers(0, 5, size=n).astype(float),
+    })
+    for column, share in (("a", 0.1), ("b", 0.2), ("c", 0.1)):
+        frame.loc[rng.random(n) < share, column] = np.nan
+    # Two columns missing in the same rows share one row set
+    frame.loc[frame["a"].isna(), "d"] = np.nan
+    return frame
+
+
+def _expected(frame, x, y, method):
+    pair = frame[[x, y]].dropna()
+    r, p = SCIPY[method](pair[x], pair[y])
+    return r, p, len(pair)
+
+
+@pytest.mark.parametrize("n", [12, 200, 3000])
+def test_matrices_match_scipy_on_pairwise_complete_rows(n):
+    frame = _frame(n, seed=n)
+    result = correlation.matrices(frame)
+    for method, matrix in result.items():
+        for row in matrix.pairs().itertuples():
+            r, p, count = _expected(frame, row.x, row.y, method)
+            assert row.n == count
+            assert row.r == pytest.approx(r, abs=1e-12)
+            assert row.p == pytest.approx(p, rel=1e-9, abs=1e-15)
+        assert (np.diag(matrix.n) == frame.notna().sum()).all()
+        assert np.allclose(matrix.r, matrix.r.T, equal_nan=True)
+
+
+def test_by_group_matches_scipy_within_each_group():
+    frame = _frame(600, seed=1)
+    groups = pd.Series(np.repeat(["x", "y", "z", "tiny"], [250, 200, 145, 5]), name="location")
+    table = correlation.by_group(frame, groups)
+    assert list(table.columns) == ["location", "x", "y", "n", "pearson", "pearson_p", "spearman", "spearman_p"]
+    # "tiny" has fewer than MIN_GROUP_ROWS rows
+    assert sorted(table["location"].unique()) == ["x", "y", "z"]
+    assert len(table) == 3 * 6
+    for row in table.itertuples():
+        subset = frame[(groups == row.location).to_numpy()]
+        for method in correlation.METHODS:
+            r, p, count = _expected(subset, row.x, row.y, method)
+            assert row.n == count
+            assert getattr(row, method) == pytest.approx(r, abs=1e-12)
+            assert getattr(row, f"{method}_p") == pytest.approx(p, rel=1e-9, abs=1e-15)
+
+
+def test_constant_column_has_no_correlation():
+    frame = pd.DataFrame({"a": np.arange(10.0), "b": np.full(10, 3.0)})
+    for matrix in correlation.matrices(frame).values():
+        assert np.isnan(matrix.r.loc["a", "b"]) and np.isnan(matrix.p.loc["a", "b"])
+        assert matrix.n.loc["a", "b"] == 10
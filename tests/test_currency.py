@@ -0,0 +1,49 @@
+import math
+
+import pandas as pd
+import pytest
+
+from hotel_analysis import currency
+
+
+@pytest.mark.parametrize("text, amount, code", [
+    ("  \xa036,215", 36215, "BDT"),
+    ("\xa0999", 999, "BDT"),
+    ("View all 7 deals from \xa036,215", 36215, "BDT"),
+    ("36215", 36215, "BDT"),
+    ("1 250 EUR", 1250, "EUR"),
+    ("EUR 1 250", 1250, "EUR"),
+    ("12 000 EUR", 12000, "EUR"),
+    ("100 €", 100, "EUR"),
+    ("100€", 100, "EUR"),
+    ("€100", 100, "EUR"),
+    ("100 $", 100, "USD"),
+    ("US$ 1,250.50", 1250.5, "USD"),
+    ("1,200 ฿", 1200, "THB"),
+    ("1.234,56 €", 1234.56, "EUR"),
+    ("£1.234.567", 1234567, "GBP"),
+    ("GBP 99.9", 99.9, "GBP"),
+    ("12,5 EUR", 12.5, "EUR"),
+    ("Tk 500", 500, "BDT"),
+])
+def test_price_is_parsed(text, amount, code):
+    assert currency.parse_price(text) == (pytest.approx(amount), code)
+
+
+@pytest.mark.parametrize("text", [
+    "", "View all 7 deals", "Best Flexible Rate on our website", "EUR", "1,234,56 EUR", "1,2,3",
+    "1.234.56", "1234.567 EUR", "100 EUR 200", "about 100 EUR",
+])
+def test_no_partial_price(text):
+    amount, code = currency.parse_price(text)
+    assert math.isnan(amount) and code is None
+
+
+def test_parse_prices_keeps_integer_amounts():
+    parsed = currency.parse_prices(pd.Series(["\xa01,000", "\xa02,500", "\xa01,000"]))
+    assert parsed["amount"].dtype == "int64"
+    assert parsed["amount"].tolist() == [1000, 2500, 1000]
+    parsed = currency.parse_prices(pd.Series(["\xa01,000", None, "View all 3 deals", "5 €"]))
+    assert parsed["amount"].tolist()[::3] == [1000, 5] and parsed["amount"][1:3].isna().all()
+    assert parsed["currency"].tolist()[::3] == ["BDT", "EUR"] and parsed["currency"][1:3].isna().all()
+    assert currency.parse_prices(pd.Series([], dtype=object)).empty
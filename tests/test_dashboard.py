@@ -0,0 +1,24 @@
+import re
+
+from hotel_analysis import compact, dashboard, data
+
+
+def test_build_on_compact_frame():
+    booking = data.load_booking()
+    plain = dashboard.build(booking, max_locations=5)
+    small = dashboard.build(compact.compact(booking), max_locations=5)
+    assert dashboard.OTHER in small["labels"]["location"]
+    assert len(small["labels"]["location"]) == 6
+    assert small["rows"] == plain["rows"] == len(booking)
+    assert sorted(small["labels"]["location"]) == sorted(plain["labels"]["location"])
+
+
+def test_payload_has_only_what_the_page_reads():
+    payload = dashboard.build(data.load_booking(), max_locations=5)
+    with open(dashboard.TEMPLATE, encoding="utf-8") as f:
+        page = f.read()
+    for key in payload:
+        assert re.search(rf"\bP\.{key}\b", page), key
+    for fields in payload["measures"].values():
+        for key in fields:
+            assert re.search(rf"(\bsrc|P\.measures\[m\])\.{key}\b", page), key
@@ -0,0 +1,20 @@
+import pandas as pd
+
+from hotel_analysis import history
+
+
+def test_hotel_keeps_its_cheapest_room(tmp_path):
+    scrape = pd.DataFrame({
+        "hotel_name": ["A", "A", "B", "A"],
+        "location": ["Krabi", "Krabi", "Krabi", "Phuket"],
+        "room_type": ["Suite", "Double", "Double", "Double"],
+        "price_eur": [300.0, 120.5, 80.0, 90.0],
+        "rating": [8.1, 8.1, 7.5, 9.0],
+        "num_reviews": [10, 10, 5, 3],
+    })
+    store = history.PriceHistory(str(tmp_path))
+    store.append(scrape, "2026-01-01")
+    store.append(scrape.iloc[::-1], "2026-01-02")
+    for date in store.dates():
+        stored = store.with_hotels(store.read(date)).sort_values(history.KEY_COLUMNS)
+        assert stored["price_eur"].tolist() == [120.5, 90.0, 80.0]
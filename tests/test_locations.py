@@ -0,0 +1,16 @@
+from hotel_analysis import cli, locations, paths
+
+
+def test_region_level_needs_regions_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "REGIONS", str(tmp_path / "regions.csv"))
+    assert "region" not in cli.hierarchy_levels()
+    (tmp_path / "regions.csv").write_text("town,region\nBangkok,Central Thailand\n")
+    assert cli.hierarchy_levels() == locations.LEVELS
+
+
+def test_nested_town_is_flattened():
+    hierarchy = locations.LocationHierarchy(["Silom, Bang Rak", "Bang Rak, Bangkok", "Bangkok"], regions={})
+    neighbourhoods = hierarchy.row_codes(locations.NEIGHBOURHOOD)
+    assert list(hierarchy.names[neighbourhoods[:2]]) == ["Silom, Bangkok", "Bang Rak, Bangkok"]
+    assert neighbourhoods[2] == -1
+    assert list(hierarchy.names[hierarchy.row_codes(locations.TOWN)]) == ["Bangkok"] * 3
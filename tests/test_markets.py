@@ -0,0 +1,23 @@
+import pytest
+
+from hotel_analysis import data, markets
+
+
+@pytest.fixture(scope="module")
+def frames():
+    return data.load_booking(), data.load_tripadvisor()
+
+
+def test_unknown_market_is_rejected(frames, tmp_path):
+    with pytest.raises(ValueError, match="'nope'"):
+        markets.run(*frames, out_dir=str(tmp_path), workers=1, charts=False, only=["nope"])
+
+
+def test_no_market_left(frames, tmp_path):
+    with pytest.raises(ValueError, match="no town"):
+        markets.run(*frames, out_dir=str(tmp_path), min_hotels=10 ** 9, workers=1, charts=False)
+
+
+def test_fan_in_without_results(tmp_path):
+    comparison, brackets = markets.fan_in([], str(tmp_path))
+    assert comparison.empty and brackets.empty
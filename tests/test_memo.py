@@ -0,0 +1,113 @@
+import importlib.util
+import itertools
+import sqlite3
+
+import numpy as np
+import pytest
+
+from hotel_analysis import memo
+
+calls = []
+
+
+@memo.memoize("test.total")
+def total(values, scale=1):
+    calls.append(1)
+    return float(values.sum()) * scale
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_changed_input_misses():
+    values = np.arange(10.0)
+    assert total(values) == total(values.copy()) == 45
+    assert len(calls) == 1
+    changed = values.copy()
+    changed[3] = 0
+    assert total(changed) == 42
+    assert total(values.astype(np.float32)) == 45
+    assert total(values, scale=2) == 90
+    assert len(calls) == 4
+    assert memo.hit_rates().loc["test.total", "hits"] == 1
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location("memo_target", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_changed_source_misses(tmp_path):
+    source = tmp_path / "memo_target.py"
+    body = ("from hotel_analysis import memo\nCALLS = []\n\n@memo.memoize('test.source')\n"
+            "def double(x):\n    CALLS.append(1)\n    return x * {}\n")
+    source.write_text(body.format(2))
+    module = load_module(source)
+    assert module.double(np.ones(3)).tolist() == [2, 2, 2]
+    assert module.double(np.ones(3)).tolist() == [2, 2, 2]
+    assert len(module.CALLS) == 1
+
+    # A new process reads the edited file (salts are kept per process)
+    source.write_text(body.format(3))
+    memo._state.salts.clear()
+    module = load_module(source)
+    assert module.double(np.ones(3)).tolist() == [3, 3, 3]
+    assert len(module.CALLS) == 1
+
+
+def test_numpy_version_misses(monkeypatch):
+    values = np.arange(4.0)
+    total(values)
+    monkeypatch.setattr(memo.np, "__version__", "0.0.0")
+    memo._state.salts.clear()
+    total(values)
+    assert len(calls) == 2
+    memo._state.salts.clear()
+
+
+def test_least_recently_used_is_evicted(monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(memo.time, "time", lambda: float(next(clock)))
+    monkeypatch.setattr(memo, "MAX_ENTRIES", 3)
+    a, b, c, d = (np.full(2, float(i)) for i in range(4))
+    for values in (a, b, c):
+        total(values)
+    total(a)  # a is now more recent than b
+    total(d)  # evicts b
+    assert memo.cache_stats()[0] == 3
+    calls.clear()
+    for values in (a, c, d):
+        total(values)
+    assert not calls
+    total(b)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("broken", ["garbage", "not a directory"])
+def test_unusable_cache_falls_back(tmp_path, broken):
+    if broken == "garbage":
+        path = tmp_path / "stats.sqlite"
+        path.write_bytes(b"this is not a database" * 100)
+    else:
+        (tmp_path / "file").write_text("")
+        path = tmp_path / "file" / "stats.sqlite"
+    memo.enable(str(path))
+    assert total(np.arange(3.0)) == 3
+    assert total(np.arange(3.0)) == 3
+    assert len(calls) == 2
+    assert not memo._state.enabled
+    memo._close()
+
+
+def test_cache_is_shared_through_the_file(tmp_path):
+    total(np.arange(5.0))
+    memo._close()
+    conn = sqlite3.connect(memo._state.path)
+    assert conn.execute("SELECT COUNT(*) FROM entries WHERE name = 'test.total'").fetchone()[0] == 1
+    conn.close()
+    assert total(np.arange(5.0)) == 10
+    assert len(calls) == 1
@@ -0,0 +1,39 @@
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from hotel_analysis import data, query
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = query.make_server(data.load_booking(), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://{query.HOST}:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url):
+    try:
+        with urlopen(url) as response:
+            return response.status, json.load(response)
+    except HTTPError as exc:
+        return exc.code, json.load(exc)
+
+
+@pytest.mark.parametrize("path", ["/hotels", "/locations"])
+@pytest.mark.parametrize("k", ["0", "-1", str(query.MAX_K + 1), "x"])
+def test_bad_k_is_rejected(server, path, k):
+    status, body = get(f"{server}{path}?k={k}")
+    assert status == 400 and "error" in body
+
+
+@pytest.mark.parametrize("path", ["/hotels", "/locations"])
+def test_k_limits_results(server, path):
+    status, body = get(f"{server}{path}?k=3")
+    assert status == 200 and len(body) == 3
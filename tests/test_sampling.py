@@ -0,0 +1,64 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hotel_analysis import data, paths, sampling
+
+
+def quantiles(codes, y, q, w=None):
+    codes, y = np.asarray(codes), np.asarray(y, dtype=float)
+    w = np.ones(len(y)) if w is None else np.asarray(w, dtype=float)
+    return sampling._weighted_quantiles(codes, y, w, np.asarray(q, dtype=float))
+
+
+def test_quantile_zero_stays_in_its_group():
+    codes, y = [0, 0, 0, 1, 1, 1], [1, 2, 3, 100, 200, 300]
+    assert quantiles(codes, y, [0, 0]).tolist() == [1, 100]
+    assert quantiles(codes, y, [1, 1]).tolist() == [3, 300]
+    assert quantiles(codes, y, [0.5, 0.5]).tolist() == [2, 200]
+
+
+def test_single_row_groups():
+    codes, y = [0, 1, 2, 2], [5, 7, 1, 9]
+    for q in (0, 0.5, 1):
+        got = quantiles(codes, y, [q] * 3)
+        assert got[:2].tolist() == [5, 7]
+    assert quantiles(codes, y, [0, 0, 0]).tolist() == [5, 7, 1]
+    assert quantiles(codes, y, [1, 1, 1]).tolist() == [5, 7, 9]
+
+
+def test_unsorted_input_and_weights():
+    codes, y, w = [1, 0, 1, 0, 1], [30, 2, 10, 1, 20], [1, 1, 1, 1, 2]
+    # group 1 sorted: 10 (w 1), 20 (w 2), 30 (w 1); shares .25, .75, 1
+    assert quantiles(codes, y, [0.5, 0.5], w).tolist() == [1.5, 20]
+
+
+def test_median_standard_errors_are_not_negative():
+    sample = sampling.reservoir_sample([data.load_booking()], per_stratum=3)
+    table = sampling.domain_median(sample, "price_eur", by="location")
+    assert (table["se"].dropna() >= 0).all()
+
+
+def test_saved_sample_is_redrawn_when_the_data_changes(tmp_path, monkeypatch):
+    for name in ("booking_cleaned.csv", "tripadvisor_cleaned.csv"):
+        frame = pd.read_csv(os.path.join(paths.CLEANED_DIR, name))
+        frame.head(500).to_csv(tmp_path / name, index=False)
+    monkeypatch.setattr(paths, "BOOKING_CLEANED", str(tmp_path / "booking_cleaned.csv"))
+    monkeypatch.setattr(paths, "TRIPADVISOR_CLEANED", str(tmp_path / "tripadvisor_cleaned.csv"))
+    monkeypatch.setattr(paths, "TABLES_DIR", str(tmp_path / "tables"))
+    monkeypatch.setattr(sampling, "SAMPLE_FILES", {k: str(tmp_path / "tables" / os.path.basename(v))
+                                                   for k, v in sampling.SAMPLE_FILES.items()})
+    monkeypatch.setattr(sampling, "SAMPLE_SOURCE", str(tmp_path / "tables" / "sample_source.json"))
+
+    booking, _ = sampling.draw(per_stratum=2, seed=1)
+    assert sampling.load_sample()[0].equals(booking)
+
+    frame = pd.read_csv(tmp_path / "booking_cleaned.csv")
+    frame.head(100).to_csv(tmp_path / "booking_cleaned.csv", index=False)
+    redrawn, _ = sampling.load_sample()
+    assert redrawn["weight"].sum() == pytest.approx(100)  # weights sum to the population
+    with open(sampling.SAMPLE_SOURCE) as f:
+        assert json.load(f)["per_stratum"] == 2
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from hotel_analysis import data, sqlbackend, stats
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("sql") / "hotels.sqlite")
+    sqlbackend.load(path)
+    database = sqlbackend.Database(path)
+    yield database
+    database.close()
+
+
+def test_correlations_match_stats(db):
+    booking = data.load_booking()
+    for method in ("pearson", "spearman"):
+        r, p = getattr(db, method)("booking", "price_eur", "rating")
+        expected = getattr(stats, method)(booking["price_eur"], booking["rating"])
+        assert r == pytest.approx(expected[0], abs=1e-12)
+        assert p == pytest.approx(expected[1], rel=1e-6)
+
+
+def test_constant_column_has_no_correlation(db):
+    for method in ("pearson", "spearman"):
+        r, p = getattr(db, method)("booking", "price_eur", "rating", where="price_eur = 0 - 1")
+        assert np.isnan(r) and np.isnan(p)
+    r, p = db.pearson("booking", "2.5", "rating")  # every row, one value
+    assert np.isnan(r) and np.isnan(p)
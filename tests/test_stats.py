@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy import stats as scipy_stats
+
+from hotel_analysis import stats
+
+
+@pytest.mark.parametrize("n", [3, 4, 10, 50, 1000])
+@pytest.mark.parametrize("rho", [-0.99, -0.5, 0.0, 0.2, 0.9])
+def test_correlations_match_scipy(n, rho):
+    rng = np.random.default_rng(n)
+    x = rng.normal(size=n)
+    y = rho * x + np.sqrt(1 - rho ** 2) * rng.normal(size=n)
+    y[::3] = np.round(y[::3], 1)  # some ties for the ranks
+    for ours, theirs in ((stats.pearson, scipy_stats.pearsonr), (stats.spearman, scipy_stats.spearmanr)):
+        r, p = ours(x, y)
+        expected = theirs(x, y)
+        assert r == pytest.approx(expected[0], abs=1e-12)
+        # |r| within rounding of 1 gives 1 - r^2 = 0 here, a p-value of 1e-60 or so in scipy
+        assert p == pytest.approx(expected[1], rel=1e-9, abs=1e-15)
+
+
+@pytest.mark.parametrize("n", [3, 5, 30, 500, 100_000])
+@pytest.mark.parametrize("r", [0.0, 0.01, 0.3, 0.7, 0.95, 0.9999, 1.0])
+def test_pvalue_matches_scipy_t_test(n, r):
+    df = n - 2
+    with np.errstate(divide="ignore"):
+        t = r * np.sqrt(df / (1 - r * r)) if r < 1 else np.inf
+    expected = 2 * scipy_stats.t.sf(abs(t), df)
+    assert stats._pvalue(r, n) == pytest.approx(expected, rel=1e-9, abs=1e-300)
+    assert stats._pvalue(-r, n) == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+
+@pytest.mark.parametrize("a, b, x", [(0.5, 0.5, 0.3), (2, 0.5, 0.99), (250, 0.5, 0.5), (1, 1, 0.7), (40, 3, 0.95)])
+def test_betainc_matches_scipy(a, b, x):
+    from scipy import special
+
+    assert stats.betainc(a, b, x) == pytest.approx(special.betainc(a, b, x), rel=1e-10)
+
+
+def test_constant_column_has_no_correlation():
+    x = np.arange(10.0)
+    for fn in (stats.pearson, stats.spearman):
+        r, p = fn(x, np.full(10, 4.0))
+        assert np.isnan(r) and np.isnan(p)
+        r, p = fn(np.zeros(0), np.zeros(0))
+        assert np.isnan(r) and np.isnan(p)
+    with np.errstate(invalid="ignore"):
+        r, p = stats.pearson(np.array([1.0, np.inf, 2.0]), np.array([1.0, 2.0, 3.0]))
+    assert np.isnan(r)
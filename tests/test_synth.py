@@ -0,0 +1,24 @@
+import re
+
+from hotel_analysis import cleaning, paths, synth
+
+
+def shapes(column):
+    return set(column.map(lambda text: re.sub(r"\d+", "9", text)))
+
+
+def test_price_cells_keep_their_formats(tmp_path):
+    booking_path, tripadvisor_path = synth.generate(str(tmp_path), rows=3000, chunk_rows=1000)
+    for path, sample, column in ((booking_path, paths.BOOKING_RAW, -1), (tripadvisor_path, paths.TRIPADVISOR_RAW, 1)):
+        price = synth.read_sample(path).iloc[:, column]
+        assert shapes(price) <= shapes(synth.read_sample(sample).iloc[:, column])
+    deals = synth.read_sample(tripadvisor_path).iloc[:, 1]
+    assert deals.str.fullmatch(r"View all \d deals").any()
+    assert not deals.str.fullmatch(r"\xa0\d").any()
+
+
+def test_synthetic_files_clean(tmp_path):
+    synth.generate(str(tmp_path / "raw"), rows=2000)
+    booking, tripadvisor = cleaning.run(raw_dir=str(tmp_path / "raw"), cleaned_dir=str(tmp_path / "cleaned"))
+    assert len(booking) > 1500
+    assert tripadvisor.attrs["dropped"]["without an amount"] > 0
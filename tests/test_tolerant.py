@@ -0,0 +1,86 @@
+import functools
+import gzip
+
+import pytest
+
+from hotel_analysis import tolerant
+
+ROWS = [
+    "name,price,comment",
+    "A,10,good",
+    "B,20,nice, clean, quiet",  # unquoted commas in the free-text field
+    'C,30,"multi\nline"',  # a quoted line break inside a comment
+    'D,40,"broken quote',  # never closed
+    "E,50,fine",
+    "F,60",  # too short
+    "G,70,ok",
+]
+EXPECTED = [
+    ("A", 10, "good"),
+    ("B", 20, "nice, clean, quiet"),
+    ("C", 30, "multi\nline"),
+    ("D", 40, "broken quote"),
+    ("E", 50, "fine"),
+    ("G", 70, "ok"),
+]
+COUNTS = {"rows": 6, "quote_repairs": 1, "merged_fields": 1, "quarantined": 1, "blank": 0}
+
+
+def _write(path, terminator, rows=ROWS):
+    with open(path, "w", encoding="latin1", newline="") as f:
+        f.write(terminator.join(rows) + terminator)
+    return str(path)
+
+
+def _records(frame):
+    return list(frame.itertuples(index=False, name=None))
+
+
+@pytest.mark.parametrize("terminator, bad_line", [("\n", 8), ("\r\n", 7)])
+def test_repairs_and_quarantines(tmp_path, terminator, bad_line):
+    path = _write(tmp_path / "rooms.csv", terminator)
+    quarantine = tmp_path / "quarantine.csv"
+    frame, counts = tolerant.read_csv(path, quarantine=str(quarantine))
+    assert _records(frame) == EXPECTED
+    assert counts == COUNTS
+    assert frame.attrs["read_counts"] == COUNTS
+    # A CRLF file numbers its records, not the bare LFs inside comments
+    assert quarantine.read_text().splitlines()[1:] == [f'{bad_line},2 of 3 fields,"F,60"']
+
+
+@pytest.mark.parametrize("terminator", ["\n", "\r\n"])
+def test_quote_closes_before_the_next_records(tmp_path, terminator):
+    rows = ["name,price,comment", 'A,10,"open', "B,20,x", "C,30,y", "D,40,z"]
+    frame, counts = tolerant.read_csv(_write(tmp_path / "rooms.csv", terminator, rows))
+    assert _records(frame) == [("A", 10, "open"), ("B", 20, "x"), ("C", 30, "y"), ("D", 40, "z")]
+    assert counts["quote_repairs"] == 1 and counts["quarantined"] == 0
+
+
+@pytest.mark.parametrize("size", [1, 5, 7, 12, 30])
+@pytest.mark.parametrize("terminator", ["\n", "\r\n"])
+def test_records_split_across_blocks(tmp_path, monkeypatch, terminator, size):
+    monkeypatch.setattr(tolerant, "_blocks", functools.partial(tolerant._blocks, size=size))
+    quarantine = tmp_path / "quarantine.csv"
+    frame, counts = tolerant.read_csv(_write(tmp_path / "rooms.csv", terminator), quarantine=str(quarantine))
+    assert _records(frame) == EXPECTED
+    assert counts == COUNTS
+    assert quarantine.read_text().splitlines()[1][0] == ("8" if terminator == "\n" else "7")
+
+
+def test_clean_file_removes_old_quarantine(tmp_path):
+    quarantine = tmp_path / "quarantine.csv"
+    quarantine.write_text("stale")
+    rows = ["name,price,comment", "A,10,good", "", "B,,fine"]
+    frame, counts = tolerant.read_csv(_write(tmp_path / "rooms.csv", "\n", rows), quarantine=str(quarantine))
+    assert not quarantine.exists()
+    assert counts == {"rows": 2, "quote_repairs": 0, "merged_fields": 0, "quarantined": 0, "blank": 1}
+    assert frame["price"].isna().tolist() == [False, True]
+
+
+def test_reads_compressed_files(tmp_path):
+    path = tmp_path / "rooms.csv.gz"
+    with gzip.open(path, "wt", encoding="latin1", newline="") as f:
+        f.write("\r\n".join(ROWS) + "\r\n")
+    frame, counts = tolerant.read_csv(str(path))
+    assert _records(frame) == EXPECTED
+    assert counts == COUNTS
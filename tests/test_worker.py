@@ -0,0 +1,107 @@
+import os
+import shutil
+import threading
+
+import pytest
+
+import pandas as pd
+
+from hotel_analysis import cleaning, clusters, paths, worker
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    """The raw and cleaned CSVs copied to ``tmp_path`` and watched there."""
+    watched = {}
+    for dataset, (raw, cleaned) in worker.WATCHED.items():
+        watched[dataset] = (shutil.copy(raw, str(tmp_path)), shutil.copy(cleaned, str(tmp_path)))
+    monkeypatch.setattr(worker, "WATCHED", watched)
+    return watched
+
+
+def touch(path, bump):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+def test_failed_clean_is_retried(files, monkeypatch):
+    w = worker.Worker(out_dir=paths.CHARTS_DIR, render_on_change=False)
+    raw = files[worker.BOOKING][0]
+    before = dict(w.mtimes)
+    touch(raw, 10**9)
+
+    clean_booking = cleaning.clean_booking
+
+    def half_written(frame):
+        raise ValueError("truncated row")
+
+    monkeypatch.setattr(cleaning, "clean_booking", half_written)
+    with pytest.raises(ValueError):
+        w.poll()
+    assert w.mtimes == before
+    assert w.versions[worker.BOOKING] == 1
+
+    monkeypatch.setattr(cleaning, "clean_booking", clean_booking)
+    assert w.poll() == {worker.BOOKING}
+    assert w.versions[worker.BOOKING] == 2
+
+
+def test_stale_compressed_variant_is_removed(files):
+    w = worker.Worker(out_dir=paths.CHARTS_DIR, render_on_change=False)
+    raw, cleaned = files[worker.BOOKING]
+    stale = cleaned + ".gz"
+    with open(stale, "wb") as f:
+        f.write(b"stale")
+    w._clean(worker.BOOKING)
+    assert not os.path.exists(stale)
+
+
+def test_saved_clusters_are_refitted(files, tmp_path, monkeypatch):
+    monkeypatch.setattr(clusters, "LOCATION_CLUSTERS_CSV", str(tmp_path / "locations.csv"))
+    monkeypatch.setattr(clusters, "LOCATION_CLUSTERS_SOURCE", str(tmp_path / "source.json"))
+    cleaned = files[worker.BOOKING][1]
+    clusters.run(clusters.chunked(cleaned), location_path=clusters.LOCATION_CLUSTERS_CSV, source=cleaned,
+                 source_path=clusters.LOCATION_CLUSTERS_SOURCE)
+    w = worker.Worker(out_dir=paths.CHARTS_DIR, render_on_change=False)
+
+    pd.read_csv(cleaned).head(500).to_csv(cleaned, index=False)
+    touch(cleaned, 10**9)
+    assert w.poll() == {worker.BOOKING}
+    saved = pd.read_csv(clusters.LOCATION_CLUSTERS_CSV)
+    assert saved["hotels"].sum() == 500
+    assert clusters._saved_labels(clusters.LOCATION_CLUSTERS_CSV, clusters.LOCATION_CLUSTERS_SOURCE, cleaned)
+
+
+def test_watch_survives_errors(monkeypatch):
+    stop = threading.Event()
+    calls = []
+
+    def poll(self):
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("raw file vanished")
+        stop.set()
+        return set()
+
+    monkeypatch.setattr(worker.Worker, "poll", poll)
+    thread = threading.Thread(target=worker.Worker.watch, args=(object.__new__(worker.Worker), 0.01, stop))
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert len(calls) == 2
+
+
+def test_handler_reports_errors():
+    class Server:
+        class worker:
+            @staticmethod
+            def handle(request):
+                raise RuntimeError("boom")
+
+    handler = object.__new__(worker._Handler)
+    handler.server = Server
+    handler.rfile = [b'{"cmd": "status"}\n']
+    out = []
+    handler.wfile = type("W", (), {"write": lambda self, data: out.append(data)})()
+    handler.handle()
+    assert b'"ok": false' in out[0] and b"boom" in out[0]